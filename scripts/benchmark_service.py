@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Load test for the service layer against the local Alpha Vantage stand-in.
+
+Simulates many sessions requesting the same symbols concurrently and reports
+wall time plus cache, coalescing and HTTP client statistics.
+
+Usage:
+    python scripts/benchmark_service.py --sessions 50 --latency 0.2
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src import config  # noqa: E402
+from src.services import api_service, http_client, market_cache, rate_limiter, single_flight  # noqa: E402
+from src.services import stub_server  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the service layer offline")
+    parser.add_argument("--sessions", type=int, default=50, help="Concurrent simulated sessions")
+    parser.add_argument("--rounds", type=int, default=3, help="Requests per session")
+    parser.add_argument("--symbols", default="IBM,AAPL,MSFT", help="Comma-separated symbols")
+    parser.add_argument("--interval", default="5min")
+    parser.add_argument("--latency", type=float, default=0.2, help="Stand-in latency in seconds")
+    args = parser.parse_args()
+
+    server = stub_server.start_server(latency=args.latency)
+    config.ALPHA_VANTAGE_BASE_URL = server.base_url
+    config.BAR_STORE_ENABLED = False
+    # The stand-in has no quota
+    config.ALPHA_VANTAGE_REQUESTS_PER_MINUTE = 1e6
+    config.RATE_LIMIT_BURST = 1000
+    rate_limiter.reset()
+
+    symbols = args.symbols.split(",")
+    jobs = [symbols[i % len(symbols)] for i in range(args.sessions * args.rounds)]
+
+    print(f"🚀 {len(jobs)} requests from {args.sessions} sessions against {server.base_url}")
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sessions) as executor:
+        list(executor.map(lambda symbol: api_service.get_intraday_frame(symbol, args.interval), jobs))
+    elapsed = time.perf_counter() - started
+
+    print(f"  ⏱️  wall time: {elapsed:.2f}s")
+    print(f"  🌐 upstream requests: {server.request_count}")
+    print(f"  🗄️  cache: {market_cache.get_stats()}")
+    print(f"  🔀 single-flight: {single_flight.get_stats()}")
+    print(f"  🔌 http: {http_client.get_stats()}")
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
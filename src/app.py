@@ -2,8 +2,8 @@
 
 import streamlit as st
 from src import config
-from src.services import api_service
-from src.core import data_processor, technical_indicators
+from src.services import api_service, providers
+from src.core import data_processor, panel, technical_indicators, time_window
 from src.ui import charts
 from src.ui import components as ui_components
 from src.managers import watchlist_manager, refresh_manager
@@ -20,10 +20,6 @@ st.set_page_config(
 ui_components.apply_custom_css()
 ui_components.add_smooth_transitions()
 
-# Initialize session state for caching
-if 'cached_data' not in st.session_state:
-    st.session_state.cached_data = {}
-
 # Initialize previous price for change detection
 if 'previous_price' not in st.session_state:
     st.session_state.previous_price = {}
@@ -80,6 +76,9 @@ with st.sidebar:
     # Interval selector
     selected_interval = ui_components.render_interval_selector()
     
+    # Visible window selector
+    selected_window = ui_components.render_window_selector()
+    
     st.markdown("---")
     
     # Watchlist Section
@@ -198,28 +197,16 @@ with st.sidebar:
     st.markdown("This dashboard provides real-time stock market analytics powered by Alpha Vantage API.")
     st.caption("⚠️ **For educational purposes only. Not financial advice.**")
 
-# Create cache key
-cache_key = f"{selected_symbol}_{selected_interval}"
-
 # Main content
 try:
-    # Check if data is cached
-    if cache_key not in st.session_state.cached_data:
-        with st.spinner(f"Loading data for {selected_symbol}..."):
-            # Fetch data from API (returns tuple: response, is_demo)
-            response, is_demo = api_service.fetch_intraday_data(selected_symbol, selected_interval)
-            df = api_service.parse_time_series(response, selected_symbol, selected_interval)
-            
-            if df.empty:
-                st.error("No data available for the selected stock and interval.")
-                st.stop()
-            
-            # Cache the data and demo flag
-            st.session_state.cached_data[cache_key] = df
-            st.session_state[f"{cache_key}_is_demo"] = is_demo
-    else:
-        df = st.session_state.cached_data[cache_key]
-        is_demo = st.session_state.get(f"{cache_key}_is_demo", False)
+    # Frames come from the process-wide cache shared by all sessions; an expired
+    # frame is served as-is while it is refreshed in the background
+    with st.spinner(f"Loading data for {selected_symbol}..."):
+        df, is_demo = api_service.get_intraday_frame(selected_symbol, selected_interval, allow_stale=True)
+    
+    if df.empty:
+        st.error("No data available for the selected stock and interval.")
+        st.stop()
     
     # Show demo data warning if applicable
     if is_demo:
@@ -233,9 +220,15 @@ try:
         """)
     
     
-    # Calculate metrics
-    metrics = data_processor.calculate_metrics(df)
-    trends = data_processor.calculate_trends(df)
+    # Charts and metrics cover the visible window; indicators also read the
+    # warm-up bars before it. Both are views of the shared frame.
+    history, warmup_rows = time_window.with_warmup(df, selected_window)
+    visible = history.iloc[warmup_rows:]
+    
+    # Price metrics cover the visible window; the moving averages and volatility
+    # also read the warm-up bars so narrow windows still have full lookbacks
+    metrics = data_processor.calculate_metrics(visible)
+    trends = data_processor.calculate_trends(history)
     
     # Price change detection and highlighting
     current_price = metrics.get('current_price', 0)
@@ -303,7 +296,7 @@ try:
     
     # Calculate all technical indicators
     current_price = metrics.get('current_price', 0)
-    indicators = technical_indicators.calculate_all_indicators(df, current_price)
+    indicators = technical_indicators.calculate_all_indicators(history, current_price)
     
     # Display indicators in columns
     col_ind1, col_ind2, col_ind3, col_ind4 = st.columns(4)
@@ -375,21 +368,21 @@ try:
     st.markdown("### Price Analysis")
     
     # Candlestick chart (full width)
-    candlestick_fig = charts.create_candlestick_chart(df)
+    candlestick_fig = charts.create_candlestick_chart(visible)
     st.plotly_chart(candlestick_fig, use_container_width=True)
     
     # Price trend chart (full width)
-    price_fig = charts.create_price_chart(df)
+    price_fig = charts.create_price_chart(visible)
     st.plotly_chart(price_fig, use_container_width=True)
     
     # Price with Bollinger Bands
-    bb_data = technical_indicators.calculate_bollinger_bands(df)
-    bb_fig = charts.create_price_chart_with_bb(df, bb_data)
+    bb_data = time_window.trim(technical_indicators.calculate_bollinger_bands(history), warmup_rows)
+    bb_fig = charts.create_price_chart_with_bb(visible, bb_data)
     st.plotly_chart(bb_fig, use_container_width=True)
     
     # Price with Moving Averages
-    ma_data = technical_indicators.calculate_moving_averages(df)
-    ma_fig = charts.create_price_chart_with_ma(df, ma_data)
+    ma_data = time_window.trim(technical_indicators.calculate_moving_averages(history), warmup_rows)
+    ma_fig = charts.create_price_chart_with_ma(visible, ma_data)
     st.plotly_chart(ma_fig, use_container_width=True)
     
     st.markdown("### Technical Indicator Charts")
@@ -398,13 +391,13 @@ try:
     col_ind_chart1, col_ind_chart2 = st.columns(2)
     
     with col_ind_chart1:
-        rsi_series = technical_indicators.calculate_rsi(df)
-        rsi_fig = charts.create_rsi_chart(df, rsi_series)
+        rsi_series = technical_indicators.calculate_rsi(history).iloc[warmup_rows:]
+        rsi_fig = charts.create_rsi_chart(visible, rsi_series)
         st.plotly_chart(rsi_fig, use_container_width=True)
     
     with col_ind_chart2:
-        macd_data = technical_indicators.calculate_macd(df)
-        macd_fig = charts.create_macd_chart(df, macd_data)
+        macd_data = time_window.trim(technical_indicators.calculate_macd(history), warmup_rows)
+        macd_fig = charts.create_macd_chart(visible, macd_data)
         st.plotly_chart(macd_fig, use_container_width=True)
     
     st.markdown("### Volume & Distribution")
@@ -413,18 +406,38 @@ try:
     col_chart1, col_chart2 = st.columns(2)
     
     with col_chart1:
-        volume_fig = charts.create_volume_chart(df)
+        volume_fig = charts.create_volume_chart(visible)
         st.plotly_chart(volume_fig, use_container_width=True)
     
     with col_chart2:
-        pie_data = data_processor.prepare_chart_data(df, 'pie')
+        pie_data = data_processor.prepare_chart_data(visible, 'pie')
         pie_fig = charts.create_pie_chart(pie_data)
         st.plotly_chart(pie_fig, use_container_width=True)
     
     # Footer
     st.markdown("---")
     st.markdown(f"*Last updated: {metrics.get('last_updated', 'N/A')}*")
-    st.markdown("*Data provided by Alpha Vantage*")
+    st.markdown(f"*Data provided by {providers.get_provider().label}*")
+    
+    # Warm the shared cache for the rest of the watchlist in the background;
+    # the overview shows whatever is already cached without waiting on fetches
+    other_symbols = [symbol for symbol in watchlist_manager.get_watchlist() if symbol != selected_symbol]
+    if other_symbols:
+        results = api_service.warm_many(other_symbols, selected_interval)
+        
+        # Summarize the whole watchlist with one vectorized pass over a panel
+        frames = {selected_symbol: df} if watchlist_manager.is_in_watchlist(selected_symbol) else {}
+        frames.update({symbol: result['df'] for symbol, result in results.items()})
+        watch_panel = panel.Panel.from_frames(frames)
+        if len(watch_panel):
+            overview = data_processor.calculate_summary_panel(watch_panel).join(
+                technical_indicators.calculate_all_indicators_panel(watch_panel)[['rsi', 'overall_signal']]
+            )
+            with st.expander("📋 Watchlist Overview"):
+                st.dataframe(
+                    overview[['current_price', 'price_change_percent', 'trend', 'rsi', 'overall_signal']],
+                    use_container_width=True
+                )
 
 except ValueError as e:
     st.error(f"Error: {str(e)}")
@@ -5,7 +5,71 @@ import os
 # API Configuration
 # Read from environment variable with fallback to default for local development
 ALPHA_VANTAGE_API_KEY = os.environ.get("ALPHA_VANTAGE_API_KEY", "WRFGZ4UZVE8OOV1A")
-ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
+# Point at a local stand-in (src/services/stub_server.py) for offline benchmarks
+ALPHA_VANTAGE_BASE_URL = os.environ.get("ALPHA_VANTAGE_BASE_URL", "https://www.alphavantage.co/query")
+
+# Market Data Provider
+# 'alpha_vantage' (live API), 'demo' (simulated only), 'simulated' (demo series that
+# grow over time), 'record' (live API, saving each response under RECORDINGS_DIR)
+# or 'replay' (serve saved responses offline)
+MARKET_DATA_PROVIDER = os.environ.get("MARKET_DATA_PROVIDER", "alpha_vantage")
+RECORDINGS_DIR = os.environ.get("RECORDINGS_DIR", os.path.join("data", "recordings"))
+# Simulated seconds per real second for the 'simulated' provider (60 = one 1-min bar per second)
+SIMULATOR_SPEED = float(os.environ.get("SIMULATOR_SPEED", 1.0))
+
+# HTTP Client Configuration
+# Pooled keep-alive session with exponential backoff on 5xx responses and timeouts
+HTTP_POOL_SIZE = int(os.environ.get("HTTP_POOL_SIZE", 10))
+HTTP_TIMEOUT = float(os.environ.get("HTTP_TIMEOUT", 10))
+HTTP_MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", 3))
+HTTP_BACKOFF_BASE = float(os.environ.get("HTTP_BACKOFF_BASE", 0.5))  # seconds
+HTTP_BACKOFF_MAX = float(os.environ.get("HTTP_BACKOFF_MAX", 8.0))  # seconds
+
+# Rate Limiter Configuration
+# Process-wide token bucket sized to the API key's per-minute quota
+ALPHA_VANTAGE_REQUESTS_PER_MINUTE = float(os.environ.get("ALPHA_VANTAGE_REQUESTS_PER_MINUTE", 5))
+RATE_LIMIT_BURST = int(os.environ.get("RATE_LIMIT_BURST", 5))
+RATE_LIMIT_INTERACTIVE_WAIT = 15.0  # seconds a viewed symbol may queue for a token
+RATE_LIMIT_BACKGROUND_WAIT = 0.0  # background refreshes are deferred instead of queued
+RATE_LIMIT_BATCH_WAIT = 300.0  # batch jobs (e.g., backfills) queue for a token instead of deferring
+RATE_LIMIT_BACKGROUND_RESERVE = 1  # tokens background work leaves for interactive requests
+
+# Circuit Breaker Configuration
+# Consecutive upstream failures that open the circuit, and seconds before a half-open probe
+CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("CIRCUIT_FAILURE_THRESHOLD", 3))
+CIRCUIT_RESET_TIMEOUT = float(os.environ.get("CIRCUIT_RESET_TIMEOUT", 30))
+
+# Symbols the API reported as invalid are not requested again for this many seconds
+NEGATIVE_CACHE_TTL = int(os.environ.get("NEGATIVE_CACHE_TTL", 300))
+
+# Wire Format
+# 'json' or 'csv'; CSV bodies are smaller and cheaper to parse
+ALPHA_VANTAGE_DATATYPE = os.environ.get("ALPHA_VANTAGE_DATATYPE", "json").lower()
+
+# Streaming Ingestion
+# Parse full-history responses chunk by chunk instead of materializing the JSON
+STREAMING_INGESTION = os.environ.get("STREAMING_INGESTION", "false").lower() == "true"
+
+# Bar Store Configuration
+# Parsed bars are persisted here so restarts serve charts from disk
+BAR_STORE_ENABLED = os.environ.get("BAR_STORE_ENABLED", "true").lower() == "true"
+BAR_STORE_DIR = os.environ.get("BAR_STORE_DIR", os.path.join("data", "bars"))
+
+# Backfill Configuration
+# Worker threads used to download month slices of intraday history
+BACKFILL_WORKERS = int(os.environ.get("BACKFILL_WORKERS", 4))
+
+# Background Refresh Configuration
+# Threads that re-fetch stale frames while sessions keep serving the cached copy
+BACKGROUND_REFRESH_WORKERS = int(os.environ.get("BACKGROUND_REFRESH_WORKERS", 2))
+
+# Batch Fetch Configuration
+# Worker threads used to load several symbols at once (e.g., the watchlist)
+FETCH_MANY_WORKERS = int(os.environ.get("FETCH_MANY_WORKERS", 4))
+
+# Demo Data
+# Pin the end of generated demo series (e.g., "2024-01-05 16:00") for reproducible runs
+DEMO_DATA_ANCHOR = os.environ.get("DEMO_DATA_ANCHOR")
 
 # Supported Stock Symbols
 SUPPORTED_SYMBOLS = ["IBM", "AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "META"]
@@ -13,6 +77,25 @@ SUPPORTED_SYMBOLS = ["IBM", "AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "META"]
 # Time Intervals
 TIME_INTERVALS = ["1min", "5min", "15min", "30min", "60min"]
 
+# Bar length in minutes for each supported interval
+INTERVAL_MINUTES = {"1min": 1, "5min": 5, "15min": 15, "30min": 30, "60min": 60}
+
+# Visible Chart Windows
+# Label -> window name for src.core.time_window ("all" shows the whole frame)
+CHART_WINDOWS = {"All": "all", "Last hour": "1h", "Last 4 hours": "4h", "Last day": "1d", "Last 5 days": "5d"}
+
+# Local Resampling
+# Derive coarser intervals from cached 1-min bars instead of separate API calls;
+# RESAMPLED_INTERVALS are extra choices only available this way
+LOCAL_RESAMPLING = os.environ.get("LOCAL_RESAMPLING", "false").lower() == "true"
+RESAMPLED_INTERVALS = ["2h", "daily"]
+
+# Shared Market Data Cache
+# Upper bound on the memory held by parsed frames across all sessions
+MARKET_CACHE_MAX_BYTES = int(os.environ.get("MARKET_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+# Store cached frames with float32 prices and uint32 volume (about half the memory)
+COMPACT_FRAMES = os.environ.get("COMPACT_FRAMES", "false").lower() == "true"
+
 # Server Configuration
 PORT = 8080
 
@@ -1,7 +1,10 @@
 # Data processing module for stock market analytics
 
+import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Dict, Tuple
+from src.core import session_index
+from src.core import panel
 
 
 def calculate_metrics(df: pd.DataFrame) -> Dict:
@@ -14,28 +17,7 @@ def calculate_metrics(df: pd.DataFrame) -> Dict:
     Returns:
         Dictionary containing calculated metrics
     """
-    if df.empty:
-        return {}
-    
-    latest = df.iloc[-1]
-    first = df.iloc[0]
-    
-    current_price = latest['close']
-    price_change = current_price - first['open']
-    price_change_percent = (price_change / first['open']) * 100
-    
-    metrics = {
-        'current_price': round(current_price, 2),
-        'price_change': round(price_change, 2),
-        'price_change_percent': round(price_change_percent, 2),
-        'high': round(df['high'].max(), 2),
-        'low': round(df['low'].min(), 2),
-        'total_volume': int(df['volume'].sum()),
-        'average_volume': int(df['volume'].mean()),
-        'last_updated': df.index[-1]
-    }
-    
-    return metrics
+    return calculate_summary(df)[0]
 
 
 def prepare_chart_data(df: pd.DataFrame, chart_type: str) -> Dict:
@@ -68,11 +50,11 @@ def prepare_chart_data(df: pd.DataFrame, chart_type: str) -> Dict:
         }
     
     elif chart_type == 'pie':
-        # Calculate distribution by trading session
-        total_volume = df['volume'].sum()
-        morning = df.between_time('09:30', '12:00')['volume'].sum() if not df.empty else 0
-        afternoon = df.between_time('12:00', '16:00')['volume'].sum() if not df.empty else 0
-        extended = total_volume - morning - afternoon
+        # Calculate distribution by trading session in one pass over the session labels
+        totals = session_index.session_totals(df, 'volume')
+        morning = totals[session_index.MORNING]
+        afternoon = totals[session_index.AFTERNOON]
+        extended = totals[session_index.PRE_MARKET] + totals[session_index.AFTER_HOURS]
         
         return {
             'labels': ['Morning (9:30-12:00)', 'Afternoon (12:00-16:00)', 'Extended Hours'],
@@ -85,6 +67,7 @@ def prepare_chart_data(df: pd.DataFrame, chart_type: str) -> Dict:
 def calculate_trends(df: pd.DataFrame) -> Dict:
     """
     Calculate trend indicators and moving averages.
+    The input frame is not modified.
     
     Args:
         df: DataFrame with stock data
@@ -92,18 +75,53 @@ def calculate_trends(df: pd.DataFrame) -> Dict:
     Returns:
         Dictionary with trend indicators
     """
-    if df.empty or len(df) < 2:
-        return {}
+    return calculate_summary(df)[1]
+
+
+def calculate_summary(df: pd.DataFrame) -> Tuple[Dict, Dict]:
+    """
+    Calculate the key metrics and trend indicators together.
+    Each column is read once as a NumPy array; moving averages are computed
+    for the last window only instead of as full rolling series.
     
-    # Calculate moving averages
-    df['ma_5'] = df['close'].rolling(window=5).mean()
-    df['ma_20'] = df['close'].rolling(window=20).mean()
+    Args:
+        df: DataFrame with stock data (not modified)
+        
+    Returns:
+        Tuple of (metrics dict, trends dict), empty when there is too little data
+    """
+    if df.empty:
+        return {}, {}
     
-    # Determine trend direction
-    latest_price = df['close'].iloc[-1]
-    ma_5_latest = df['ma_5'].iloc[-1] if not pd.isna(df['ma_5'].iloc[-1]) else latest_price
-    ma_20_latest = df['ma_20'].iloc[-1] if not pd.isna(df['ma_20'].iloc[-1]) else latest_price
+    # Compact frames hold float32 prices; the rolling means and std need float64
+    close = df['close'].to_numpy(dtype=np.float64)
+    volume = df['volume'].to_numpy()
+    first_open = float(df['open'].iat[0])
+    
+    current_price = close[-1]
+    price_change = current_price - first_open
+    price_change_percent = (price_change / first_open) * 100
     
+    metrics = {
+        'current_price': round(current_price, 2),
+        'price_change': round(price_change, 2),
+        'price_change_percent': round(price_change_percent, 2),
+        'high': round(float(df['high'].to_numpy().max()), 2),
+        'low': round(float(df['low'].to_numpy().min()), 2),
+        'total_volume': int(volume.sum()),
+        'average_volume': int(volume.mean()),
+        'last_updated': df.index[-1]
+    }
+    
+    if len(close) < 2:
+        return metrics, {}
+    
+    # Moving averages at the latest bar (the latest price until a full window exists)
+    latest_price = current_price
+    ma_5_latest = _last_window_mean(close, 5, latest_price)
+    ma_20_latest = _last_window_mean(close, 20, latest_price)
+    
+    # Determine trend direction
     trend = "Neutral"
     if latest_price > ma_5_latest > ma_20_latest:
         trend = "Strong Upward"
@@ -114,9 +132,91 @@ def calculate_trends(df: pd.DataFrame) -> Dict:
     elif latest_price < ma_5_latest:
         trend = "Downward"
     
-    return {
+    trends = {
         'trend': trend,
         'ma_5': round(ma_5_latest, 2) if not pd.isna(ma_5_latest) else None,
         'ma_20': round(ma_20_latest, 2) if not pd.isna(ma_20_latest) else None,
-        'volatility': round(df['close'].std(), 2)
+        'volatility': round(np.std(close, ddof=1), 2)
     }
+    
+    return metrics, trends
+
+
+def _last_window_mean(values: np.ndarray, window: int, default: float) -> float:
+    """Mean of the last `window` values, matching rolling(window).mean().iloc[-1]."""
+    if len(values) < window:
+        return default
+    mean = values[-window:].mean()
+    return default if np.isnan(mean) else mean
+
+
+def calculate_summary_panel(bars: panel.Panel) -> pd.DataFrame:
+    """
+    Calculate the key metrics and trend indicators of every symbol of a panel
+    in one vectorized pass, with the same values as calculate_summary.
+    
+    Args:
+        bars: Panel with stock data
+        
+    Returns:
+        DataFrame indexed by symbol with the metrics and trends keys as
+        columns; trend columns are missing values for symbols with fewer
+        than two bars
+    """
+    columns = ['current_price', 'price_change', 'price_change_percent', 'high', 'low',
+               'total_volume', 'average_volume', 'last_updated', 'trend', 'ma_5', 'ma_20', 'volatility']
+    if not len(bars) or not len(bars.index):
+        return pd.DataFrame(columns=columns, index=pd.Index(bars.symbols, name='symbol'))
+    
+    close = bars.field('close')
+    volume = bars.field('volume')
+    rows = bars.last_rows()
+    counts = bars.bar_counts()
+    
+    current_price = panel.at_rows(close, rows)
+    first_open = panel.at_rows(bars.field('open'), bars.first_rows())
+    price_change = current_price - first_open
+    total_volume = np.nansum(volume, axis=0)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        price_change_percent = (price_change / first_open) * 100
+        mean_close = np.nansum(close, axis=0) / counts
+        volatility = np.sqrt(np.nansum((close - mean_close) ** 2, axis=0) / (counts - 1))
+        average_volume = np.floor(total_volume / counts)
+    
+    # Averages over each symbol's own last bars, skipping rows other symbols added
+    packing = bars.packing()
+    packed_close = packing.pack(close)
+    ma_5 = _last_window_means(packed_close, packing.last_ranks, 5, current_price)
+    ma_20 = _last_window_means(packed_close, packing.last_ranks, 20, current_price)
+    trend = np.select([
+        (current_price > ma_5) & (ma_5 > ma_20),
+        current_price > ma_5,
+        (current_price < ma_5) & (ma_5 < ma_20),
+        current_price < ma_5
+    ], ['Strong Upward', 'Upward', 'Strong Downward', 'Downward'], 'Neutral').astype(object)
+    
+    has_trend = counts >= 2
+    trend[~has_trend] = None
+    
+    return pd.DataFrame({
+        'current_price': np.round(current_price, 2),
+        'price_change': np.round(price_change, 2),
+        'price_change_percent': np.round(price_change_percent, 2),
+        'high': np.round(np.fmax.reduce(bars.field('high'), axis=0), 2),
+        'low': np.round(np.fmin.reduce(bars.field('low'), axis=0), 2),
+        'total_volume': total_volume.astype(np.int64),
+        'average_volume': np.nan_to_num(average_volume).astype(np.int64),
+        'last_updated': bars.index[np.maximum(rows, 0)],
+        'trend': trend,
+        'ma_5': np.where(has_trend, np.round(ma_5, 2), np.nan),
+        'ma_20': np.where(has_trend, np.round(ma_20, 2), np.nan),
+        'volatility': np.where(has_trend, np.round(volatility, 2), np.nan)
+    }, index=pd.Index(bars.symbols, name='symbol'))
+
+
+def _last_window_means(values: np.ndarray, rows: np.ndarray, window: int, default: np.ndarray) -> np.ndarray:
+    """Per-column mean of the `window` rows ending at `rows`, as _last_window_mean does per symbol."""
+    offsets = rows[np.newaxis, :] - np.arange(window)[:, np.newaxis]
+    means = values[np.maximum(offsets, 0), np.arange(values.shape[1])].mean(axis=0)
+    return np.where((offsets >= 0).all(axis=0) & ~np.isnan(means), means, default)
@@ -0,0 +1,102 @@
+# Frame Dtypes Module for Stock Market Analytics
+# Compact column dtypes for cached OHLCV frames, and per-frame memory reports
+
+import numpy as np
+import pandas as pd
+from typing import Dict
+
+STANDARD_DTYPES = {
+    'open': np.dtype(np.float64),
+    'high': np.dtype(np.float64),
+    'low': np.dtype(np.float64),
+    'close': np.dtype(np.float64),
+    'volume': np.dtype(np.int64)
+}
+
+# float32 keeps prices to about 7 significant digits (under a cent below $100,000)
+COMPACT_DTYPES = {
+    'open': np.dtype(np.float32),
+    'high': np.dtype(np.float32),
+    'low': np.dtype(np.float32),
+    'close': np.dtype(np.float32),
+    'volume': np.dtype(np.uint32)
+}
+
+_UINT32_MAX = np.iinfo(np.uint32).max
+
+
+def _convert(df: pd.DataFrame, dtypes: Dict[str, np.dtype]) -> pd.DataFrame:
+    """Cast the OHLCV columns present in df, keeping the index and attrs."""
+    columns = {}
+    for name in df.columns:
+        values = df[name].to_numpy()
+        target = dtypes.get(name)
+        if target is not None and values.dtype != target:
+            if target == COMPACT_DTYPES['volume'] and len(values) and (values.min() < 0 or values.max() > _UINT32_MAX):
+                # Keep volumes that do not fit rather than wrapping them
+                target = values.dtype
+            values = values.astype(target)
+        columns[name] = values
+    result = pd.DataFrame(columns, index=df.index)
+    result.attrs.update(df.attrs)
+    return result
+
+
+def is_compact(df: pd.DataFrame) -> bool:
+    """Check whether every price column of a frame is already float32."""
+    return all(df[name].dtype == COMPACT_DTYPES[name] for name in ('open', 'high', 'low', 'close') if name in df)
+
+
+def compact(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a frame to COMPACT_DTYPES: float32 prices and uint32 volume.
+    The DatetimeIndex is kept as is; it is already an int64 epoch array.
+
+    Args:
+        df: OHLCV DataFrame indexed by timestamp
+
+    Returns:
+        Compact DataFrame (df itself if empty or already compact)
+    """
+    if df.empty or is_compact(df):
+        return df
+    return _convert(df, COMPACT_DTYPES)
+
+
+def standard(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a frame back to STANDARD_DTYPES: float64 prices and int64 volume.
+
+    Args:
+        df: OHLCV DataFrame indexed by timestamp
+
+    Returns:
+        Standard DataFrame (df itself if empty or already standard)
+    """
+    if df.empty or all(df[name].dtype == dtype for name, dtype in STANDARD_DTYPES.items() if name in df):
+        return df
+    return _convert(df, STANDARD_DTYPES)
+
+
+def memory_usage(df: pd.DataFrame) -> Dict:
+    """
+    Report the memory held by a frame.
+
+    Args:
+        df: OHLCV DataFrame indexed by timestamp
+
+    Returns:
+        Dictionary with 'rows', 'index_bytes', 'column_bytes', 'total_bytes',
+        'bytes_per_bar' and whether the frame is 'compact'
+    """
+    usage = df.memory_usage(index=True, deep=True)
+    index_bytes = int(usage.get('Index', 0))
+    total_bytes = int(usage.sum())
+    return {
+        'rows': len(df),
+        'index_bytes': index_bytes,
+        'column_bytes': total_bytes - index_bytes,
+        'total_bytes': total_bytes,
+        'bytes_per_bar': round(total_bytes / len(df), 1) if len(df) else 0.0,
+        'compact': not df.empty and is_compact(df)
+    }
@@ -0,0 +1,367 @@
+# Panel Module for Stock Market Analytics
+# Many symbols' bars aligned on one timestamp axis as 2-D (time x symbol) arrays
+
+import math
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+# Closed-form EWM blocks are cut so the decay never falls below this factor,
+# which keeps the rescaled cumulative sums well inside float64 precision
+_MIN_BLOCK_DECAY = 1e-6
+
+
+class Panel:
+    """
+    OHLCV bars of many symbols on a shared, sorted timestamp axis.
+    Each field is a column-major float64 array of shape (bars, capacity)
+    where column j belongs to symbols[j] and is contiguous; columns past the
+    last symbol are spare, so adding a symbol usually writes only its own
+    column. Rows a symbol has no bar for are NaN (volume included, hence float).
+    """
+
+    def __init__(self, index: Optional[pd.DatetimeIndex] = None, capacity: int = 8):
+        """
+        Args:
+            index: Shared timestamp axis (empty if None)
+            capacity: Number of symbol columns to allocate up front
+        """
+        self.index = index if index is not None else pd.DatetimeIndex([], dtype='datetime64[ns]', name='timestamp')
+        self.symbols: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._data = {field: np.full((len(self.index), max(capacity, 1)), np.nan, order='F') for field in FIELDS}
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, Optional[pd.DataFrame]]) -> 'Panel':
+        """
+        Build a panel from per-symbol frames, building the shared axis once.
+
+        Args:
+            frames: Mapping of symbol to OHLCV frame; None or empty frames are skipped
+
+        Returns:
+            Panel with one column per loaded symbol, in mapping order
+        """
+        loaded: Dict[str, pd.DataFrame] = {
+            symbol: df for symbol, df in frames.items() if df is not None and not df.empty
+        }
+        index: Optional[pd.DatetimeIndex] = None
+        for df in loaded.values():
+            if index is None:
+                index = df.index
+            elif not df.index.equals(index):
+                index = index.union(df.index)
+        panel = cls(index, capacity=len(loaded))
+        for symbol, df in loaded.items():
+            panel.add(symbol, df)
+        return panel
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._positions
+
+    @property
+    def capacity(self) -> int:
+        """Number of allocated symbol columns."""
+        return self._data['close'].shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the field arrays, spare columns included."""
+        return sum(values.nbytes for values in self._data.values())
+
+    def position(self, symbol: str) -> int:
+        """
+        Column of a symbol in the field arrays.
+
+        Raises:
+            KeyError: if the symbol is not in the panel
+        """
+        return self._positions[symbol]
+
+    def field(self, name: str) -> np.ndarray:
+        """
+        View of one field for every symbol.
+
+        Args:
+            name: One of FIELDS
+
+        Returns:
+            Array of shape (bars, symbols) sharing memory with the panel
+        """
+        return self._data[name][:, :len(self.symbols)]
+
+    def add(self, symbol: str, df: pd.DataFrame):
+        """
+        Add a symbol, or replace its bars if it is already in the panel.
+        Only the symbol's column is written unless its bars extend the shared
+        axis or every column is in use.
+
+        Args:
+            symbol: Stock symbol
+            df: Sorted OHLCV frame indexed by timestamp
+        """
+        if not len(self.index):
+            self._reindex(df.index)
+        if df.index.equals(self.index):
+            rows = slice(None)
+        else:
+            if len(df.index) and not df.index.isin(self.index).all():
+                self._reindex(self.index.union(df.index))
+            rows = self.index.get_indexer(df.index)
+
+        position = self._positions.get(symbol)
+        if position is None:
+            if len(self.symbols) == self.capacity:
+                self._grow(self.capacity * 2)
+            position = len(self.symbols)
+            self.symbols.append(symbol)
+            self._positions[symbol] = position
+
+        for name, values in self._data.items():
+            values[:, position] = np.nan
+            values[rows, position] = df[name].to_numpy()
+
+    def remove(self, symbol: str):
+        """
+        Drop a symbol by moving the last symbol into its column.
+        Symbol order is therefore not preserved. The shared axis is kept,
+        even if no remaining symbol has bars at some of its timestamps.
+
+        Args:
+            symbol: Stock symbol
+
+        Raises:
+            KeyError: if the symbol is not in the panel
+        """
+        position = self._positions.pop(symbol)
+        last = len(self.symbols) - 1
+        if position != last:
+            moved = self.symbols[last]
+            self.symbols[position] = moved
+            self._positions[moved] = position
+            for values in self._data.values():
+                values[:, position] = values[:, last]
+        self.symbols.pop()
+        for values in self._data.values():
+            values[:, last] = np.nan
+
+    def to_frame(self, symbol: str) -> pd.DataFrame:
+        """
+        Rebuild one symbol's frame from the panel.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            DataFrame with FIELDS for the rows the symbol has a bar for
+        """
+        position = self.position(symbol)
+        mask = ~np.isnan(self._data['close'][:, position])
+        return pd.DataFrame({name: values[mask, position] for name, values in self._data.items()},
+                            index=self.index[mask])
+
+    def bar_counts(self) -> np.ndarray:
+        """Number of bars each symbol has."""
+        return (~np.isnan(self.field('close'))).sum(axis=0)
+
+    def last_rows(self) -> np.ndarray:
+        """Row of each symbol's latest bar (-1 for a symbol without bars)."""
+        valid = ~np.isnan(self.field('close'))
+        if not len(valid):
+            return np.full(len(self.symbols), -1)
+        rows = len(self.index) - 1 - np.argmax(valid[::-1], axis=0)
+        return np.where(valid.any(axis=0), rows, -1)
+
+    def first_rows(self) -> np.ndarray:
+        """Row of each symbol's first bar (-1 for a symbol without bars)."""
+        valid = ~np.isnan(self.field('close'))
+        if not len(valid):
+            return np.full(len(self.symbols), -1)
+        return np.where(valid.any(axis=0), np.argmax(valid, axis=0), -1)
+
+    def packing(self) -> 'Packing':
+        """Layout for computing on each symbol's own bars (see Packing)."""
+        return Packing(~np.isnan(self.field('close')))
+
+    def _reindex(self, index: pd.DatetimeIndex):
+        """Move every field onto a new (superset) timestamp axis."""
+        rows = index.get_indexer(self.index)
+        for name, values in self._data.items():
+            resized = np.full((len(index), values.shape[1]), np.nan, order='F')
+            resized[rows] = values
+            self._data[name] = resized
+        self.index = index
+
+    def _grow(self, capacity: int):
+        """Allocate more symbol columns."""
+        for name, values in self._data.items():
+            grown = np.full((values.shape[0], capacity), np.nan, order='F')
+            grown[:, :values.shape[1]] = values
+            self._data[name] = grown
+
+
+class Packing:
+    """
+    Moves each column's values to the top rows, in order, dropping the rows
+    a symbol has no bar for. Windowed kernels run on packed arrays therefore
+    see every symbol's own consecutive bars, as the single-symbol functions
+    do, however the shared axis interleaves them.
+    """
+
+    def __init__(self, valid: np.ndarray):
+        """
+        Args:
+            valid: Boolean array of shape (bars, symbols), True where a symbol has a bar
+        """
+        self.shape = valid.shape
+        self.counts = valid.sum(axis=0)
+        self.aligned = bool(valid.all())
+        self.rows, self.columns = np.nonzero(valid)
+        self.ranks = (np.cumsum(valid, axis=0) - 1)[self.rows, self.columns]
+
+    @property
+    def last_ranks(self) -> np.ndarray:
+        """Packed row of each symbol's latest bar (-1 for a symbol without bars)."""
+        return self.counts - 1
+
+    def pack(self, values: np.ndarray) -> np.ndarray:
+        """Move each column's bars to the top; rows past a column's count are NaN."""
+        if self.aligned:
+            return values
+        packed = np.full(self.shape, np.nan, order='F')
+        packed[self.ranks, self.columns] = values[self.rows, self.columns]
+        return packed
+
+    def unpack(self, values: np.ndarray) -> np.ndarray:
+        """Move packed values back onto the shared axis; rows without a bar are NaN."""
+        if self.aligned:
+            return values
+        unpacked = np.full(self.shape, np.nan, order='F')
+        unpacked[self.rows, self.columns] = values[self.ranks, self.columns]
+        return unpacked
+
+
+def at_rows(values: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """
+    Pick one row per column, e.g. each symbol's value at its latest bar.
+
+    Args:
+        values: Array of shape (bars, symbols)
+        rows: Row per column; negative rows give NaN
+
+    Returns:
+        Array with one value per column
+    """
+    picked = values[np.maximum(rows, 0), np.arange(values.shape[1])]
+    return np.where(rows >= 0, picked, np.nan)
+
+
+def incomplete_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """Mask of rows whose trailing window of `window` rows holds a NaN or starts before row 0."""
+    incomplete = np.zeros(values.shape, dtype=bool)
+    incomplete[:window - 1] = True
+    missing = np.isnan(values)
+    if missing.any():
+        counts = np.cumsum(missing, axis=0, dtype=np.int32)
+        counts[window:] -= counts[:-window].copy()
+        incomplete |= counts > 0
+    return incomplete
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum of each trailing window per column, from one cumulative sum."""
+    sums = np.cumsum(values, axis=0)
+    sums[window:] -= sums[:-window].copy()
+    return sums
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing mean per column, NaN until a full window of values exists,
+    like rolling(window).mean() on each column.
+
+    Args:
+        values: Array of shape (bars, symbols)
+        window: Window length in rows
+
+    Returns:
+        Array of the same shape
+    """
+    means = _window_sums(np.where(np.isnan(values), 0.0, values), window) / window
+    means[incomplete_windows(values, window)] = np.nan
+    return means
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing sample standard deviation per column, like rolling(window).std().
+    Values are centred on each column's first value before the window sums
+    of values and squares are taken, to limit cancellation.
+
+    Args:
+        values: Array of shape (bars, symbols)
+        window: Window length in rows
+
+    Returns:
+        Array of the same shape
+    """
+    missing = np.isnan(values)
+    reference = values[np.argmax(~missing, axis=0), np.arange(values.shape[1])] if len(values) else 0.0
+    centred = np.where(missing, 0.0, values - reference)
+
+    sums = _window_sums(centred, window)
+    variance = (_window_sums(centred * centred, window) - sums * sums / window) / (window - 1)
+    std = np.sqrt(np.maximum(variance, 0.0))
+    std[incomplete_windows(values, window)] = np.nan
+    return std
+
+
+def ewm_mean(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponential moving average per column, like ewm(span, adjust=False).mean().
+    Each column starts at its first value; NaN rows after that keep the
+    previous average and are skipped, as with ignore_na=True.
+    The recursion is evaluated in closed form over blocks of rows, so the
+    Python loop runs once per block rather than once per bar.
+
+    Args:
+        values: Array of shape (bars, symbols)
+        span: EWM span
+
+    Returns:
+        Array of the same shape, NaN before each column's first value
+    """
+    alpha = 2.0 / (span + 1)
+    bars, columns = values.shape
+    result = np.full(values.shape, np.nan)
+    if not bars or not columns:
+        return result
+
+    valid = ~np.isnan(values)
+    started = np.maximum.accumulate(valid, axis=0)
+    weights = np.where(valid, alpha, 0.0)
+    inputs = np.where(valid, values, 0.0)
+
+    # Seed each column with its first value; rows before it are masked out below
+    first = np.argmax(valid, axis=0)
+    carry = values[first, np.arange(columns)]
+
+    if alpha >= 1:
+        # A span of one follows the values exactly
+        return pd.DataFrame(values).ffill().to_numpy()
+
+    block = max(1, int(math.log(_MIN_BLOCK_DECAY) / math.log(1 - alpha)))
+    for start in range(0, bars, block):
+        stop = min(start + block, bars)
+        decay = np.cumprod(1 - weights[start:stop], axis=0)
+        block_result = decay * (carry + np.cumsum(weights[start:stop] * inputs[start:stop] / decay, axis=0))
+        result[start:stop] = block_result
+        carry = block_result[-1]
+
+    result[~started] = np.nan
+    return result
@@ -0,0 +1,184 @@
+# Resampling Module for Stock Market Analytics
+# Derives coarser OHLCV bars (5min ... 2h, daily) from 1-min bars
+
+import re
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+MINUTES_PER_DAY = 24 * 60
+
+_INTERVAL_PATTERN = re.compile(r"^(\d+)\s*(min|m|h|hour|d|day)$")
+_UNIT_MINUTES = {'min': 1, 'm': 1, 'h': 60, 'hour': 60, 'd': MINUTES_PER_DAY, 'day': MINUTES_PER_DAY}
+
+
+def parse_interval(interval: str) -> int:
+    """
+    Convert an interval name to minutes.
+
+    Args:
+        interval: e.g. '5min', '60min', '2h', '1d' or 'daily'
+
+    Returns:
+        Bar length in minutes
+
+    Raises:
+        ValueError: if the interval is not understood or not a whole number of
+            buckets per day
+    """
+    name = interval.strip().lower()
+    if name == 'daily':
+        return MINUTES_PER_DAY
+    match = _INTERVAL_PATTERN.match(name)
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(f"Unsupported interval: {interval}")
+
+    minutes = int(match.group(1)) * _UNIT_MINUTES[match.group(2)]
+    if minutes < MINUTES_PER_DAY and MINUTES_PER_DAY % minutes:
+        raise ValueError(f"Interval {interval} does not divide a day evenly")
+    if minutes > MINUTES_PER_DAY:
+        raise ValueError(f"Intervals longer than a day are not supported: {interval}")
+    return minutes
+
+
+def _bucket_labels(index: pd.DatetimeIndex, minutes: int) -> np.ndarray:
+    """
+    Label each timestamp with the bar it falls into.
+    Intraday bars are labelled by their end and include it, like Alpha Vantage
+    (09:31-09:35 -> 09:35); daily bars are labelled by their date.
+    """
+    values = index.values.astype('datetime64[m]').astype(np.int64)
+    if minutes >= MINUTES_PER_DAY:
+        return (values // MINUTES_PER_DAY) * MINUTES_PER_DAY
+    return -(-values // minutes) * minutes
+
+
+def resample_bars(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """
+    Aggregate sorted OHLCV bars into a coarser interval.
+
+    Args:
+        df: DataFrame with open, high, low, close, volume indexed by timestamp
+        interval: Target interval (see parse_interval)
+
+    Returns:
+        DataFrame with the same columns, one row per non-empty bar
+    """
+    minutes = parse_interval(interval)
+    if df.empty:
+        return df.iloc[:0].copy()
+
+    labels = _bucket_labels(df.index, minutes)
+    # Bars are sorted, so every bucket is a contiguous run
+    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+    ends = np.r_[starts[1:], len(labels)] - 1
+
+    index = pd.DatetimeIndex(labels[starts].astype('datetime64[m]').astype('datetime64[ns]'), name=df.index.name)
+    return pd.DataFrame({
+        'open': df['open'].to_numpy()[starts],
+        'high': np.maximum.reduceat(df['high'].to_numpy(), starts),
+        'low': np.minimum.reduceat(df['low'].to_numpy(), starts),
+        'close': df['close'].to_numpy()[ends],
+        # Summed in int64 so compact uint32 volumes cannot overflow
+        'volume': np.add.reduceat(df['volume'].to_numpy().astype(np.int64, copy=False), starts)
+    }, index=index)
+
+
+class Resampler:
+    """
+    Keeps a coarser series in step with a growing 1-min series.
+    Each update only aggregates source bars newer than the last one seen and
+    folds them into the last (possibly still open) coarse bar. Source bars
+    revised since the last update (e.g. a 1-min bar that was still forming)
+    are re-aggregated from the start of their coarse bar.
+    """
+
+    def __init__(self, interval: str):
+        """
+        Args:
+            interval: Target interval (see parse_interval)
+        """
+        self.interval = interval
+        self.minutes = parse_interval(interval)
+        self.frame = pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume'])
+        self.first_source_time: Optional[pd.Timestamp] = None
+        self.last_source_time: Optional[pd.Timestamp] = None
+        self._source: Optional[pd.DataFrame] = None
+
+    def update(self, source: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fold new source bars into the coarse series.
+
+        Args:
+            source: Sorted 1-min (or finer) bars; may repeat bars already seen
+
+        Returns:
+            The coarse series including every source bar seen so far
+        """
+        revised = self._first_revision(source)
+        self._source = source
+        if revised is not None:
+            return self._rebuild_from(source, revised)
+
+        if self.last_source_time is not None:
+            source = source.iloc[source.index.searchsorted(self.last_source_time, side='right'):]
+        if source.empty:
+            return self.frame
+
+        update = resample_bars(source, self.interval)
+        self.last_source_time = source.index[-1]
+        if self.frame.empty:
+            self.first_source_time = source.index[0]
+            self.frame = update
+            return self.frame
+
+        if update.index[0] == self.frame.index[-1]:
+            # New bars continue the open coarse bar
+            last = self.frame.iloc[-1]
+            first = update.iloc[0]
+            merged = pd.DataFrame({
+                'open': [last['open']],
+                'high': [max(last['high'], first['high'])],
+                'low': [min(last['low'], first['low'])],
+                'close': [first['close']],
+                'volume': [last['volume'] + first['volume']]
+            }, index=update.index[:1]).astype(self.frame.dtypes.to_dict())
+            self.frame = pd.concat([self.frame.iloc[:-1], merged, update.iloc[1:]])
+        else:
+            self.frame = pd.concat([self.frame, update])
+        return self.frame
+
+    def _first_revision(self, source: pd.DataFrame) -> Optional[pd.Timestamp]:
+        """Find the earliest already folded source bar that differs in the new source."""
+        previous = self._source
+        if previous is None or previous is source or previous.empty or source.empty:
+            return None
+
+        start = max(previous.index[0], source.index[0])
+        before = previous.iloc[previous.index.searchsorted(start):]
+        after = source.iloc[source.index.searchsorted(start):]
+        after = after.iloc[:after.index.searchsorted(self.last_source_time, side='right')]
+
+        rows = min(len(before), len(after))
+        changed = before.index[:rows] != after.index[:rows]
+        for column in ['open', 'high', 'low', 'close', 'volume']:
+            changed |= before[column].to_numpy()[:rows] != after[column].to_numpy()[:rows]
+        positions = np.flatnonzero(changed)
+        if len(positions):
+            return min(before.index[positions[0]], after.index[positions[0]])
+        if len(before) != len(after):
+            # A bar was dropped or inserted after the compared rows
+            return before.index[rows] if len(before) > rows else after.index[rows]
+        return None
+
+    def _rebuild_from(self, source: pd.DataFrame, timestamp: pd.Timestamp) -> pd.DataFrame:
+        """Drop the coarse bars from the one containing timestamp and aggregate them again."""
+        labels = _bucket_labels(source.index, self.minutes)
+        label = _bucket_labels(pd.DatetimeIndex([timestamp]), self.minutes)[0]
+        first = int(np.searchsorted(labels, label, side='left'))
+
+        kept = self.frame[self.frame.index < pd.Timestamp(np.datetime64(int(label), 'm'))]
+        update = resample_bars(source.iloc[first:], self.interval)
+        self.frame = pd.concat([kept, update]) if not kept.empty else update
+        self.last_source_time = source.index[-1]
+        return self.frame
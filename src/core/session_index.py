@@ -0,0 +1,183 @@
+# Session Index Module for Stock Market Analytics
+# Per-bar minute-of-day and trading session labels with bincount aggregations
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+
+PRE_MARKET = 0
+MORNING = 1
+AFTERNOON = 2
+AFTER_HOURS = 3
+SESSION_NAMES = ['Pre-Market', 'Morning', 'Afternoon', 'After Hours']
+
+MARKET_OPEN_MINUTE = 9 * 60 + 30   # 9:30 AM
+NOON_MINUTE = 12 * 60              # 12:00 PM
+MARKET_CLOSE_MINUTE = 16 * 60      # 4:00 PM, the last regular-session bar
+
+# Session boundaries for np.digitize: [open, noon) morning, [noon, close] afternoon
+_SESSION_BINS = np.array([MARKET_OPEN_MINUTE, NOON_MINUTE, MARKET_CLOSE_MINUTE + 1])
+
+ATTRS_KEY = 'session_index'
+BYTES_PER_BAR = 4  # int16 minute of day + int8 hour + int8 session
+
+
+class SessionIndex:
+    """
+    Read-only labels for every bar of one frame.
+    Stored in DataFrame.attrs, which pandas deep-copies on most operations;
+    the labels are immutable, so copies share them instead.
+    """
+
+    def __init__(self, index: pd.DatetimeIndex):
+        minutes = index.values.astype('datetime64[m]').astype(np.int64)
+        self.index = index
+        self.length = len(index)
+        self.first = index[0] if len(index) else None
+        self.last = index[-1] if len(index) else None
+        self.minute_of_day = (minutes % (24 * 60)).astype(np.int16)
+        self.hour = (self.minute_of_day // 60).astype(np.int8)
+        self.session = np.digitize(self.minute_of_day, _SESSION_BINS).astype(np.int8)
+        for array in (self.minute_of_day, self.hour, self.session):
+            array.setflags(write=False)
+
+    def matches(self, index: pd.DatetimeIndex) -> bool:
+        """Check that the labels were built for this index (and not, e.g., a slice of it)."""
+        if len(index) != self.length:
+            return False
+        return not len(index) or (index[0] == self.first and index[-1] == self.last)
+
+    def locate(self, index: pd.DatetimeIndex) -> Optional[int]:
+        """
+        Find where a positional slice of the indexed frame starts.
+
+        Args:
+            index: Index of a frame that may be a contiguous slice, e.g. df.iloc[a:b]
+
+        Returns:
+            Position of the slice's first bar, or None if index is not such a slice
+        """
+        if not len(index) or len(index) > self.length:
+            return None
+        start = int(self.index.searchsorted(index[0]))
+        stop = start + len(index)
+        if stop > self.length or self.index[start] != index[0] or self.index[stop - 1] != index[-1]:
+            return None
+        return start
+
+    def slice(self, start: int, stop: int) -> 'SessionIndex':
+        """Labels of rows start to stop, as read-only views of these arrays."""
+        sliced = object.__new__(SessionIndex)
+        sliced.index = self.index[start:stop]
+        sliced.length = len(sliced.index)
+        sliced.first = sliced.index[0] if sliced.length else None
+        sliced.last = sliced.index[-1] if sliced.length else None
+        sliced.minute_of_day = self.minute_of_day[start:stop]
+        sliced.hour = self.hour[start:stop]
+        sliced.session = self.session[start:stop]
+        return sliced
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the label arrays."""
+        return self.minute_of_day.nbytes + self.hour.nbytes + self.session.nbytes
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def attach(df: pd.DataFrame) -> SessionIndex:
+    """
+    Build the session index of a frame and store it in df.attrs.
+
+    Args:
+        df: DataFrame indexed by timestamp
+
+    Returns:
+        The attached SessionIndex
+    """
+    session_index = SessionIndex(df.index)
+    df.attrs[ATTRS_KEY] = session_index
+    return session_index
+
+
+def get_session_index(df: pd.DataFrame) -> SessionIndex:
+    """
+    Get the session index attached to a frame, building it if missing or stale.
+    A positional slice of an indexed frame (which carries the parent's attrs)
+    gets views of the parent's labels instead of new ones.
+
+    Args:
+        df: DataFrame indexed by timestamp
+
+    Returns:
+        SessionIndex aligned with df
+    """
+    session_index = df.attrs.get(ATTRS_KEY)
+    if isinstance(session_index, SessionIndex):
+        if session_index.matches(df.index):
+            return session_index
+        start = session_index.locate(df.index)
+        if start is not None:
+            return session_index.slice(start, start + len(df))
+    return attach(df)
+
+
+def grouped_sum(values: np.ndarray, labels: np.ndarray, groups: int) -> np.ndarray:
+    """
+    Sum values per integer label in a single pass.
+
+    Args:
+        values: Values to sum
+        labels: Non-negative group label per value
+        groups: Number of groups (result length)
+
+    Returns:
+        Array of per-group sums (int64 for integer values)
+    """
+    sums = np.bincount(labels, weights=values, minlength=groups)
+    if np.issubdtype(values.dtype, np.integer):
+        return np.rint(sums).astype(np.int64)
+    return sums
+
+
+def session_totals(df: pd.DataFrame, column: str = 'volume') -> np.ndarray:
+    """
+    Sum a column per trading session.
+
+    Args:
+        df: DataFrame indexed by timestamp
+        column: Column to sum
+
+    Returns:
+        Array indexed by PRE_MARKET, MORNING, AFTERNOON, AFTER_HOURS
+    """
+    return grouped_sum(df[column].to_numpy(), get_session_index(df).session, len(SESSION_NAMES))
+
+
+def hourly_totals(df: pd.DataFrame, column: str = 'volume') -> np.ndarray:
+    """
+    Sum a column per hour of the day.
+
+    Args:
+        df: DataFrame indexed by timestamp
+        column: Column to sum
+
+    Returns:
+        Array of 24 sums indexed by hour
+    """
+    return grouped_sum(df[column].to_numpy(), get_session_index(df).hour, 24)
+
+
+def session_summary(df: pd.DataFrame, column: str = 'volume') -> Dict[str, float]:
+    """
+    Sum a column per trading session, by session name.
+
+    Args:
+        df: DataFrame indexed by timestamp
+        column: Column to sum
+
+    Returns:
+        Dictionary mapping SESSION_NAMES to sums
+    """
+    return dict(zip(SESSION_NAMES, session_totals(df, column).tolist()))
@@ -1,7 +1,9 @@
 # Technical Indicators Module for Stock Market Analytics
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Tuple
+from src.core.panel import Panel, at_rows, ewm_mean, incomplete_windows, rolling_mean, rolling_std
 
 
 def calculate_rsi(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -288,3 +290,212 @@ def calculate_all_indicators(df: pd.DataFrame, current_price: float) -> Dict:
         'signal_confidence': signal_data['confidence'],
         'signal_reasoning': signal_data['reasoning']
     }
+
+
+# Panel variants: one vectorized call over every symbol of a Panel.
+# Each applies the single-symbol formula to every symbol's own bars, packed
+# so that rows other symbols have no bar for do not break its windows;
+# latest values are taken at each symbol's own last bar.
+
+def _latest(values: np.ndarray, rows: np.ndarray, enough: np.ndarray, decimals: int) -> np.ndarray:
+    """Rounded value at each symbol's last bar, 0 where there is too little data."""
+    latest = at_rows(values, rows)
+    return np.where(enough & ~np.isnan(latest), np.round(latest, decimals), 0)
+
+
+def calculate_rsi_panel(panel: Panel, period: int = 14) -> np.ndarray:
+    """
+    Calculate RSI for every symbol of a panel.
+    
+    Args:
+        panel: Panel with stock data
+        period: RSI period (default: 14)
+        
+    Returns:
+        Array of RSI values (0-100) of shape (bars, symbols); NaN until a
+        symbol has `period` bars and on rows it has no bar for
+    """
+    packing = panel.packing()
+    return packing.unpack(_rsi_packed(packing.pack(panel.field('close')), period))
+
+
+def _rsi_packed(close: np.ndarray, period: int) -> np.ndarray:
+    """RSI of packed closes (see Packing)."""
+    delta = np.diff(close, axis=0, prepend=np.nan)
+    
+    gain = rolling_mean(np.where(delta > 0, delta, 0.0), period)
+    loss = rolling_mean(np.where(delta < 0, -delta, 0.0), period)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100 - (100 / (1 + gain / loss))
+    rsi[incomplete_windows(close, period)] = np.nan
+    return rsi
+
+
+def calculate_macd_panel(panel: Panel, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict:
+    """
+    Calculate MACD for every symbol of a panel.
+    
+    Args:
+        panel: Panel with stock data
+        fast: Fast EMA period (default: 12)
+        slow: Slow EMA period (default: 26)
+        signal: Signal line period (default: 9)
+        
+    Returns:
+        Dictionary with per-symbol macd, signal and histogram arrays, and the
+        full (bars, symbols) series
+    """
+    packing = panel.packing()
+    close = packing.pack(panel.field('close'))
+    macd_line = ewm_mean(close, fast) - ewm_mean(close, slow)
+    signal_line = ewm_mean(macd_line, signal)
+    histogram = macd_line - signal_line
+    
+    rows = packing.last_ranks
+    enough = packing.counts >= slow
+    return {
+        'macd': _latest(macd_line, rows, enough, 4),
+        'signal': _latest(signal_line, rows, enough, 4),
+        'histogram': _latest(histogram, rows, enough, 4),
+        'macd_series': packing.unpack(macd_line),
+        'signal_series': packing.unpack(signal_line),
+        'histogram_series': packing.unpack(histogram)
+    }
+
+
+def calculate_bollinger_bands_panel(panel: Panel, period: int = 20, std_dev: int = 2) -> Dict:
+    """
+    Calculate Bollinger Bands for every symbol of a panel.
+    
+    Args:
+        panel: Panel with stock data
+        period: SMA period (default: 20)
+        std_dev: Number of standard deviations (default: 2)
+        
+    Returns:
+        Dictionary with per-symbol upper, middle and lower arrays, and the
+        full (bars, symbols) series
+    """
+    packing = panel.packing()
+    close = packing.pack(panel.field('close'))
+    sma = rolling_mean(close, period)
+    std = rolling_std(close, period)
+    upper_band = sma + (std * std_dev)
+    lower_band = sma - (std * std_dev)
+    
+    rows = packing.last_ranks
+    enough = packing.counts >= period
+    return {
+        'upper': _latest(upper_band, rows, enough, 2),
+        'middle': _latest(sma, rows, enough, 2),
+        'lower': _latest(lower_band, rows, enough, 2),
+        'upper_series': packing.unpack(upper_band),
+        'middle_series': packing.unpack(sma),
+        'lower_series': packing.unpack(lower_band)
+    }
+
+
+def calculate_moving_averages_panel(panel: Panel) -> Dict:
+    """
+    Calculate Simple Moving Averages for every symbol of a panel.
+    
+    Args:
+        panel: Panel with stock data
+        
+    Returns:
+        Dictionary with per-symbol arrays for 5, 20, 50, 200 periods and the
+        full (bars, symbols) series
+    """
+    packing = panel.packing()
+    close = packing.pack(panel.field('close'))
+    
+    result = {}
+    for period in [5, 20, 50, 200]:
+        ma = rolling_mean(close, period)
+        result[f'ma_{period}'] = _latest(ma, packing.last_ranks, packing.counts >= period, 2)
+        result[f'ma_{period}_series'] = packing.unpack(ma)
+    
+    return result
+
+
+def calculate_all_indicators_panel(panel: Panel) -> pd.DataFrame:
+    """
+    Calculate all technical indicators for every symbol of a panel at once.
+    Values and signals follow calculate_all_indicators, with each symbol's
+    rounded latest close as its current price; the signal reasoning text
+    is left out.
+    
+    Args:
+        panel: Panel with stock data
+        
+    Returns:
+        DataFrame indexed by symbol with one column per indicator value
+    """
+    columns = ['rsi', 'rsi_signal', 'macd', 'macd_signal', 'macd_histogram',
+               'bb_upper', 'bb_middle', 'bb_lower', 'ma_5', 'ma_20', 'ma_50', 'ma_200',
+               'overall_signal', 'signal_confidence']
+    if not len(panel):
+        return pd.DataFrame(columns=columns, index=pd.Index([], name='symbol'))
+    
+    rows = panel.last_rows()
+    counts = panel.bar_counts()
+    current_price = np.round(at_rows(panel.field('close'), rows), 2)
+    
+    rsi_value = at_rows(calculate_rsi_panel(panel), rows)
+    macd_data = calculate_macd_panel(panel)
+    bb_data = calculate_bollinger_bands_panel(panel)
+    ma_data = calculate_moving_averages_panel(panel)
+    
+    # Weighted votes, as in generate_signals
+    buy_score = np.zeros(len(panel), dtype=int)
+    sell_score = np.zeros(len(panel), dtype=int)
+    
+    oversold = rsi_value < 30
+    overbought = rsi_value > 70
+    buy_score += 2 * oversold
+    sell_score += 2 * overbought
+    hold_score = (~oversold & ~overbought).astype(int)
+    
+    has_macd = macd_data['macd'] != 0
+    bullish = macd_data['macd'] > macd_data['signal']
+    buy_score += has_macd & bullish
+    sell_score += has_macd & ~bullish
+    
+    has_bb = bb_data['lower'] != 0
+    at_lower = current_price <= bb_data['lower']
+    buy_score += has_bb & at_lower
+    sell_score += has_bb & ~at_lower & (current_price >= bb_data['upper'])
+    
+    has_ma = (ma_data['ma_20'] != 0) & (ma_data['ma_50'] != 0)
+    above = (ma_data['ma_20'] > ma_data['ma_50']) & (current_price > ma_data['ma_20'])
+    below = (ma_data['ma_20'] < ma_data['ma_50']) & (current_price < ma_data['ma_20'])
+    buy_score += has_ma & above
+    sell_score += has_ma & ~above & below
+    
+    buying = (buy_score > sell_score) & (buy_score > hold_score)
+    selling = (sell_score > buy_score) & (sell_score > hold_score)
+    insufficient = counts < 20
+    overall_signal = np.where(insufficient, 'HOLD', np.select([buying, selling], ['BUY', 'SELL'], 'HOLD'))
+    confidence = np.where(insufficient, 5, np.select(
+        [buying, selling], [np.minimum(buy_score * 2, 10), np.minimum(sell_score * 2, 10)], 5))
+    
+    has_rsi = ~np.isnan(rsi_value)
+    rsi_signal = np.select([~has_rsi, rsi_value >= 70, rsi_value <= 30], ['N/A', 'Overbought', 'Oversold'], 'Neutral')
+    
+    return pd.DataFrame({
+        'rsi': np.where(has_rsi, np.round(rsi_value, 2), 0),
+        'rsi_signal': rsi_signal,
+        'macd': macd_data['macd'],
+        'macd_signal': macd_data['signal'],
+        'macd_histogram': macd_data['histogram'],
+        'bb_upper': bb_data['upper'],
+        'bb_middle': bb_data['middle'],
+        'bb_lower': bb_data['lower'],
+        'ma_5': ma_data['ma_5'],
+        'ma_20': ma_data['ma_20'],
+        'ma_50': ma_data['ma_50'],
+        'ma_200': ma_data['ma_200'],
+        'overall_signal': overall_signal,
+        'signal_confidence': confidence
+    }, index=pd.Index(panel.symbols, name='symbol'))
@@ -0,0 +1,126 @@
+# Time Window Module for Stock Market Analytics
+# Binary-search window queries over frames sorted by timestamp, returning views
+
+import re
+import pandas as pd
+from typing import Dict, Optional, Tuple, Union
+
+TimeLike = Union[str, pd.Timestamp]
+
+# Longest lookback among the indicators (MA 200)
+DEFAULT_WARMUP_BARS = 200
+
+_DURATION_PATTERN = re.compile(r"^(\d+)\s*(min|h|d)$")
+_DURATION_UNITS = {'min': 'minutes', 'h': 'hours', 'd': 'days'}
+
+
+def parse_duration(name: Optional[str]) -> Optional[pd.Timedelta]:
+    """
+    Convert a window name to a duration.
+
+    Args:
+        name: e.g. '30min', '4h', '5d', or 'all' / None for the whole frame
+
+    Returns:
+        Timedelta, or None for the whole frame
+
+    Raises:
+        ValueError: if the name is not understood
+    """
+    if name is None or name.strip().lower() == 'all':
+        return None
+    match = _DURATION_PATTERN.match(name.strip().lower())
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(f"Unsupported window: {name}")
+    return pd.Timedelta(**{_DURATION_UNITS[match.group(2)]: int(match.group(1))})
+
+
+def positions(index: pd.DatetimeIndex, start: Optional[TimeLike] = None,
+              end: Optional[TimeLike] = None) -> Tuple[int, int]:
+    """
+    Find the rows of a time range with two binary searches.
+
+    Args:
+        index: Sorted DatetimeIndex
+        start: First timestamp to include (from the first row if None)
+        end: Last timestamp to include (to the last row if None)
+
+    Returns:
+        Tuple of (first row, row after the last) for iloc slicing
+    """
+    first = index.searchsorted(pd.Timestamp(start), side='left') if start is not None else 0
+    stop = index.searchsorted(pd.Timestamp(end), side='right') if end is not None else len(index)
+    return int(first), int(max(first, stop))
+
+
+def window(df: pd.DataFrame, start: Optional[TimeLike] = None,
+           end: Optional[TimeLike] = None) -> pd.DataFrame:
+    """
+    Select the bars between two timestamps, inclusive, without copying them.
+
+    Args:
+        df: DataFrame sorted by timestamp
+        start: First timestamp to include (from the first bar if None)
+        end: Last timestamp to include (to the last bar if None)
+
+    Returns:
+        View of df sharing its column arrays
+    """
+    first, stop = positions(df.index, start, end)
+    return df.iloc[first:stop]
+
+
+def last(df: pd.DataFrame, duration: Union[str, pd.Timedelta, None]) -> pd.DataFrame:
+    """
+    Select the bars of the last `duration`, counted back from the latest bar.
+
+    Args:
+        df: DataFrame sorted by timestamp
+        duration: Timedelta or window name (see parse_duration); None for all bars
+
+    Returns:
+        View of df with the bars newer than latest bar minus duration
+    """
+    return with_warmup(df, duration, warmup_bars=0)[0]
+
+
+def with_warmup(df: pd.DataFrame, duration: Union[str, pd.Timedelta, None],
+                warmup_bars: int = DEFAULT_WARMUP_BARS) -> Tuple[pd.DataFrame, int]:
+    """
+    Select the last `duration` of bars plus up to `warmup_bars` bars before it,
+    so indicators computed on the result are settled inside the visible part.
+
+    Args:
+        df: DataFrame sorted by timestamp
+        duration: Timedelta or window name (see parse_duration); None for all bars
+        warmup_bars: Extra bars to include before the window
+
+    Returns:
+        Tuple of (view including the warm-up bars, number of warm-up rows);
+        the visible window is view.iloc[offset:]
+    """
+    if isinstance(duration, str) or duration is None:
+        duration = parse_duration(duration)
+    if duration is None or df.empty:
+        return df, 0
+
+    # Bars strictly after latest - duration, e.g. the last 12 bars of 5min for '1h'
+    first = int(df.index.searchsorted(df.index[-1] - duration, side='right'))
+    start = max(0, first - warmup_bars)
+    return df.iloc[start:], first - start
+
+
+def trim(data: Dict, offset: int) -> Dict:
+    """
+    Drop the warm-up rows from every series of an indicator result.
+
+    Args:
+        data: Indicator dictionary, e.g. from calculate_macd
+        offset: Warm-up rows to drop (see with_warmup)
+
+    Returns:
+        Copy of data with each pandas Series entry sliced to the visible window
+    """
+    if not offset:
+        return data
+    return {key: value.iloc[offset:] if isinstance(value, pd.Series) else value for key, value in data.items()}
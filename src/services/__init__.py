@@ -1,6 +1,29 @@
 # Services module exports
 
 from src.services import api_service
+from src.services import background_refresher
+from src.services import backfill
+from src.services import bar_store
+from src.services import circuit_breaker
 from src.services import demo_data
+from src.services import http_client
+from src.services import market_cache
+from src.services import providers
+from src.services import rate_limiter
+from src.services import single_flight
+from src.services import stream_parser
 
-__all__ = ['api_service', 'demo_data']
+__all__ = [
+    'api_service',
+    'background_refresher',
+    'backfill',
+    'bar_store',
+    'circuit_breaker',
+    'demo_data',
+    'http_client',
+    'market_cache',
+    'providers',
+    'rate_limiter',
+    'single_flight',
+    'stream_parser',
+]
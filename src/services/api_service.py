@@ -1,51 +1,172 @@
 # API Service module for fetching stock data from Alpha Vantage
 
+import io
+import threading
 import requests
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Callable, Optional, Dict, List, Tuple, Union
 from src import config
+from src.core import frame_dtypes, resampler, time_window
+from src.services import background_refresher
+from src.services import bar_store
+from src.services import circuit_breaker
 from src.services import demo_data
+from src.services import http_client
+from src.services import market_cache
+from src.services import providers
+from src.services import rate_limiter
+from src.services import single_flight
+from src.services import stream_parser
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON decoder
+    orjson = None  # type: ignore[assignment]
 
-def fetch_intraday_data(symbol: str, interval: str, api_key: str = config.ALPHA_VANTAGE_API_KEY) -> Tuple[Optional[Dict], bool]:
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:  # Optional multithreaded columnar CSV reader
+    CSV_ENGINE = "c"
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+BASE_INTERVAL = "1min"
+BAR_FIELDS = ("1. open", "2. high", "3. low", "4. close", "5. volume")
+_get_bar_fields = itemgetter(*BAR_FIELDS)
+CSV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+def _decode_json(response: requests.Response) -> Dict:
+    """Decode a response body, using orjson when it is installed."""
+    if orjson is not None and isinstance(response.content, bytes):
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _read_json(response: requests.Response) -> Tuple[Dict, Dict]:
+    """Read a whole JSON body; the decoded dict is both the header and the result."""
+    data = _decode_json(response)
+    return data, data
+
+
+def _read_stream(response: requests.Response) -> Tuple[Dict, pd.DataFrame]:
     """
-    Fetch intraday time series data from Alpha Vantage API.
-    Falls back to demo data if API is unavailable.
+    Stream a JSON body straight into column buffers.
+    A truncated or unexpected body yields no frame, and the caller falls back
+    to a regular JSON request.
+    """
+    size_hint = int(response.headers.get('Content-Length') or 0)
+    chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+    try:
+        df, header = stream_parser.parse_stream(chunks, size_hint)
+    except ValueError as e:
+        print(f"Could not parse streamed response: {str(e)}")
+        return {}, None
+    finally:
+        response.close()
+    return header, df
+
+
+def _read_csv(response: requests.Response) -> Tuple[Dict, Optional[pd.DataFrame]]:
+    """
+    Read a datatype=csv body into a frame.
+    Alpha Vantage still answers errors and rate limit notes with JSON, which is
+    returned as the header so the usual checks apply. A body that cannot be
+    parsed yields no frame, and the caller falls back to a JSON request.
+    """
+    if response.content.lstrip()[:1] == b"{":
+        return _decode_json(response), None
+    try:
+        return {}, parse_csv(response.content)
+    except (ValueError, KeyError) as e:
+        print(f"Could not parse CSV response: {str(e)}")
+        return {}, None
+
+
+def _rejects_symbol(message: str, month: Optional[str], datatype: str) -> bool:
+    """
+    Tell whether an "Error Message" answer means the symbol does not exist.
+    Alpha Vantage words every bad parameter as "Invalid API call", so it only
+    points at the symbol for a plain JSON request without a month slice.
+    """
+    return month is None and datatype == "json" and str(message).startswith("Invalid API call")
+
+
+def _request_intraday(symbol: str, interval: str, api_key: str, priority: int, outputsize: str,
+                      read_body: Callable[[requests.Response], Tuple[Dict, Any]], stream: bool = False,
+                      month: Optional[str] = None, datatype: str = "json") -> Tuple[Any, bool]:
+    """
+    Send a TIME_SERIES_INTRADAY request and read its body with read_body.
+    Shared error handling for the JSON and streaming fetch paths. Symbols known
+    to be invalid and calls made while the circuit is open go straight to the
+    demo fallback without touching the network.
     
-    Args:
-        symbol: Stock symbol (e.g., 'IBM', 'AAPL')
-        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
-        api_key: Alpha Vantage API key
-        
     Returns:
-        Tuple of (JSON response dict or None, is_demo_data boolean)
+        Tuple of (read_body result or None, is_demo_data boolean)
     """
+    if market_cache.is_invalid_symbol(symbol):
+        print(f"Invalid symbol: {symbol} (cached). Using demo data for {symbol}.")
+        return None, True
+    if not circuit_breaker.allow_request():
+        print(f"Alpha Vantage is unavailable (circuit open). Using demo data for {symbol}.")
+        return None, True
+    
     try:
+        if not rate_limiter.acquire(priority):
+            if priority != rate_limiter.PRIORITY_INTERACTIVE:
+                raise rate_limiter.RequestDeferred(f"Deferred background fetch for {symbol}")
+            raise ValueError("API rate limit reached. Using demo data instead.")
+        
         params = {
             "function": "TIME_SERIES_INTRADAY",
             "symbol": symbol,
             "interval": interval,
-            "outputsize": "full",
+            "outputsize": outputsize,
             "apikey": api_key
         }
+        if month:
+            params["month"] = month
+        if datatype != "json":
+            params["datatype"] = datatype
         
-        response = requests.get(config.ALPHA_VANTAGE_BASE_URL, params=params, timeout=10)
+        # The breaker counts every attempt, so retries stop once it opens
+        response = http_client.get(config.ALPHA_VANTAGE_BASE_URL, params=params, stream=stream,
+                                   on_failure=circuit_breaker.record_attempt_failure)
         response.raise_for_status()
+        circuit_breaker.record_success()
         
-        data = response.json()
+        data, result = read_body(response)
         
         # Check for API error messages
         if "Error Message" in data:
+            if not _rejects_symbol(data["Error Message"], month, datatype):
+                raise ValueError(f"API error: {data['Error Message']}")
+            market_cache.mark_invalid_symbol(symbol)
             raise ValueError(f"Invalid symbol: {symbol}")
-        if "Note" in data:
+        # "Information" carries the daily limit and premium-only answers
+        if "Note" in data or "Information" in data:
+            rate_limiter.drain()
             raise ValueError("API rate limit reached. Using demo data instead.")
             
-        return data, False
+        return result, False
         
+    except rate_limiter.RequestDeferred:
+        raise
     except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 401:
+        status_code = e.response.status_code if e.response is not None else None
+        # Server errors were counted per attempt; 4xx answers prove the upstream is up
+        if status_code is not None and status_code < 500:
+            circuit_breaker.record_success()
+        if status_code == 401:
             print(f"Invalid API key. Using demo data for {symbol}.")
-        elif e.response.status_code == 429:
+        elif status_code == 429:
+            rate_limiter.drain()
             print(f"API rate limit exceeded. Using demo data for {symbol}.")
         else:
             print(f"HTTP error occurred: {e}. Using demo data for {symbol}.")
@@ -61,6 +182,130 @@ def fetch_intraday_data(symbol: str, interval: str, api_key: str = config.ALPHA_
         return None, True
 
 
+def fetch_intraday_data(symbol: str, interval: str, api_key: str = config.ALPHA_VANTAGE_API_KEY,
+                        priority: int = rate_limiter.PRIORITY_INTERACTIVE,
+                        outputsize: str = "full", month: Optional[str] = None) -> Tuple[Optional[Dict], bool]:
+    """
+    Fetch intraday time series data from Alpha Vantage API.
+    Falls back to demo data if API is unavailable.
+    
+    Args:
+        symbol: Stock symbol (e.g., 'IBM', 'AAPL')
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        api_key: Alpha Vantage API key
+        priority: Rate limiter priority (PRIORITY_INTERACTIVE for the viewed symbol)
+        outputsize: 'full' for the whole history, 'compact' for the latest 100 bars
+        month: Historical month slice as 'YYYY-MM' (latest window if None)
+        
+    Returns:
+        Tuple of (JSON response dict or None, is_demo_data boolean)
+        
+    Raises:
+        RequestDeferred: if a background fetch could not get a rate limit token
+    """
+    return _request_intraday(symbol, interval, api_key, priority, outputsize, _read_json, month=month)
+
+
+def fetch_intraday_frame(symbol: str, interval: str, api_key: str = config.ALPHA_VANTAGE_API_KEY,
+                         priority: int = rate_limiter.PRIORITY_INTERACTIVE,
+                         outputsize: str = "full", month: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], bool]:
+    """
+    Fetch intraday data with streaming ingestion.
+    The body is parsed chunk by chunk into column buffers, so a large full
+    history is never materialized as a JSON dict. Falls back to a regular
+    JSON request if the streamed body cannot be parsed.
+    
+    Args:
+        symbol: Stock symbol (e.g., 'IBM', 'AAPL')
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        api_key: Alpha Vantage API key
+        priority: Rate limiter priority (PRIORITY_INTERACTIVE for the viewed symbol)
+        outputsize: 'full' for the whole history, 'compact' for the latest 100 bars
+        month: Historical month slice as 'YYYY-MM' (latest window if None)
+        
+    Returns:
+        Tuple of (DataFrame or None, is_demo_data boolean)
+        
+    Raises:
+        RequestDeferred: if a background fetch could not get a rate limit token
+    """
+    df, is_demo = _request_intraday(symbol, interval, api_key, priority, outputsize,
+                                    _read_stream, stream=True, month=month)
+    if df is not None or is_demo:
+        return df, is_demo
+
+    response, is_demo = fetch_intraday_data(symbol, interval, api_key, priority, outputsize, month)
+    if response is None:
+        return None, is_demo
+    return parse_time_series(response), is_demo
+
+
+def fetch_intraday_csv(symbol: str, interval: str, api_key: str = config.ALPHA_VANTAGE_API_KEY,
+                       priority: int = rate_limiter.PRIORITY_INTERACTIVE,
+                       outputsize: str = "full", month: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], bool]:
+    """
+    Fetch intraday data in the CSV wire format.
+    CSV bodies are a fraction of the size of the nested JSON and are parsed
+    column by column. Falls back to a JSON request if the CSV body cannot be used.
+    
+    Args:
+        symbol: Stock symbol (e.g., 'IBM', 'AAPL')
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        api_key: Alpha Vantage API key
+        priority: Rate limiter priority (PRIORITY_INTERACTIVE for the viewed symbol)
+        outputsize: 'full' for the whole history, 'compact' for the latest 100 bars
+        month: Historical month slice as 'YYYY-MM' (latest window if None)
+        
+    Returns:
+        Tuple of (DataFrame or None, is_demo_data boolean)
+        
+    Raises:
+        RequestDeferred: if a background fetch could not get a rate limit token
+    """
+    df, is_demo = _request_intraday(symbol, interval, api_key, priority, outputsize, _read_csv,
+                                    month=month, datatype="csv")
+    if df is not None or is_demo:
+        return df, is_demo
+
+    response, is_demo = fetch_intraday_data(symbol, interval, api_key, priority, outputsize, month)
+    if response is None:
+        return None, is_demo
+    return parse_time_series(response), is_demo
+
+
+def parse_csv(content: bytes) -> pd.DataFrame:
+    """
+    Parse a datatype=csv TIME_SERIES_INTRADAY body.
+    
+    Args:
+        content: Raw body with a timestamp,open,high,low,close,volume header
+        
+    Returns:
+        DataFrame shaped like parse_time_series output
+        
+    Raises:
+        ValueError: if the body is not an intraday CSV
+    """
+    raw = pd.read_csv(io.BytesIO(content), engine=CSV_ENGINE)
+    missing = [column for column in CSV_COLUMNS if column not in raw.columns]
+    if missing:
+        raise ValueError(f"CSV response is missing columns: {', '.join(missing)}")
+    if raw.empty:
+        return pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume'])
+    
+    # The pyarrow reader already types the timestamps; the C reader leaves strings
+    timestamps = raw['timestamp'].to_numpy()
+    if timestamps.dtype.kind != 'M':
+        timestamps = np.array(timestamps, dtype='datetime64[s]')
+    return _assemble_frame(pd.DatetimeIndex(timestamps.astype('datetime64[ns]')), {
+        'open': raw['open'].to_numpy(dtype=np.float64),
+        'high': raw['high'].to_numpy(dtype=np.float64),
+        'low': raw['low'].to_numpy(dtype=np.float64),
+        'close': raw['close'].to_numpy(dtype=np.float64),
+        'volume': raw['volume'].to_numpy(dtype=np.int64)
+    })
+
+
 def parse_time_series(response: Optional[Dict], symbol: str = None, interval: str = None) -> pd.DataFrame:
     """
     Convert API response to pandas DataFrame.
@@ -93,26 +338,382 @@ def parse_time_series(response: Optional[Dict], symbol: str = None, interval: st
             return demo_data.generate_demo_stock_data(symbol, interval)
         return pd.DataFrame()
     
-    time_series = response[time_series_key]
+    return _build_frame(response[time_series_key])
+
+
+def _apply_dtype_mode(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cache frames with compact dtypes when COMPACT_FRAMES is set.
+    Applied only when a frame enters the market cache; the bar store always
+    receives the full float64 prices.
+    """
+    return frame_dtypes.compact(df) if config.COMPACT_FRAMES else df
+
+
+def _build_frame(time_series: Dict) -> pd.DataFrame:
+    """
+    Build a typed, sorted OHLCV frame from a "Time Series (...)" object.
+    All field strings are converted in a single NumPy pass instead of
+    going through a dict-of-dicts DataFrame and per-column to_numeric calls.
+    """
+    if not time_series:
+        return pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume'])
+    
+    rows = len(time_series)
+    fields = chain.from_iterable(map(_get_bar_fields, time_series.values()))
+    values = np.fromiter(fields, dtype=np.float64, count=rows * 5).reshape(rows, 5)
+    # Keys are fixed "YYYY-MM-DD HH:MM:SS" strings, which NumPy parses natively
+    timestamps = pd.DatetimeIndex(np.array(list(time_series.keys()), dtype='datetime64[s]').astype('datetime64[ns]'))
+    
+    return _assemble_frame(timestamps, {
+        'open': values[:, 0],
+        'high': values[:, 1],
+        'low': values[:, 2],
+        'close': values[:, 3],
+        'volume': values[:, 4].astype(np.int64)
+    })
+
+
+def _assemble_frame(timestamps: pd.DatetimeIndex, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Sort parsed OHLCV columns by timestamp and wrap them in a frame."""
+    # Alpha Vantage lists newest bars first, so a reversal is usually enough
+    order: Union[slice, np.ndarray]
+    if timestamps.is_monotonic_decreasing:
+        order = slice(None, None, -1)
+    elif timestamps.is_monotonic_increasing:
+        order = slice(None)
+    else:
+        order = np.argsort(timestamps.asi8, kind='stable')
+    
+    index = timestamps[order]
+    index.name = 'timestamp'
+    
+    return pd.DataFrame({name: values[order] for name, values in columns.items()}, index=index)
+
+
+def merge_bars(existing: pd.DataFrame, update: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    Merge a compact update into the existing frame.
+    Bars the update shares with the existing frame replace them, so a bar that
+    was still forming when it was first fetched is corrected.
+    
+    Args:
+        existing: Cached DataFrame sorted by timestamp
+        update: Parsed compact response sorted by timestamp
+        
+    Returns:
+        Merged DataFrame, or None if the update does not overlap the existing
+        frame and a full reload is needed to close the gap
+    """
+    if existing.empty:
+        return None
+    if update.empty:
+        return existing
+    
+    if update.index[0] > existing.index[-1]:
+        return None
+    
+    # Only the overlapping tail needs de-duplicating; the update wins on shared timestamps
+    start = existing.index.searchsorted(update.index[0])
+    tail = pd.concat([existing.iloc[start:], update])
+    tail = tail[~tail.index.duplicated(keep='last')].sort_index(kind='stable')
+    return pd.concat([existing.iloc[:start], tail])
+
+
+def _refresh_incrementally(symbol: str, interval: str, api_key: str, priority: int,
+                           existing: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    Top up an expired frame with a compact fetch.
+    
+    Returns:
+        Refreshed DataFrame, the existing frame if the API is unavailable,
+        or None if a gap was detected and a full reload is needed
+    """
+    update, is_demo = _fetch_frame(symbol, interval, api_key, priority, outputsize="compact")
+    if is_demo:
+        # Keep serving the real bars we already have rather than switching to demo data
+        return existing
+    
+    return merge_bars(existing, update if update is not None else pd.DataFrame())
+
+
+def _uses_bar_store() -> bool:
+    """Check whether the bar store is enabled for the active provider's data."""
+    return config.BAR_STORE_ENABLED and providers.get_provider().persistent
+
+
+def _persist(symbol: str, interval: str, df: pd.DataFrame):
+    """Append real bars to the on-disk bar store, if enabled."""
+    if not _uses_bar_store():
+        return
+    try:
+        bar_store.append(symbol, interval, df)
+    except OSError as e:
+        print(f"Could not write bars for {symbol} to the bar store: {str(e)}")
+
+
+def _read_stored(symbol: str, interval: str) -> pd.DataFrame:
+    """Read bars persisted by an earlier process, if enabled."""
+    if not _uses_bar_store():
+        return pd.DataFrame()
+    try:
+        return bar_store.read(symbol, interval)
+    except (OSError, ValueError) as e:
+        print(f"Could not read bars for {symbol} from the bar store: {str(e)}")
+        return pd.DataFrame()
+
+
+def _fetch_frame(symbol: str, interval: str, api_key: str, priority: int,
+                 outputsize: str = "full") -> Tuple[Optional[pd.DataFrame], bool]:
+    """Fetch a parsed frame from the active provider, in its preferred wire format."""
+    provider = providers.get_provider()
+    df, is_demo = provider.fetch_intraday_frame(symbol, interval, api_key, priority,
+                                                outputsize=outputsize)
+    return df, is_demo
+
+
+def _load_full(symbol: str, interval: str, api_key: str, priority: int) -> Tuple[pd.DataFrame, bool]:
+    """Fetch and parse the full history from the active provider."""
+    df, is_demo = _fetch_frame(symbol, interval, api_key, priority)
+    if df is None or df.empty:
+        # Same demo fallback parse_time_series applies to a missing time series
+        return parse_time_series(None, symbol, interval), True
+    return df, is_demo
+
+
+def _reload(symbol: str, interval: str, api_key: str, priority: int,
+            existing: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, bool]:
+    """
+    Load a frame into the cache, topping up existing real bars when possible
+    and falling back to the full history on a gap.
+    
+    Returns:
+        Tuple of (cached DataFrame, is_demo_data boolean)
+    """
+    if existing is not None:
+        df = _refresh_incrementally(symbol, interval, api_key, priority, existing)
+        if df is not None:
+            _persist(symbol, interval, df)
+            return market_cache.put(symbol, interval, _apply_dtype_mode(df), False), False
     
-    # Convert to DataFrame
-    df = pd.DataFrame.from_dict(time_series, orient='index')
+    df, is_demo = _load_full(symbol, interval, api_key, priority)
+    if df.empty:
+        return df, is_demo
+    if not is_demo:
+        _persist(symbol, interval, df)
+    return market_cache.put(symbol, interval, _apply_dtype_mode(df), is_demo), is_demo
+
+
+def get_intraday_frame(symbol: str, interval: str, api_key: str = config.ALPHA_VANTAGE_API_KEY,
+                       priority: int = rate_limiter.PRIORITY_INTERACTIVE,
+                       allow_stale: bool = False) -> Tuple[pd.DataFrame, bool]:
+    """
+    Get a parsed intraday frame through the process-wide market data cache.
+    Only fetches from the API when no fresh frame is cached for (symbol, interval),
+    and concurrent callers missing the same key share one fetch. Expired frames
+    are topped up with a compact fetch; a full reload only happens on a gap.
+    Bars persisted in the bar store by an earlier process are served at once
+    and topped up in the background.
     
-    # Rename columns
-    df.columns = ['open', 'high', 'low', 'close', 'volume']
+    Args:
+        symbol: Stock symbol (e.g., 'IBM', 'AAPL')
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        api_key: Alpha Vantage API key
+        priority: Rate limiter priority (PRIORITY_BACKGROUND for watchlist refreshes)
+        allow_stale: Return an expired frame immediately and refresh it in the background
+        
+    Returns:
+        Tuple of (DataFrame shared with other sessions, is_demo_data boolean);
+        with LOCAL_RESAMPLING, coarser intervals are derived from the 1-min frame
+        
+    Raises:
+        RequestDeferred: if a background fetch could not get a rate limit token
+    """
+    if config.LOCAL_RESAMPLING and interval != BASE_INTERVAL:
+        return _get_resampled_frame(symbol, interval, api_key, priority, allow_stale)
     
-    # Convert index to datetime
-    df.index = pd.to_datetime(df.index)
-    df.index.name = 'timestamp'
+    cached = market_cache.get(symbol, interval)
+    if cached is not None:
+        return cached
     
-    # Convert columns to numeric
-    df['open'] = pd.to_numeric(df['open'])
-    df['high'] = pd.to_numeric(df['high'])
-    df['low'] = pd.to_numeric(df['low'])
-    df['close'] = pd.to_numeric(df['close'])
-    df['volume'] = pd.to_numeric(df['volume'])
+    if allow_stale:
+        stale = market_cache.peek(symbol, interval)
+        if stale is not None:
+            background_refresher.schedule(
+                (symbol, interval),
+                lambda: get_intraday_frame(symbol, interval, api_key, priority)
+            )
+            return stale
     
-    # Sort by timestamp
-    df = df.sort_index()
+    def load() -> Tuple[pd.DataFrame, bool]:
+        # Another caller may have filled the cache since our lookup
+        cached = market_cache.get(symbol, interval)
+        if cached is not None:
+            return cached
+        
+        stale = market_cache.peek(symbol, interval)
+        if stale is None:
+            stored = _read_stored(symbol, interval)
+            if not stored.empty:
+                # Serve the bars on disk now and fetch the newer ones in the background;
+                # cache them first so the top-up cannot be overwritten by them
+                df = market_cache.put(symbol, interval, _apply_dtype_mode(stored), False)
+                background_refresher.schedule(
+                    (symbol, interval),
+                    lambda: _reload(symbol, interval, api_key,
+                                    rate_limiter.PRIORITY_BACKGROUND, stored)
+                )
+                return df, False
+        
+        # Expired real data only needs its newest bars
+        existing = stale[0] if stale is not None and not stale[1] else None
+        return _reload(symbol, interval, api_key, priority, existing)
+    
+    # Concurrent misses for the same key wait on a single upstream fetch
+    try:
+        (df, is_demo), shared = single_flight.do((symbol, interval), load)
+    except rate_limiter.RequestDeferred:
+        # Only background loads defer; an interactive caller that waited on one retries itself
+        if priority != rate_limiter.PRIORITY_INTERACTIVE:
+            raise
+        (df, is_demo), shared = single_flight.do((symbol, interval), load)
+    if shared and not df.empty:
+        df = df.copy(deep=False)
+    
+    return df, is_demo
+
+
+def get_intraday_window(symbol: str, interval: str, start: Optional[str] = None, end: Optional[str] = None,
+                        last: Optional[str] = None, api_key: str = config.ALPHA_VANTAGE_API_KEY,
+                        priority: int = rate_limiter.PRIORITY_INTERACTIVE,
+                        allow_stale: bool = False) -> Tuple[pd.DataFrame, bool]:
+    """
+    Get part of a cached intraday frame, found by binary search on its timestamps.
+    
+    Args:
+        symbol: Stock symbol (e.g., 'IBM', 'AAPL')
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        start: First timestamp to include, e.g. '2024-01-05 09:30'
+        end: Last timestamp to include
+        last: Window counted back from the latest bar, e.g. '4h' (overrides start/end)
+        api_key: Alpha Vantage API key
+        priority: Rate limiter priority
+        allow_stale: Serve an expired frame while it refreshes (see get_intraday_frame)
+        
+    Returns:
+        Tuple of (view of the shared frame, is_demo_data boolean)
+    """
+    df, is_demo = get_intraday_frame(symbol, interval, api_key, priority, allow_stale)
+    if last is not None:
+        return time_window.last(df, last), is_demo
+    return time_window.window(df, start, end), is_demo
+
+
+_resamplers_lock = threading.Lock()
+_resamplers: Dict[Tuple[str, str, bool], resampler.Resampler] = {}
+
+
+def _drop_resamplers(symbol: str, interval: str):
+    """Forget the resamplers fed by a 1-min frame that left the market cache."""
+    if interval != BASE_INTERVAL:
+        return
+    with _resamplers_lock:
+        for key in [key for key in _resamplers if key[0] == symbol]:
+            del _resamplers[key]
+
+
+market_cache.add_removal_listener(_drop_resamplers)
+
+
+def _get_resampled_frame(symbol: str, interval: str, api_key: str, priority: int,
+                         allow_stale: bool) -> Tuple[pd.DataFrame, bool]:
+    """
+    Derive a coarser frame from the cached 1-min frame.
+    One Resampler per (symbol, interval) folds in only the 1-min bars that
+    arrived since the last call, so switching intervals costs no API call.
+    """
+    base, is_demo = get_intraday_frame(symbol, BASE_INTERVAL, api_key, priority, allow_stale)
+    if base.empty:
+        return base, is_demo
     
-    return df
+    key = (symbol, interval, is_demo)
+    with _resamplers_lock:
+        series = _resamplers.get(key)
+        if series is None or series.first_source_time is None or base.index[0] < series.first_source_time:
+            # First use, or a reload reaching further back than the bars folded so far
+            series = resampler.Resampler(interval)
+            _resamplers[key] = series
+        df = series.update(base)
+    return df.copy(deep=False), is_demo
+
+
+def fetch_many(symbols: List[str], interval: str, api_key: str = config.ALPHA_VANTAGE_API_KEY,
+               priority: int = rate_limiter.PRIORITY_BACKGROUND, max_workers: Optional[int] = None) -> Dict[str, Dict]:
+    """
+    Fetch and parse several symbols concurrently on a bounded thread pool.
+    Every fetch goes through the shared cache, coalescing and rate limiter,
+    so a failure or deferral for one symbol does not affect the others.
+    
+    Args:
+        symbols: Stock symbols to load
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        api_key: Alpha Vantage API key
+        priority: Rate limiter priority (background by default)
+        max_workers: Thread pool size (defaults to FETCH_MANY_WORKERS)
+        
+    Returns:
+        Dictionary mapping each symbol to {'df', 'is_demo', 'error'}; 'df' is None
+        and 'error' holds the reason when the symbol could not be loaded
+    """
+    unique_symbols = list(dict.fromkeys(symbols))
+    if not unique_symbols:
+        return {}
+    
+    workers = min(max_workers or config.FETCH_MANY_WORKERS, len(unique_symbols))
+    
+    def load(symbol: str) -> Dict:
+        try:
+            df, is_demo = get_intraday_frame(symbol, interval, api_key, priority)
+            return {'df': df, 'is_demo': is_demo, 'error': None}
+        except rate_limiter.RequestDeferred as e:
+            return {'df': None, 'is_demo': False, 'error': str(e)}
+        except Exception as e:
+            return {'df': None, 'is_demo': False, 'error': f"Error occurred: {str(e)}"}
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch-many") as executor:
+        results = executor.map(load, unique_symbols)
+        return dict(zip(unique_symbols, results))
+
+
+def warm_many(symbols: List[str], interval: str,
+              api_key: str = config.ALPHA_VANTAGE_API_KEY) -> Dict[str, Dict]:
+    """
+    Get the cached frames of several symbols without waiting on any fetch.
+    Expired frames are served as is and refreshed in the background; symbols
+    with nothing cached are loaded by the background refresher for a later call.
+    
+    Args:
+        symbols: Stock symbols to warm
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        api_key: Alpha Vantage API key
+        
+    Returns:
+        Dictionary mapping each symbol to {'df', 'is_demo', 'error'} like fetch_many;
+        'df' is None while the symbol is still loading
+    """
+    cache_interval = BASE_INTERVAL if config.LOCAL_RESAMPLING else interval
+    results = {}
+    for symbol in dict.fromkeys(symbols):
+        if market_cache.peek(symbol, cache_interval) is not None:
+            df, is_demo = get_intraday_frame(symbol, interval, api_key,
+                                             rate_limiter.PRIORITY_BACKGROUND, allow_stale=True)
+            results[symbol] = {'df': df, 'is_demo': is_demo, 'error': None}
+            continue
+        
+        background_refresher.schedule(
+            (symbol, interval),
+            partial(get_intraday_frame, symbol, interval, api_key,
+                    rate_limiter.PRIORITY_BACKGROUND)
+        )
+        results[symbol] = {'df': None, 'is_demo': False, 'error': "Loading in the background"}
+    return results
@@ -0,0 +1,166 @@
+# Historical Backfill Module
+# Pulls month-sliced intraday history in parallel into the bar store
+#
+# Usage:
+#   python -m src.services.backfill IBM 1min 2024-01 2024-06
+
+import argparse
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+from src import config
+from src.services import api_service, bar_store, providers, rate_limiter
+
+
+_lock = threading.Lock()
+
+
+def month_range(start_month: str, end_month: str) -> List[str]:
+    """
+    List the months between two 'YYYY-MM' strings, inclusive.
+
+    Args:
+        start_month: First month ('YYYY-MM')
+        end_month: Last month ('YYYY-MM')
+
+    Returns:
+        List of 'YYYY-MM' strings in chronological order
+
+    Raises:
+        ValueError: if a month is malformed or start is after end
+    """
+    start = datetime.strptime(start_month, "%Y-%m")
+    end = datetime.strptime(end_month, "%Y-%m")
+    if start > end:
+        raise ValueError(f"Start month {start_month} is after end month {end_month}")
+
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def _manifest_path(symbol: str, interval: str, root: Optional[str] = None) -> str:
+    """Path of the file listing the completed months of a series."""
+    return os.path.join(root or config.BAR_STORE_DIR, symbol.upper(), f"{interval}.backfill.json")
+
+
+def get_completed_months(symbol: str, interval: str, root: Optional[str] = None) -> Set[str]:
+    """
+    Get the months already backfilled for a series.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval
+        root: Store directory (defaults to BAR_STORE_DIR)
+
+    Returns:
+        Set of 'YYYY-MM' strings
+    """
+    path = _manifest_path(symbol, interval, root)
+    if not os.path.exists(path):
+        return set()
+    with open(path, 'r', encoding='utf-8') as f:
+        return set(json.load(f).get('completed_months', []))
+
+
+def _mark_completed(symbol: str, interval: str, month: str, root: Optional[str] = None):
+    """Add a month to the manifest, replacing the file atomically."""
+    path = _manifest_path(symbol, interval, root)
+    completed = get_completed_months(symbol, interval, root)
+    completed.add(month)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    staging = path + ".tmp"
+    with open(staging, 'w', encoding='utf-8') as f:
+        json.dump({'completed_months': sorted(completed)}, f, indent=2)
+    os.replace(staging, path)
+
+
+def backfill(symbol: str, interval: str, start_month: str, end_month: Optional[str] = None,
+             api_key: str = config.ALPHA_VANTAGE_API_KEY, max_workers: Optional[int] = None,
+             root: Optional[str] = None) -> Dict:
+    """
+    Download month slices of intraday history in parallel and merge them into the bar store.
+    Months listed in the manifest are skipped, so an interrupted run resumes where it
+    stopped. The current month is stored but never marked complete, since it still grows.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        start_month: First month to backfill ('YYYY-MM')
+        end_month: Last month to backfill (defaults to the current month)
+        api_key: Alpha Vantage API key
+        max_workers: Thread pool size (defaults to BACKFILL_WORKERS)
+        root: Store directory (defaults to BAR_STORE_DIR)
+
+    Returns:
+        Dictionary with 'fetched', 'skipped' and 'failed' (month -> reason) months
+        and the number of 'bars_written'
+    """
+    current_month = datetime.now().strftime("%Y-%m")
+    months = month_range(start_month, end_month or current_month)
+    done = get_completed_months(symbol, interval, root)
+    pending = [month for month in months if month not in done]
+
+    skipped = [month for month in months if month in done]
+    fetched: List[str] = []
+    failed: Dict[str, str] = {}
+    bars_written = 0
+    if not pending:
+        return {'fetched': fetched, 'skipped': skipped, 'failed': failed, 'bars_written': bars_written}
+
+    def load(month: str):
+        response, is_demo = providers.get_provider().fetch_intraday(
+            symbol, interval, api_key, rate_limiter.PRIORITY_BATCH, outputsize="full", month=month
+        )
+        if is_demo:
+            raise ValueError("API unavailable or rate limited")
+        df = api_service.parse_time_series(response)
+        if df.empty:
+            raise ValueError("No bars returned")
+
+        # Writes are serialized; only the downloads run in parallel
+        with _lock:
+            written = bar_store.merge(symbol, interval, df, root=root)
+            if month < current_month:
+                _mark_completed(symbol, interval, month, root)
+        return written
+
+    workers = min(max_workers or config.BACKFILL_WORKERS, len(pending))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backfill") as executor:
+        futures = {month: executor.submit(load, month) for month in pending}
+        for month, future in futures.items():
+            try:
+                bars_written += future.result()
+                fetched.append(month)
+            except Exception as e:
+                failed[month] = str(e)
+
+    return {'fetched': fetched, 'skipped': skipped, 'failed': failed, 'bars_written': bars_written}
+
+
+def main(argv=None):
+    """Run a backfill from the command line."""
+    parser = argparse.ArgumentParser(description="Backfill month-sliced intraday history into the bar store")
+    parser.add_argument("symbol")
+    parser.add_argument("interval", choices=config.TIME_INTERVALS)
+    parser.add_argument("start_month", help="First month, YYYY-MM")
+    parser.add_argument("end_month", nargs="?", help="Last month, YYYY-MM (default: current month)")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    summary = backfill(args.symbol, args.interval, args.start_month, args.end_month, max_workers=args.workers)
+    print(f"Fetched: {', '.join(summary['fetched']) or '-'}")
+    print(f"Skipped: {', '.join(summary['skipped']) or '-'}")
+    for month, reason in summary['failed'].items():
+        print(f"Failed:  {month} ({reason})")
+    print(f"Bars written: {summary['bars_written']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Background Refresher Module
+# Re-fetches stale cache keys off the request path (stale-while-revalidate)
+
+import queue
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Set
+from src import config
+
+
+_lock = threading.Lock()
+_queue: "queue.Queue" = queue.Queue()
+_pending: Set[Hashable] = set()
+_workers: List[threading.Thread] = []
+_stats = {'scheduled': 0, 'skipped': 0, 'refreshed': 0, 'failed': 0}
+
+
+def _run():
+    """Worker loop: run queued refreshes one at a time."""
+    while True:
+        key, refresh = _queue.get()
+        try:
+            refresh()
+            with _lock:
+                _stats['refreshed'] += 1
+        except Exception as e:
+            with _lock:
+                _stats['failed'] += 1
+            print(f"Background refresh failed for {key}: {str(e)}")
+        finally:
+            with _lock:
+                _pending.discard(key)
+            _queue.task_done()
+
+
+def _ensure_workers():
+    """Start the worker threads on first use."""
+    if _workers:
+        return
+    for number in range(config.BACKGROUND_REFRESH_WORKERS):
+        worker = threading.Thread(target=_run, name=f"background-refresher-{number}", daemon=True)
+        worker.start()
+        _workers.append(worker)
+
+
+def schedule(key: Hashable, refresh: Callable[[], Any]) -> bool:
+    """
+    Queue a refresh for a key unless one is already pending.
+
+    Args:
+        key: Identity of the refreshed data (e.g., (symbol, interval))
+        refresh: Zero-argument function that reloads the data into the cache
+
+    Returns:
+        True if the refresh was queued, False if one was already pending
+    """
+    with _lock:
+        if key in _pending:
+            _stats['skipped'] += 1
+            return False
+        _pending.add(key)
+        _stats['scheduled'] += 1
+        _ensure_workers()
+    _queue.put((key, refresh))
+    return True
+
+
+def is_pending(key: Hashable) -> bool:
+    """
+    Check if a refresh is queued or running for a key.
+
+    Args:
+        key: Identity of the refreshed data
+
+    Returns:
+        True if a refresh is pending
+    """
+    with _lock:
+        return key in _pending
+
+
+def wait_idle():
+    """Block until every queued refresh has finished (used by tests and benchmarks)."""
+    _queue.join()
+
+
+def get_stats() -> Dict:
+    """
+    Get refresher statistics.
+
+    Returns:
+        Dictionary with scheduled/skipped/refreshed/failed counters and pending count
+    """
+    with _lock:
+        return {**_stats, 'pending': len(_pending)}
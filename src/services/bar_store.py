@@ -0,0 +1,242 @@
+# Bar Store Module
+# Persistent on-disk columnar store of parsed bars, one directory per symbol/interval
+
+import os
+import shutil
+import threading
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from src import config
+
+
+# Column name -> on-disk dtype; each column is a raw little-endian array file
+COLUMNS = {
+    'timestamp': np.dtype('<i8'),  # datetime64[ns] as int64
+    'open': np.dtype('<f8'),
+    'high': np.dtype('<f8'),
+    'low': np.dtype('<f8'),
+    'close': np.dtype('<f8'),
+    'volume': np.dtype('<i8')
+}
+
+_lock = threading.Lock()
+
+
+def _series_dir(symbol: str, interval: str, root: Optional[str] = None) -> str:
+    """Directory holding the column files for one symbol/interval."""
+    return os.path.join(root or config.BAR_STORE_DIR, symbol.upper(), interval)
+
+
+def _column_path(directory: str, column: str) -> str:
+    """Path of a column file."""
+    return os.path.join(directory, f"{column}.bin")
+
+
+def _row_count(directory: str) -> int:
+    """
+    Count the complete rows of a series.
+    Lengths are clipped to the shortest column so a torn append is ignored.
+    """
+    rows: Optional[int] = None
+    for column, dtype in COLUMNS.items():
+        path = _column_path(directory, column)
+        if not os.path.exists(path):
+            return 0
+        column_rows = os.path.getsize(path) // dtype.itemsize
+        if rows is None or column_rows < rows:
+            rows = column_rows
+    return rows or 0
+
+
+def _open_columns(directory: str) -> Optional[Dict[str, np.ndarray]]:
+    """Memory-map every column of a series read-only."""
+    rows = _row_count(directory)
+    if rows == 0:
+        return None
+
+    return {
+        column: np.memmap(_column_path(directory, column), dtype=dtype, mode='r', shape=(rows,))
+        for column, dtype in COLUMNS.items()
+    }
+
+
+def get_last_timestamp(symbol: str, interval: str, root: Optional[str] = None) -> Optional[pd.Timestamp]:
+    """
+    Get the timestamp of the newest stored bar.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval
+        root: Store directory (defaults to BAR_STORE_DIR)
+
+    Returns:
+        Timestamp of the last bar, or None if nothing is stored
+    """
+    columns = _open_columns(_series_dir(symbol, interval, root))
+    if columns is None:
+        return None
+    return pd.Timestamp(int(columns['timestamp'][-1]))
+
+
+def read(symbol: str, interval: str, start: Optional[pd.Timestamp] = None,
+         root: Optional[str] = None) -> pd.DataFrame:
+    """
+    Read stored bars into a DataFrame shaped like parse_time_series output.
+    Only the rows at or after start are paged in from disk.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval
+        start: Earliest timestamp to return (all bars if None)
+        root: Store directory (defaults to BAR_STORE_DIR)
+
+    Returns:
+        DataFrame with columns: open, high, low, close, volume (empty if nothing is stored)
+    """
+    columns = _open_columns(_series_dir(symbol, interval, root))
+    if columns is None:
+        return pd.DataFrame()
+
+    timestamps = columns['timestamp']
+    first = 0
+    if start is not None:
+        first = int(np.searchsorted(timestamps, pd.Timestamp(start).value, side='left'))
+
+    index = pd.DatetimeIndex(np.array(timestamps[first:]).view('datetime64[ns]'), name='timestamp')
+    df = pd.DataFrame(
+        {column: np.array(columns[column][first:]) for column in ['open', 'high', 'low', 'close', 'volume']},
+        index=index
+    )
+    return df
+
+
+def _rewrite_last_bar(directory: str, bar: pd.Series):
+    """Overwrite the prices and volume of the newest stored bar in place."""
+    row = _row_count(directory) - 1
+    for column in ['open', 'high', 'low', 'close', 'volume']:
+        dtype = COLUMNS[column]
+        with open(_column_path(directory, column), 'r+b') as f:
+            f.seek(row * dtype.itemsize)
+            f.write(np.asarray([bar[column]], dtype=dtype).tobytes())
+
+
+def append(symbol: str, interval: str, df: pd.DataFrame, root: Optional[str] = None) -> int:
+    """
+    Append the bars of a parsed frame that are newer than the stored tail.
+    A bar at the stored tail's timestamp replaces it, e.g. once a bar that was
+    still forming has closed.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval
+        df: Parsed DataFrame sorted by timestamp
+        root: Store directory (defaults to BAR_STORE_DIR)
+
+    Returns:
+        Number of bars written
+    """
+    if df.empty:
+        return 0
+
+    directory = _series_dir(symbol, interval, root)
+    with _lock:
+        last_timestamp = get_last_timestamp(symbol, interval, root)
+        if last_timestamp is not None and last_timestamp in df.index:
+            _rewrite_last_bar(directory, df.loc[last_timestamp])
+        new_bars = df if last_timestamp is None else df[df.index > last_timestamp]
+        if new_bars.empty:
+            return 0
+
+        os.makedirs(directory, exist_ok=True)
+
+        # Cut every column back to the complete rows so a torn append cannot misalign them
+        rows = _row_count(directory)
+        for column, dtype in COLUMNS.items():
+            path = _column_path(directory, column)
+            if os.path.exists(path) and os.path.getsize(path) != rows * dtype.itemsize:
+                os.truncate(path, rows * dtype.itemsize)
+
+        arrays = {'timestamp': new_bars.index.as_unit('ns').asi8}
+        for column in ['open', 'high', 'low', 'close', 'volume']:
+            arrays[column] = new_bars[column].to_numpy()
+
+        # Timestamps go last so a partial append never exposes bars without prices
+        for column in ['open', 'high', 'low', 'close', 'volume', 'timestamp']:
+            with open(_column_path(directory, column), 'ab') as f:
+                f.write(np.ascontiguousarray(arrays[column], dtype=COLUMNS[column]).tobytes())
+
+        return len(new_bars)
+
+
+def _write_columns(directory: str, df: pd.DataFrame):
+    """Write a whole frame as fresh column files."""
+    os.makedirs(directory, exist_ok=True)
+    arrays = {'timestamp': df.index.as_unit('ns').asi8}
+    for column in ['open', 'high', 'low', 'close', 'volume']:
+        arrays[column] = df[column].to_numpy()
+    for column, dtype in COLUMNS.items():
+        with open(_column_path(directory, column), 'wb') as f:
+            f.write(np.ascontiguousarray(arrays[column], dtype=dtype).tobytes())
+
+
+def merge(symbol: str, interval: str, df: pd.DataFrame, root: Optional[str] = None) -> int:
+    """
+    Merge bars from anywhere in time into the stored series.
+    Unlike append, this accepts history older than the stored tail (e.g., a
+    backfilled month). The series is rewritten into a temporary directory and
+    swapped in, so readers never see a half-written merge.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval
+        df: Parsed DataFrame
+        root: Store directory (defaults to BAR_STORE_DIR)
+
+    Returns:
+        Number of bars that were not stored before
+    """
+    if df.empty:
+        return 0
+
+    directory = _series_dir(symbol, interval, root)
+    with _lock:
+        existing = read(symbol, interval, root=root)
+        bars = df[['open', 'high', 'low', 'close', 'volume']]
+        combined = pd.concat([existing, bars]) if not existing.empty else bars
+        combined = combined[~combined.index.duplicated(keep='first')].sort_index()
+        added = len(combined) - len(existing)
+        if added == 0:
+            return 0
+
+        staging = directory + ".tmp"
+        retired = directory + ".old"
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.rmtree(retired, ignore_errors=True)
+        _write_columns(staging, combined)
+
+        if os.path.isdir(directory):
+            os.replace(directory, retired)
+        os.replace(staging, directory)
+        shutil.rmtree(retired, ignore_errors=True)
+
+        return added
+
+
+def delete(symbol: str, interval: str, root: Optional[str] = None):
+    """
+    Remove every stored bar for a symbol/interval, with its directory.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval
+        root: Store directory (defaults to BAR_STORE_DIR)
+    """
+    directory = _series_dir(symbol, interval, root)
+    with _lock:
+        shutil.rmtree(directory, ignore_errors=True)
+        # Drop the symbol directory too once its last interval is gone
+        try:
+            os.rmdir(os.path.dirname(directory))
+        except OSError:
+            pass
@@ -0,0 +1,123 @@
+# Circuit Breaker Module
+# Short-circuits Alpha Vantage calls to the demo fallback while the upstream is down
+
+import threading
+import time
+from typing import Dict, Optional
+from src import config
+
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+_lock = threading.Lock()
+_state = STATE_CLOSED
+_consecutive_failures = 0
+_opened_at = 0.0
+_probe_started_at: Optional[float] = None
+_stats = {'allowed': 0, 'short_circuited': 0, 'failures': 0, 'successes': 0, 'trips': 0}
+
+
+def allow_request() -> bool:
+    """
+    Check whether a request may go upstream.
+    While open, requests are rejected until CIRCUIT_RESET_TIMEOUT has passed;
+    then a single probe is let through (half-open). A probe that never reports
+    back is replaced after another CIRCUIT_RESET_TIMEOUT.
+
+    Returns:
+        True if the caller should send the request
+    """
+    global _state, _probe_started_at
+    now = time.monotonic()
+    with _lock:
+        if _state == STATE_OPEN and now - _opened_at >= config.CIRCUIT_RESET_TIMEOUT:
+            _state = STATE_HALF_OPEN
+            _probe_started_at = None
+
+        if _state == STATE_HALF_OPEN:
+            probe_running = (_probe_started_at is not None
+                             and now - _probe_started_at < config.CIRCUIT_RESET_TIMEOUT)
+            if not probe_running:
+                _probe_started_at = now
+                _stats['allowed'] += 1
+                return True
+        elif _state == STATE_CLOSED:
+            _stats['allowed'] += 1
+            return True
+
+        _stats['short_circuited'] += 1
+        return False
+
+
+def record_success():
+    """Record that the upstream answered; closes the circuit."""
+    global _state, _consecutive_failures, _probe_started_at
+    with _lock:
+        _stats['successes'] += 1
+        _consecutive_failures = 0
+        _state = STATE_CLOSED
+        _probe_started_at = None
+
+
+def record_failure():
+    """Record a timeout, connection error or 5xx; opens the circuit past the threshold."""
+    global _state, _consecutive_failures, _opened_at, _probe_started_at
+    with _lock:
+        _stats['failures'] += 1
+        _consecutive_failures += 1
+        if _state == STATE_HALF_OPEN or _consecutive_failures >= config.CIRCUIT_FAILURE_THRESHOLD:
+            if _state != STATE_OPEN:
+                _stats['trips'] += 1
+            _state = STATE_OPEN
+            _opened_at = time.monotonic()
+            _probe_started_at = None
+
+
+def record_attempt_failure() -> bool:
+    """
+    Record one failed attempt of a request that is being retried.
+    Meant as the http_client.get on_failure callback, so the breaker counts
+    every attempt and the retries stop as soon as the circuit opens.
+
+    Returns:
+        True if the caller may keep retrying
+    """
+    record_failure()
+    with _lock:
+        return _state != STATE_OPEN
+
+
+def get_state() -> str:
+    """
+    Get the current circuit state.
+
+    Returns:
+        STATE_CLOSED, STATE_OPEN or STATE_HALF_OPEN
+    """
+    with _lock:
+        return _state
+
+
+def get_stats() -> Dict:
+    """
+    Get circuit breaker statistics.
+
+    Returns:
+        Dictionary with state, consecutive failures and counters
+    """
+    with _lock:
+        return {**_stats, 'state': _state, 'consecutive_failures': _consecutive_failures}
+
+
+def reset():
+    """Close the circuit and reset statistics."""
+    global _state, _consecutive_failures, _opened_at, _probe_started_at
+    with _lock:
+        _state = STATE_CLOSED
+        _consecutive_failures = 0
+        _opened_at = 0.0
+        _probe_started_at = None
+        for name in _stats:
+            _stats[name] = 0
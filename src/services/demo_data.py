@@ -1,112 +1,230 @@
 # Demo Data Generator
 # Provides fallback data when API is unavailable or rate limited
 
+import zlib
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional
+from src import config
 
 
-def generate_demo_stock_data(symbol: str, interval: str, days: int = 7) -> pd.DataFrame:
+MARKET_OPEN_MINUTE = 9 * 60 + 30   # 9:30 AM
+MARKET_CLOSE_MINUTE = 16 * 60      # 4:00 PM
+
+# Base prices for different stocks
+BASE_PRICES = {
+    'IBM': 150.0,
+    'AAPL': 175.0,
+    'MSFT': 380.0,
+    'GOOGL': 140.0,
+    'AMZN': 145.0,
+    'TSLA': 240.0,
+    'META': 320.0
+}
+
+TREND_RANGE = 0.0001  # Slight upward or downward trend per interval
+VOLATILITY = 0.002  # 0.2% volatility per interval
+
+INTERVAL_MINUTES = {
+    '1min': 1,
+    '5min': 5,
+    '15min': 15,
+    '30min': 30,
+    '60min': 60
+}
+
+
+def market_timestamps(minutes: int, count: int, end: datetime) -> pd.DatetimeIndex:
+    """
+    Build the last `count` bar timestamps of weekday market hours up to `end`.
+    Each session holds bars stepping back from 4:00 PM to 9:30 AM.
+    
+    Args:
+        minutes: Bar length in minutes
+        count: Number of timestamps
+        end: Latest allowed timestamp
+        
+    Returns:
+        Ascending DatetimeIndex named 'timestamp'
+    """
+    offsets = np.arange(MARKET_CLOSE_MINUTE, MARKET_OPEN_MINUTE - 1, -minutes)[::-1]
+    if count <= 0:
+        return pd.DatetimeIndex([], dtype='datetime64[ns]', name='timestamp')
+    
+    # One extra session covers a partial or not-yet-open current day
+    sessions = -(-count // len(offsets)) + 1
+    last = pd.Timestamp(end)
+    days = pd.bdate_range(end=last.normalize(), periods=sessions).values.astype('datetime64[m]')
+    grid = (days[:, None] + offsets[None, :].astype('timedelta64[m]')).ravel()
+    grid = grid[grid <= np.datetime64(last.floor('min').to_datetime64(), 'm')]
+    
+    return pd.DatetimeIndex(grid[-count:].astype('datetime64[ns]'), name='timestamp')
+
+
+def market_timestamps_after(minutes: int, count: int, after: datetime) -> pd.DatetimeIndex:
+    """
+    Build the next `count` bar timestamps of weekday market hours after `after`.
+    
+    Args:
+        minutes: Bar length in minutes
+        count: Number of timestamps
+        after: Timestamps are strictly later than this
+        
+    Returns:
+        Ascending DatetimeIndex named 'timestamp'
+    """
+    offsets = np.arange(MARKET_CLOSE_MINUTE, MARKET_OPEN_MINUTE - 1, -minutes)[::-1]
+    if count <= 0:
+        return pd.DatetimeIndex([], dtype='datetime64[ns]', name='timestamp')
+    
+    # One extra session covers the rest of the current day
+    sessions = -(-count // len(offsets)) + 1
+    start = pd.Timestamp(after)
+    days = pd.bdate_range(start=start.normalize(), periods=sessions).values.astype('datetime64[m]')
+    grid = (days[:, None] + offsets[None, :].astype('timedelta64[m]')).ravel()
+    grid = grid[grid > np.datetime64(start.to_datetime64(), 'ns')]
+    
+    return pd.DatetimeIndex(grid[:count].astype('datetime64[ns]'), name='timestamp')
+
+
+def symbol_seed(symbol: str) -> int:
+    """
+    Stable random seed for a symbol.
+    Unlike hash(), CRC-32 gives the same value in every process.
+    
+    Args:
+        symbol: Stock symbol
+        
+    Returns:
+        Seed for numpy.random.default_rng
+    """
+    return zlib.crc32(symbol.upper().encode())
+
+
+def resolve_anchor(anchor: Optional[datetime] = None) -> pd.Timestamp:
+    """
+    Pick the time demo data ends at.
+    
+    Args:
+        anchor: Explicit end time (defaults to DEMO_DATA_ANCHOR, then the current minute)
+        
+    Returns:
+        Timestamp floored to the minute
+    """
+    if anchor is not None:
+        return pd.Timestamp(anchor).floor('min')
+    return pd.Timestamp(config.DEMO_DATA_ANCHOR or datetime.now()).floor('min')
+
+
+def generate_demo_stock_data(symbol: str, interval: str, days: int = 7,
+                             anchor: Optional[datetime] = None) -> pd.DataFrame:
     """
     Generate realistic demo stock data for testing and fallback.
+    Output depends only on (symbol, interval, days, anchor), so it is identical
+    across processes and memoized after the first call.
     
     Args:
         symbol: Stock symbol (e.g., 'IBM', 'AAPL')
         interval: Time interval ('1min', '5min', '15min', '30min', '60min')
         days: Number of days of historical data to generate
+        anchor: Time the data ends at (defaults to DEMO_DATA_ANCHOR, then now)
         
     Returns:
         DataFrame with columns: timestamp, open, high, low, close, volume
     """
-    # Base prices for different stocks
-    base_prices = {
-        'IBM': 150.0,
-        'AAPL': 175.0,
-        'MSFT': 380.0,
-        'GOOGL': 140.0,
-        'AMZN': 145.0,
-        'TSLA': 240.0,
-        'META': 320.0
-    }
-    
-    base_price = base_prices.get(symbol, 100.0)
+    df = _generate(symbol, interval, days, resolve_anchor(anchor))
+    # Callers get their own frame object over the memoized columns
+    return df.copy(deep=False)
+
+
+@lru_cache(maxsize=64)
+def _generate(symbol: str, interval: str, days: int, anchor: pd.Timestamp) -> pd.DataFrame:
+    """Build the demo frame for one key; results are memoized."""
+    base_price = BASE_PRICES.get(symbol, 100.0)
     
     # Determine number of data points based on interval
-    interval_minutes = {
-        '1min': 1,
-        '5min': 5,
-        '15min': 15,
-        '30min': 30,
-        '60min': 60
-    }
-    
-    minutes = interval_minutes.get(interval, 5)
+    minutes = INTERVAL_MINUTES.get(interval, 5)
     points_per_day = (6.5 * 60) // minutes  # Market hours: 9:30 AM - 4:00 PM EST
     total_points = int(points_per_day * days)
     
     # Generate timestamps (market hours only)
-    end_time = datetime.now()
-    timestamps = []
-    current_time = end_time
-    
-    for _ in range(total_points):
-        # Skip weekends
-        while current_time.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            current_time -= timedelta(days=1)
-        
-        # Keep within market hours (9:30 AM - 4:00 PM)
-        if current_time.hour < 9 or (current_time.hour == 9 and current_time.minute < 30):
-            current_time = current_time.replace(hour=16, minute=0)
-            current_time -= timedelta(days=1)
-        elif current_time.hour >= 16:
-            current_time = current_time.replace(hour=16, minute=0)
-        
-        timestamps.append(current_time)
-        current_time -= timedelta(minutes=minutes)
-    
-    timestamps.reverse()
+    timestamps = market_timestamps(minutes, total_points, anchor)
     
-    # Generate realistic price data with trends and volatility
-    np.random.seed(hash(symbol) % 2**32)  # Consistent data for same symbol
+    # Local generator: consistent data for the same symbol, global RNG state untouched
+    rng = np.random.default_rng(symbol_seed(symbol))
     
     # Generate returns with trend and volatility
-    trend = np.random.uniform(-0.0001, 0.0001)  # Slight upward or downward trend
-    volatility = 0.002  # 0.2% volatility per interval
+    trend = rng.uniform(-TREND_RANGE, TREND_RANGE)
     
-    returns = np.random.normal(trend, volatility, len(timestamps))
+    return _build_ohlcv(timestamps, base_price, trend, VOLATILITY, rng)
+
+
+def symbol_trend(symbol: str) -> float:
+    """
+    Per-bar drift of a symbol's demo random walk.
     
-    # Calculate prices from returns
-    prices = base_price * np.exp(np.cumsum(returns))
-    
-    # Generate OHLC data
-    data = []
-    for i, (timestamp, close) in enumerate(zip(timestamps, prices)):
-        # Add some intraday volatility
-        high_factor = 1 + abs(np.random.normal(0, 0.003))
-        low_factor = 1 - abs(np.random.normal(0, 0.003))
-        
-        open_price = prices[i-1] if i > 0 else close
-        high = max(open_price, close) * high_factor
-        low = min(open_price, close) * low_factor
+    Args:
+        symbol: Stock symbol
         
-        # Generate volume (higher volume on larger price moves)
-        price_change = abs(close - open_price) / open_price
-        base_volume = np.random.uniform(1_000_000, 5_000_000)
-        volume = int(base_volume * (1 + price_change * 10))
+    Returns:
+        Mean log return per bar
+    """
+    return np.random.default_rng(symbol_seed(symbol)).uniform(-TREND_RANGE, TREND_RANGE)
+
+
+def clear_cache():
+    """Drop memoized demo frames."""
+    _generate.cache_clear()
+
+
+def _build_ohlcv(timestamps: pd.DatetimeIndex, base_price: float, trend: float, volatility: float,
+                 rng: np.random.Generator) -> pd.DataFrame:
+    """Draw a random walk of closes and derive OHLCV bars from it in bulk."""
+    returns = rng.normal(trend, volatility, len(timestamps))
+    return pd.DataFrame(ohlcv_from_returns(returns, base_price, rng), index=timestamps)
+
+
+def ohlcv_from_returns(returns: np.ndarray, start_price, rng: np.random.Generator,
+                       previous_close=None) -> Dict[str, np.ndarray]:
+    """
+    Turn per-bar log returns into demo OHLCV columns.
+    Works on one series (1-D) or many aligned series (2-D, time along axis 0).
+    
+    Args:
+        returns: Log returns per bar
+        start_price: Price the walk starts from (scalar or one per series)
+        rng: Generator for the intraday range and volume draws
+        previous_close: Close before the first bar, to continue an earlier walk
+            (defaults to the first close, i.e. a flat first bar)
         
-        data.append({
-            'timestamp': timestamp,
-            'open': round(open_price, 2),
-            'high': round(high, 2),
-            'low': round(low, 2),
-            'close': round(close, 2),
-            'volume': volume
-        })
-    
-    df = pd.DataFrame(data)
-    df.set_index('timestamp', inplace=True)
-    
-    return df
+    Returns:
+        Dictionary of open, high, low, close (rounded to cents) and volume arrays
+    """
+    shape = returns.shape
+    
+    # Calculate prices from returns
+    close = start_price * np.exp(np.cumsum(returns, axis=0))
+    open_price = np.empty(shape)
+    open_price[:1] = close[:1] if previous_close is None else previous_close
+    open_price[1:] = close[:-1]
+    
+    # Add some intraday volatility
+    high = np.maximum(open_price, close) * (1 + np.abs(rng.normal(0, 0.003, shape)))
+    low = np.minimum(open_price, close) * (1 - np.abs(rng.normal(0, 0.003, shape)))
+    
+    # Generate volume (higher volume on larger price moves)
+    price_change = np.abs(close - open_price) / open_price
+    volume = (rng.uniform(1_000_000, 5_000_000, shape) * (1 + price_change * 10)).astype(np.int64)
+    
+    return {
+        'open': np.round(open_price, 2),
+        'high': np.round(high, 2),
+        'low': np.round(low, 2),
+        'close': np.round(close, 2),
+        'volume': volume
+    }
 
 
 def get_demo_data_message(symbol: str) -> str:
@@ -0,0 +1,187 @@
+# HTTP Client Module
+# Pooled keep-alive session with retries for the Alpha Vantage service layer
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from src import config
+
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_latencies_ms: Deque[float] = deque(maxlen=1000)
+_stats: Dict[str, int] = {'requests': 0, 'attempts': 0, 'retries': 0, 'failures': 0}
+
+
+def _create_session() -> requests.Session:
+    """Create a session whose adapters keep up to HTTP_POOL_SIZE connections alive per host."""
+    session = requests.Session()
+    # Retries are handled here with jittered backoff, not by urllib3
+    adapter = HTTPAdapter(
+        pool_connections=config.HTTP_POOL_SIZE,
+        pool_maxsize=config.HTTP_POOL_SIZE,
+        max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide pooled session, creating it on first use.
+
+    Returns:
+        Shared requests Session
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _create_session()
+        return _session
+
+
+def get_backoff_delay(attempt: int) -> float:
+    """
+    Get the sleep time before a retry using exponential backoff with full jitter.
+
+    Args:
+        attempt: Zero-based retry number
+
+    Returns:
+        Delay in seconds
+    """
+    cap = min(config.HTTP_BACKOFF_MAX, config.HTTP_BACKOFF_BASE * (2 ** attempt))
+    return random.uniform(0, cap)
+
+
+def _record_attempt(started: float):
+    """Record the latency of a single HTTP attempt."""
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    with _lock:
+        _stats['attempts'] += 1
+        _latencies_ms.append(elapsed_ms)
+
+
+def _is_last_attempt(attempt: int, on_failure: Optional[Callable[[], bool]]) -> bool:
+    """Report a failed attempt and decide whether it is the last one."""
+    keep_trying = on_failure() if on_failure is not None else True
+    return attempt == config.HTTP_MAX_RETRIES or not keep_trying
+
+
+def get(url: str, params: Optional[Dict] = None, timeout: Optional[float] = None,
+        stream: bool = False, on_failure: Optional[Callable[[], bool]] = None) -> requests.Response:
+    """
+    Send a GET request through the pooled session.
+    Retries 5xx responses, timeouts and connection errors with backoff.
+
+    Args:
+        url: Request URL
+        params: Query parameters
+        timeout: Per-attempt timeout in seconds (defaults to HTTP_TIMEOUT)
+        stream: Leave the body unread so the caller can consume it in chunks
+        on_failure: Called after every failed attempt; returning False stops
+            retrying (e.g. once a circuit breaker has opened)
+
+    Returns:
+        Response of the last attempt (callers still check the status code)
+
+    Raises:
+        requests.exceptions.Timeout, requests.exceptions.ConnectionError:
+            if every attempt failed at the transport level
+    """
+    session = get_session()
+    timeout = config.HTTP_TIMEOUT if timeout is None else timeout
+
+    with _lock:
+        _stats['requests'] += 1
+
+    for attempt in range(config.HTTP_MAX_RETRIES + 1):
+        started = time.perf_counter()
+        try:
+            response = session.get(url, params=params, timeout=timeout, stream=stream)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            _record_attempt(started)
+            if _is_last_attempt(attempt, on_failure):
+                with _lock:
+                    _stats['failures'] += 1
+                raise
+        else:
+            _record_attempt(started)
+            if response.status_code < 500:
+                return response
+            if _is_last_attempt(attempt, on_failure):
+                with _lock:
+                    _stats['failures'] += 1
+                return response
+            response.close()
+
+        with _lock:
+            _stats['retries'] += 1
+        time.sleep(get_backoff_delay(attempt))
+
+    # The last attempt always returns or raises above
+    raise RuntimeError("HTTP retry loop exited without a response")
+
+
+def _count_connections() -> int:
+    """Count the TCP connections opened by the session's connection pools."""
+    if _session is None:
+        return 0
+
+    opened = 0
+    # The same adapter is mounted for both schemes; count it once
+    adapters = {id(adapter): adapter for adapter in _session.adapters.values()}
+    for adapter in adapters.values():
+        if not isinstance(adapter, HTTPAdapter):
+            continue
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            try:
+                opened += pools[key].num_connections
+            except KeyError:
+                # Pool was evicted between listing and lookup
+                continue
+    return opened
+
+
+def get_stats() -> Dict:
+    """
+    Get request latency and connection reuse statistics.
+
+    Returns:
+        Dictionary with request counts, latency summary (ms) and connection reuse
+    """
+    with _lock:
+        stats: Dict[str, float] = dict(_stats)
+        latencies = sorted(_latencies_ms)
+
+    connections = _count_connections()
+    stats['connections_opened'] = connections
+    stats['connections_reused'] = max(0, stats['attempts'] - connections)
+    stats['reuse_rate'] = round(stats['connections_reused'] / stats['attempts'], 4) if stats['attempts'] else 0.0
+
+    if latencies:
+        stats['avg_latency_ms'] = round(sum(latencies) / len(latencies), 2)
+        stats['p50_latency_ms'] = round(latencies[len(latencies) // 2], 2)
+        stats['p95_latency_ms'] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2)
+    else:
+        stats['avg_latency_ms'] = stats['p50_latency_ms'] = stats['p95_latency_ms'] = 0.0
+
+    return stats
+
+
+def reset():
+    """Close the pooled session and reset statistics."""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _latencies_ms.clear()
+        for name in _stats:
+            _stats[name] = 0
@@ -0,0 +1,109 @@
+# Live Bar Simulator
+# Extends demo series with new bars as (real or accelerated) time passes
+
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+from src import config
+from src.services import demo_data
+
+
+class _Series:
+    """Simulation state of one (symbol, interval) series."""
+
+    def __init__(self, frame: pd.DataFrame, trend: float, rng: np.random.Generator):
+        self.frame = frame
+        self.trend = trend
+        self.rng = rng
+        self.last_close = float(frame['close'].iloc[-1]) if not frame.empty else 100.0
+        self.emitted = 0
+
+
+class LiveSimulator:
+    """
+    Keeps per-symbol demo series and appends bars as simulated time passes.
+    History comes from demo_data ending at the anchor; each bar length of
+    simulated time then adds one bar on the next market-hours slot,
+    continuing the same random walk. Bars are produced lazily when a
+    series is read, so idle symbols cost nothing.
+    """
+
+    def __init__(self, speed: Optional[float] = None, history_days: int = 7,
+                 anchor: Optional[datetime] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            speed: Simulated seconds per real second (defaults to SIMULATOR_SPEED)
+            history_days: Days of demo history each series starts with
+            anchor: End of the starting history (defaults to DEMO_DATA_ANCHOR, then now)
+            clock: Monotonic time source in seconds
+        """
+        self.speed = speed if speed is not None else config.SIMULATOR_SPEED
+        self.history_days = history_days
+        self.anchor = demo_data.resolve_anchor(anchor)
+        self._clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+
+    def bars_due(self, interval: str) -> int:
+        """
+        Number of bars simulated time has produced since the simulator started.
+
+        Args:
+            interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+
+        Returns:
+            Bars due per series of this interval
+        """
+        elapsed = (self._clock() - self._started) * self.speed
+        return int(elapsed // (demo_data.INTERVAL_MINUTES.get(interval, 5) * 60))
+
+    def get_frame(self, symbol: str, interval: str) -> pd.DataFrame:
+        """
+        Get a series with every bar due so far.
+
+        Args:
+            symbol: Stock symbol
+            interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+
+        Returns:
+            DataFrame with columns: timestamp, open, high, low, close, volume
+        """
+        due = self.bars_due(interval)
+        with self._lock:
+            series = self._series.get((symbol, interval))
+            if series is None:
+                series = self._start_series(symbol, interval)
+                self._series[(symbol, interval)] = series
+            if due > series.emitted:
+                self._emit(series, interval, due - series.emitted)
+            return series.frame.copy(deep=False)
+
+    def _start_series(self, symbol: str, interval: str) -> _Series:
+        """Seed a series with demo history and a generator for its future bars."""
+        history = demo_data.generate_demo_stock_data(symbol, interval, self.history_days, self.anchor)
+        # Future bars depend only on the symbol and anchor, like the history
+        rng = np.random.default_rng((demo_data.symbol_seed(symbol), int(self.anchor.value // 60_000_000_000)))
+        return _Series(history, demo_data.symbol_trend(symbol), rng)
+
+    def _emit(self, series: _Series, interval: str, count: int):
+        """Append `count` bars to a series."""
+        minutes = demo_data.INTERVAL_MINUTES.get(interval, 5)
+        after = series.frame.index[-1] if not series.frame.empty else self.anchor
+        timestamps = demo_data.market_timestamps_after(minutes, count, after)
+
+        returns = series.rng.normal(series.trend, demo_data.VOLATILITY, count)
+        columns = demo_data.ohlcv_from_returns(returns, series.last_close, series.rng, series.last_close)
+        series.last_close *= float(np.exp(returns.sum()))
+
+        series.frame = pd.concat([series.frame, pd.DataFrame(columns, index=timestamps)])
+        series.emitted += count
+
+    def reset(self):
+        """Drop every series and restart simulated time."""
+        with self._lock:
+            self._series.clear()
+            self._started = self._clock()
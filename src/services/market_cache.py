@@ -0,0 +1,255 @@
+# Shared Market Data Cache Module
+# Process-wide cache of parsed frames shared by every Streamlit session
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+import pandas as pd
+from src import config
+from src.core import frame_dtypes, session_index
+
+
+_lock = threading.RLock()
+_entries: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+_total_bytes = 0
+_invalid_symbols: Dict[str, float] = {}
+_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'negative_hits': 0}
+_removal_listeners: List[Callable[[str, str], None]] = []
+
+
+def get_ttl(interval: str) -> int:
+    """
+    Get the time-to-live for a cached frame, tied to the bar interval.
+
+    Args:
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+
+    Returns:
+        TTL in seconds (one bar length)
+    """
+    return config.INTERVAL_MINUTES.get(interval, 5) * 60
+
+
+def _frame_size(df: pd.DataFrame) -> int:
+    """Estimate the number of bytes held by a frame, including its index and session labels."""
+    return int(df.memory_usage(index=True, deep=True).sum()) + session_index.BYTES_PER_BAR * len(df)
+
+
+def _shared_view(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Wrap a cached frame in a shallow copy.
+
+    The view shares the cached column arrays, so sessions can add columns
+    to it without growing the cached object, but must not write into the
+    existing values.
+    """
+    return df.copy(deep=False)
+
+
+def add_removal_listener(listener: Callable[[str, str], None]):
+    """
+    Register a function called with (symbol, interval) whenever a frame is
+    evicted, invalidated or cleared (but not when it is replaced by put).
+    Used to drop state derived from cached frames.
+
+    Args:
+        listener: Function of (symbol, interval); called with the cache lock held
+    """
+    with _lock:
+        if listener not in _removal_listeners:
+            _removal_listeners.append(listener)
+
+
+def _remove(key: Tuple[str, str], notify: bool = True):
+    """Drop an entry and release its size from the running total."""
+    global _total_bytes
+    entry = _entries.pop(key, None)
+    if entry is not None:
+        _total_bytes -= entry['size']
+        if notify:
+            for listener in _removal_listeners:
+                listener(*key)
+
+
+def get(symbol: str, interval: str) -> Optional[Tuple[pd.DataFrame, bool]]:
+    """
+    Look up a fresh frame in the shared cache.
+
+    Args:
+        symbol: Stock symbol (e.g., 'IBM', 'AAPL')
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+
+    Returns:
+        Tuple of (shared frame view, is_demo_data boolean), or None on a miss
+    """
+    key = (symbol, interval)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            _stats['misses'] += 1
+            return None
+
+        if time.time() >= entry['expires_at']:
+            _stats['misses'] += 1
+            _stats['expirations'] += 1
+            return None
+
+        _entries.move_to_end(key)
+        _stats['hits'] += 1
+        return _shared_view(entry['frame']), entry['is_demo']
+
+
+def peek(symbol: str, interval: str) -> Optional[Tuple[pd.DataFrame, bool]]:
+    """
+    Look up a frame even if it has expired, without touching counters or LRU order.
+    Used to refresh an entry incrementally instead of reloading it.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval
+
+    Returns:
+        Tuple of (shared frame view, is_demo_data boolean), or None if not cached
+    """
+    with _lock:
+        entry = _entries.get((symbol, interval))
+        if entry is None:
+            return None
+        return _shared_view(entry['frame']), entry['is_demo']
+
+
+def put(symbol: str, interval: str, df: pd.DataFrame, is_demo: bool = False) -> pd.DataFrame:
+    """
+    Store a parsed frame, evicting least recently used entries past the memory bound.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval
+        df: Parsed DataFrame to cache
+        is_demo: Whether the frame holds demo data
+
+    Returns:
+        Shared view of the cached frame
+    """
+    global _total_bytes
+    key = (symbol, interval)
+    # Label bars by session once per stored frame rather than on every rerun
+    session_index.attach(df)
+    size = _frame_size(df)
+    now = time.time()
+
+    with _lock:
+        _remove(key, notify=False)
+        _entries[key] = {
+            'frame': df,
+            'is_demo': is_demo,
+            'size': size,
+            'stored_at': now,
+            'expires_at': now + get_ttl(interval)
+        }
+        _total_bytes += size
+
+        # Evict oldest entries, but always keep the one just stored
+        while _total_bytes > config.MARKET_CACHE_MAX_BYTES and len(_entries) > 1:
+            oldest_key = next(iter(_entries))
+            _remove(oldest_key)
+            _stats['evictions'] += 1
+
+    return _shared_view(df)
+
+
+def mark_invalid_symbol(symbol: str):
+    """
+    Remember that the API rejected a symbol, for NEGATIVE_CACHE_TTL seconds.
+
+    Args:
+        symbol: Stock symbol reported as invalid
+    """
+    with _lock:
+        _invalid_symbols[symbol] = time.time() + config.NEGATIVE_CACHE_TTL
+
+
+def is_invalid_symbol(symbol: str) -> bool:
+    """
+    Check whether a symbol was recently rejected by the API.
+
+    Args:
+        symbol: Stock symbol
+
+    Returns:
+        True if the symbol is negatively cached
+    """
+    with _lock:
+        expires_at = _invalid_symbols.get(symbol)
+        if expires_at is None:
+            return False
+        if time.time() >= expires_at:
+            del _invalid_symbols[symbol]
+            return False
+        _stats['negative_hits'] += 1
+        return True
+
+
+def invalidate(symbol: str, interval: Optional[str] = None):
+    """
+    Remove cached frames for a symbol.
+
+    Args:
+        symbol: Stock symbol to invalidate
+        interval: Only invalidate this interval (all intervals if None)
+    """
+    with _lock:
+        for key in list(_entries.keys()):
+            if key[0] == symbol and (interval is None or key[1] == interval):
+                _remove(key)
+
+
+def clear():
+    """Remove every cached frame and reset the counters."""
+    global _total_bytes
+    with _lock:
+        for key in list(_entries.keys()):
+            _remove(key)
+        _invalid_symbols.clear()
+        _total_bytes = 0
+        for name in _stats:
+            _stats[name] = 0
+
+
+def get_stats() -> Dict:
+    """
+    Get cache statistics.
+
+    Returns:
+        Dictionary with hit/miss counters, entry count and memory usage
+    """
+    with _lock:
+        lookups = _stats['hits'] + _stats['misses']
+        return {
+            **_stats,
+            'hit_rate': round(_stats['hits'] / lookups, 4) if lookups else 0.0,
+            'entries': len(_entries),
+            'invalid_symbols': len(_invalid_symbols),
+            'total_bytes': _total_bytes,
+            'max_bytes': config.MARKET_CACHE_MAX_BYTES
+        }
+
+
+def memory_report() -> List[Dict]:
+    """
+    Report the memory held by each cached frame, largest first.
+    Compare runs with and without COMPACT_FRAMES to measure the per-frame saving.
+    
+    Returns:
+        List of frame_dtypes.memory_usage dictionaries with 'symbol',
+        'interval' and the 'cached_bytes' counted against MARKET_CACHE_MAX_BYTES
+    """
+    with _lock:
+        entries = list(_entries.items())
+    report = [
+        {'symbol': symbol, 'interval': interval, 'cached_bytes': entry['size'],
+         **frame_dtypes.memory_usage(entry['frame'])}
+        for (symbol, interval), entry in entries
+    ]
+    return sorted(report, key=lambda row: row['cached_bytes'], reverse=True)
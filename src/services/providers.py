@@ -0,0 +1,254 @@
+# Market Data Providers
+# Interchangeable sources of TIME_SERIES_INTRADAY responses behind one interface
+#
+# Usage:
+#   MARKET_DATA_PROVIDER=record streamlit run src/app.py   # capture real responses
+#   MARKET_DATA_PROVIDER=replay streamlit run src/app.py   # serve them back offline
+
+import gzip
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+import pandas as pd
+from src import config
+from src.services import api_service
+from src.services import live_simulator
+from src.services import rate_limiter
+
+
+class MarketDataProvider(ABC):
+    """
+    Base class for intraday data sources.
+    Subclasses return responses shaped like the Alpha Vantage JSON, so the
+    parsing, caching and persistence in api_service work unchanged.
+    """
+    name = "base"
+    label = "Unknown"
+    # Whether frames from this source belong in the on-disk bar store
+    persistent = True
+
+    @abstractmethod
+    def fetch_intraday(self, symbol: str, interval: str, api_key: str = config.ALPHA_VANTAGE_API_KEY,
+                       priority: int = rate_limiter.PRIORITY_INTERACTIVE, outputsize: str = "full",
+                       month: Optional[str] = None) -> Tuple[Optional[Dict], bool]:
+        """
+        Fetch an intraday time series.
+
+        Args:
+            symbol: Stock symbol (e.g., 'IBM', 'AAPL')
+            interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+            api_key: Alpha Vantage API key (ignored by offline providers)
+            priority: Rate limiter priority
+            outputsize: 'full' for the whole history, 'compact' for the latest 100 bars
+            month: Historical month slice as 'YYYY-MM' (latest window if None)
+
+        Returns:
+            Tuple of (response dict or None, is_demo_data boolean)
+        """
+
+    def fetch_intraday_frame(self, symbol: str, interval: str, api_key: str = config.ALPHA_VANTAGE_API_KEY,
+                             priority: int = rate_limiter.PRIORITY_INTERACTIVE, outputsize: str = "full",
+                             month: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], bool]:
+        """
+        Fetch an intraday time series as a parsed frame.
+        Providers that can parse while downloading override this.
+
+        Returns:
+            Tuple of (DataFrame or None, is_demo_data boolean)
+        """
+        response, is_demo = self.fetch_intraday(symbol, interval, api_key, priority, outputsize, month)
+        if response is None:
+            return None, is_demo
+        return api_service.parse_time_series(response), is_demo
+
+
+class AlphaVantageProvider(MarketDataProvider):
+    """The live Alpha Vantage API, with rate limiting, retries and the circuit breaker."""
+    name = "alpha_vantage"
+    label = "Alpha Vantage"
+
+    def fetch_intraday(self, symbol, interval, api_key=config.ALPHA_VANTAGE_API_KEY,
+                       priority=rate_limiter.PRIORITY_INTERACTIVE, outputsize="full", month=None):
+        return api_service.fetch_intraday_data(symbol, interval, api_key, priority,
+                                               outputsize=outputsize, month=month)
+
+    def fetch_intraday_frame(self, symbol, interval, api_key=config.ALPHA_VANTAGE_API_KEY,
+                             priority=rate_limiter.PRIORITY_INTERACTIVE, outputsize="full", month=None):
+        if config.ALPHA_VANTAGE_DATATYPE == "csv":
+            return api_service.fetch_intraday_csv(symbol, interval, api_key, priority,
+                                                  outputsize=outputsize, month=month)
+        if config.STREAMING_INGESTION:
+            return api_service.fetch_intraday_frame(symbol, interval, api_key, priority,
+                                                    outputsize=outputsize, month=month)
+        return super().fetch_intraday_frame(symbol, interval, api_key, priority, outputsize, month)
+
+
+class DemoProvider(MarketDataProvider):
+    """Simulated data only; never touches the network."""
+    name = "demo"
+    label = "Demo data generator"
+
+    def fetch_intraday(self, symbol, interval, api_key=config.ALPHA_VANTAGE_API_KEY,
+                       priority=rate_limiter.PRIORITY_INTERACTIVE, outputsize="full", month=None):
+        # api_service turns a missing response into demo data
+        return None, True
+
+
+class SimulatedProvider(MarketDataProvider):
+    """
+    Demo series that keep growing, from a LiveSimulator.
+    Frames are served like real data, so an expired cache entry is topped up
+    with the bars produced since, but they are never written to the bar store.
+    """
+    name = "simulated"
+    label = "Live bar simulator"
+    persistent = False
+
+    def __init__(self, simulator: Optional[live_simulator.LiveSimulator] = None):
+        """
+        Args:
+            simulator: Simulator to read from (defaults to one at SIMULATOR_SPEED)
+        """
+        self.simulator = simulator or live_simulator.LiveSimulator()
+
+    def fetch_intraday(self, symbol, interval, api_key=config.ALPHA_VANTAGE_API_KEY,
+                       priority=rate_limiter.PRIORITY_INTERACTIVE, outputsize="full", month=None):
+        # Simulated bars only exist as frames; raw responses fall back to demo data
+        return None, True
+
+    def fetch_intraday_frame(self, symbol, interval, api_key=config.ALPHA_VANTAGE_API_KEY,
+                             priority=rate_limiter.PRIORITY_INTERACTIVE, outputsize="full", month=None):
+        df = self.simulator.get_frame(symbol, interval)
+        if outputsize == "compact":
+            df = df.iloc[-100:]
+        return df, False
+
+
+class RecordReplayProvider(MarketDataProvider):
+    """
+    Captures responses to gzip-compressed JSON files and serves them back.
+    In record mode every real response from the upstream provider is written
+    to disk; in replay mode recordings are read once and then served from
+    memory, and a missing recording falls back to demo data. Replayed frames
+    are never written to the bar store.
+    """
+    name = "record_replay"
+    label = "Recorded responses"
+
+    def __init__(self, directory: Optional[str] = None, record: bool = False,
+                 upstream: Optional[MarketDataProvider] = None):
+        """
+        Args:
+            directory: Recordings directory (defaults to RECORDINGS_DIR)
+            record: Fetch from upstream and write recordings instead of replaying
+            upstream: Provider recorded from (defaults to AlphaVantageProvider)
+        """
+        self.directory = directory or config.RECORDINGS_DIR
+        self.record = record
+        # Recorded responses are live data; replayed ones stay out of the bar store
+        self.persistent = record
+        self.upstream = upstream or AlphaVantageProvider()
+        self._lock = threading.Lock()
+        self._responses: Dict[str, Dict] = {}
+
+    def recording_path(self, symbol: str, interval: str, outputsize: str = "full",
+                       month: Optional[str] = None) -> str:
+        """Path of the recording for one request."""
+        filename = f"{interval}-{outputsize}" + (f"-{month}" if month else "") + ".json.gz"
+        return os.path.join(self.directory, symbol.upper(), filename)
+
+    def fetch_intraday(self, symbol, interval, api_key=config.ALPHA_VANTAGE_API_KEY,
+                       priority=rate_limiter.PRIORITY_INTERACTIVE, outputsize="full", month=None):
+        path = self.recording_path(symbol, interval, outputsize, month)
+        if self.record:
+            response, is_demo = self.upstream.fetch_intraday(symbol, interval, api_key, priority, outputsize, month)
+            if response is not None and not is_demo:
+                self._save(path, response)
+            return response, is_demo
+
+        response = self._load(path)
+        if response is None:
+            print(f"No recording for {symbol} ({interval}, {outputsize}). Using demo data for {symbol}.")
+            return None, True
+        return response, False
+
+    def _save(self, path: str, response: Dict):
+        """Write a recording atomically and keep it in memory."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        staging = path + ".tmp"
+        with gzip.open(staging, 'wt', encoding='utf-8') as f:
+            json.dump(response, f)
+        os.replace(staging, path)
+        with self._lock:
+            self._responses[path] = response
+
+    def _load(self, path: str) -> Optional[Dict]:
+        """Read a recording, from memory after the first call."""
+        with self._lock:
+            response = self._responses.get(path)
+        if response is not None or not os.path.exists(path):
+            return response
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            response = json.load(f)
+        with self._lock:
+            self._responses[path] = response
+        return response
+
+
+_lock = threading.Lock()
+_provider: Optional[MarketDataProvider] = None
+
+
+def create_provider(name: str) -> MarketDataProvider:
+    """
+    Build a provider from its configuration name.
+
+    Args:
+        name: 'alpha_vantage', 'demo', 'simulated', 'record' or 'replay'
+
+    Returns:
+        New provider instance
+
+    Raises:
+        ValueError: if the name is unknown
+    """
+    if name == "alpha_vantage":
+        return AlphaVantageProvider()
+    if name == "demo":
+        return DemoProvider()
+    if name == "simulated":
+        return SimulatedProvider()
+    if name == "record":
+        return RecordReplayProvider(record=True)
+    if name == "replay":
+        return RecordReplayProvider()
+    raise ValueError(f"Unknown market data provider: {name}")
+
+
+def get_provider() -> MarketDataProvider:
+    """
+    Get the active provider, creating it from MARKET_DATA_PROVIDER on first use.
+
+    Returns:
+        Provider shared by the whole process
+    """
+    global _provider
+    with _lock:
+        if _provider is None:
+            _provider = create_provider(config.MARKET_DATA_PROVIDER)
+        return _provider
+
+
+def set_provider(provider: Optional[MarketDataProvider]):
+    """
+    Replace the active provider (None goes back to MARKET_DATA_PROVIDER).
+    Frames already in the market cache are kept; clear it to refetch.
+
+    Args:
+        provider: Provider to use from now on
+    """
+    global _provider
+    with _lock:
+        _provider = provider
@@ -0,0 +1,133 @@
+# Rate Limiter Module
+# Process-wide token bucket with a priority queue in front of every Alpha Vantage call
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from src import config
+
+
+# Lower values are served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+PRIORITY_BATCH = 2
+
+
+class RequestDeferred(Exception):
+    """Raised when low-priority work is deferred to preserve the API quota."""
+
+
+_cond = threading.Condition()
+_tokens = float(config.RATE_LIMIT_BURST)
+_last_refill = time.monotonic()
+_waiters: List[Tuple[int, int]] = []
+_sequence = itertools.count()
+_stats = {'granted': 0, 'timed_out': 0, 'queued': 0, 'drained': 0}
+
+
+def _refill_rate() -> float:
+    """Tokens added per second."""
+    return config.ALPHA_VANTAGE_REQUESTS_PER_MINUTE / 60.0
+
+
+def _refill():
+    """Add the tokens earned since the last refill, up to the burst size."""
+    global _tokens, _last_refill
+    now = time.monotonic()
+    _tokens = min(float(config.RATE_LIMIT_BURST), _tokens + (now - _last_refill) * _refill_rate())
+    _last_refill = now
+
+
+def acquire(priority: int = PRIORITY_INTERACTIVE, timeout: Optional[float] = None) -> bool:
+    """
+    Take one token, queueing behind higher-priority callers.
+    Background callers also leave RATE_LIMIT_BACKGROUND_RESERVE tokens untouched
+    so a user's request never waits on a watchlist refresh.
+
+    Args:
+        priority: PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND or PRIORITY_BATCH
+        timeout: Maximum seconds to wait (defaults to the priority's configured wait)
+
+    Returns:
+        True if a token was granted, False if the wait timed out
+    """
+    global _tokens
+    if timeout is None:
+        timeout = {
+            PRIORITY_INTERACTIVE: config.RATE_LIMIT_INTERACTIVE_WAIT,
+            PRIORITY_BATCH: config.RATE_LIMIT_BATCH_WAIT
+        }.get(priority, config.RATE_LIMIT_BACKGROUND_WAIT)
+    reserve = 0 if priority == PRIORITY_INTERACTIVE else config.RATE_LIMIT_BACKGROUND_RESERVE
+    needed = 1 + reserve
+    deadline = time.monotonic() + timeout
+
+    with _cond:
+        entry = (priority, next(_sequence))
+        heapq.heappush(_waiters, entry)
+        queued = False
+        try:
+            while True:
+                _refill()
+                if _waiters[0] == entry and _tokens >= needed:
+                    _tokens -= 1
+                    _stats['granted'] += 1
+                    return True
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    _stats['timed_out'] += 1
+                    return False
+
+                if not queued:
+                    _stats['queued'] += 1
+                    queued = True
+                wait = remaining
+                if _tokens < needed and _refill_rate() > 0:
+                    wait = min(wait, (needed - _tokens) / _refill_rate())
+                _cond.wait(wait)
+        finally:
+            _waiters.remove(entry)
+            heapq.heapify(_waiters)
+            _cond.notify_all()
+
+
+def drain():
+    """
+    Empty the bucket after the API reports the quota was exceeded.
+    Tokens then refill at the normal rate.
+    """
+    global _tokens
+    with _cond:
+        _refill()
+        _tokens = 0.0
+        _stats['drained'] += 1
+
+
+def get_stats() -> Dict:
+    """
+    Get rate limiter statistics.
+
+    Returns:
+        Dictionary with available tokens, queue length and counters
+    """
+    with _cond:
+        _refill()
+        return {
+            **_stats,
+            'tokens': round(_tokens, 2),
+            'waiting': len(_waiters),
+            'requests_per_minute': config.ALPHA_VANTAGE_REQUESTS_PER_MINUTE
+        }
+
+
+def reset():
+    """Refill the bucket and reset statistics."""
+    global _tokens, _last_refill
+    with _cond:
+        _tokens = float(config.RATE_LIMIT_BURST)
+        _last_refill = time.monotonic()
+        for name in _stats:
+            _stats[name] = 0
+        _cond.notify_all()
@@ -0,0 +1,91 @@
+# Single-Flight Request Coalescing Module
+# Concurrent callers for the same key share one in-flight call
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+_lock = threading.Lock()
+_in_flight: Dict[Hashable, "_Call"] = {}
+_stats = {'calls': 0, 'coalesced': 0}
+
+
+class _Call:
+    """An in-flight call whose outcome is shared by every waiter."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def do(key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+    """
+    Run fn once per key at a time.
+    The first caller for a key runs fn; concurrent callers for the same key
+    block until it finishes and receive the same result or exception.
+
+    Args:
+        key: Identity of the call (e.g., (symbol, interval))
+        fn: Zero-argument function doing the actual work
+
+    Returns:
+        Tuple of (result, shared boolean - True if this caller waited on another)
+    """
+    with _lock:
+        call = _in_flight.get(key)
+        if call is not None:
+            _stats['coalesced'] += 1
+            leader = False
+        else:
+            call = _Call()
+            _in_flight[key] = call
+            _stats['calls'] += 1
+            leader = True
+
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result, True
+
+    try:
+        call.result = fn()
+    except BaseException as e:
+        call.error = e
+        raise
+    finally:
+        with _lock:
+            del _in_flight[key]
+        call.done.set()
+
+    return call.result, False
+
+
+def in_flight_count() -> int:
+    """
+    Get the number of keys currently being fetched.
+
+    Returns:
+        Number of in-flight calls
+    """
+    with _lock:
+        return len(_in_flight)
+
+
+def get_stats() -> Dict:
+    """
+    Get coalescing statistics.
+
+    Returns:
+        Dictionary with executed calls and coalesced waiters
+    """
+    with _lock:
+        return dict(_stats)
+
+
+def reset_stats():
+    """Reset coalescing statistics."""
+    with _lock:
+        for name in _stats:
+            _stats[name] = 0
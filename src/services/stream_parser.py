@@ -0,0 +1,147 @@
+# Streaming Time Series Parser Module
+# Parses an Alpha Vantage intraday response chunk by chunk into preallocated column buffers
+
+import codecs
+import json
+import re
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+# Approximate size of one pretty-printed bar, used to size buffers from Content-Length
+BYTES_PER_BAR = 170
+DEFAULT_CAPACITY = 1024
+
+_SERIES_KEY = re.compile(r'"Time Series[^"]*"\s*:\s*\{')
+_BAR = re.compile(
+    r'\s*,?\s*"([^"]+)"\s*:\s*\{\s*'
+    r'"1\. open"\s*:\s*"([^"]*)"\s*,\s*'
+    r'"2\. high"\s*:\s*"([^"]*)"\s*,\s*'
+    r'"3\. low"\s*:\s*"([^"]*)"\s*,\s*'
+    r'"4\. close"\s*:\s*"([^"]*)"\s*,\s*'
+    r'"5\. volume"\s*:\s*"([^"]*)"\s*\}'
+)
+_SERIES_END = re.compile(r'\s*,?\s*\}')
+
+
+class _ColumnBuffers:
+    """Growable timestamp and OHLCV arrays filled in place."""
+
+    def __init__(self, capacity: int):
+        self.timestamps = np.empty(capacity, dtype='datetime64[s]')
+        self.values = np.empty((capacity, 5), dtype=np.float64)
+        self.size = 0
+
+    def _grow(self, needed: int):
+        capacity = max(needed, len(self.timestamps) * 2)
+        timestamps = np.empty(capacity, dtype='datetime64[s]')
+        values = np.empty((capacity, 5), dtype=np.float64)
+        timestamps[:self.size] = self.timestamps[:self.size]
+        values[:self.size] = self.values[:self.size]
+        self.timestamps, self.values = timestamps, values
+
+    def extend(self, bars: list):
+        """Append a batch of (timestamp, open, high, low, close, volume) string tuples."""
+        count = len(bars)
+        if count == 0:
+            return
+        end = self.size + count
+        if end > len(self.timestamps):
+            self._grow(end)
+        self.timestamps[self.size:end] = [bar[0] for bar in bars]
+        self.values[self.size:end] = [bar[1:] for bar in bars]
+        self.size = end
+
+    def to_frame(self) -> pd.DataFrame:
+        """Build a sorted frame shaped like parse_time_series output."""
+        timestamps = self.timestamps[:self.size]
+        values = self.values[:self.size]
+
+        # Alpha Vantage lists newest bars first
+        if self.size > 1 and timestamps[0] > timestamps[-1]:
+            timestamps, values = timestamps[::-1], values[::-1]
+        if self.size > 1 and not (timestamps[1:] >= timestamps[:-1]).all():
+            order = np.argsort(timestamps, kind='stable')
+            timestamps, values = timestamps[order], values[order]
+
+        index = pd.DatetimeIndex(timestamps.astype('datetime64[ns]'), name='timestamp')
+        return pd.DataFrame({
+            'open': values[:, 0],
+            'high': values[:, 1],
+            'low': values[:, 2],
+            'close': values[:, 3],
+            'volume': values[:, 4].astype(np.int64)
+        }, index=index)
+
+
+def parse_stream(chunks: Iterable[bytes], size_hint: Optional[int] = None) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Parse a TIME_SERIES_INTRADAY JSON body incrementally.
+    Bars are written into column buffers as their chunk arrives, so only one
+    chunk of raw text is held at a time instead of the whole document.
+
+    Args:
+        chunks: Iterable of raw body chunks (e.g., response.iter_content())
+        size_hint: Expected body size in bytes, used to preallocate the buffers
+
+    Returns:
+        Tuple of (DataFrame with columns: open, high, low, close, volume,
+        dict of the other top-level keys such as 'Meta Data', 'Note' or 'Error Message')
+
+    Raises:
+        ValueError: if a bar does not have the expected fields or the body
+            ends before the time series object is closed
+    """
+    capacity = max(DEFAULT_CAPACITY, (size_hint or 0) // BYTES_PER_BAR + 1)
+    buffers = _ColumnBuffers(capacity)
+    decoder = codecs.getincrementaldecoder('utf-8')()
+
+    text = ''
+    header_text = None  # Everything before the time series object
+    in_series = False
+    series_done = False
+
+    for chunk in chunks:
+        if series_done:
+            continue
+        text += decoder.decode(chunk)
+
+        if not in_series:
+            match = _SERIES_KEY.search(text)
+            if match is None:
+                continue
+            header_text = text[:match.start()]
+            text = text[match.end():]
+            in_series = True
+
+        position = 0
+        bars = []
+        while True:
+            match = _BAR.match(text, position)
+            if match is None:
+                break
+            bars.append(match.groups())
+            position = match.end()
+        buffers.extend(bars)
+
+        if _SERIES_END.match(text, position):
+            series_done = True
+        elif '}' in text[position:]:
+            # A whole bar object is buffered but is not shaped like a bar
+            snippet = text[position:position + 80].strip()
+            raise ValueError(f"Malformed bar in time series: {snippet!r}")
+        text = text[position:]
+
+    text += decoder.decode(b'', final=True)
+
+    if header_text is None:
+        # No time series in the body: it is small, so parse it whole
+        header = json.loads(text) if text.strip() else {}
+        return pd.DataFrame(), header
+
+    if not series_done:
+        raise ValueError("Response ended before the time series was complete")
+
+    header = json.loads(header_text.rstrip().rstrip(',') + '}')
+    return buffers.to_frame(), header
@@ -0,0 +1,257 @@
+# Alpha Vantage Stand-in Server
+# Local HTTP server mimicking TIME_SERIES_INTRADAY for offline benchmarks and load tests
+#
+# Usage:
+#   python -m src.services.stub_server --port 8765 --latency 0.05
+#   ALPHA_VANTAGE_BASE_URL=http://127.0.0.1:8765/query streamlit run src/app.py
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from src.services import demo_data
+
+
+DEFAULT_SETTINGS = {
+    'latency': 0.0,           # seconds added to every response
+    'full_days': 30,          # trading days returned for outputsize=full
+    'compact_bars': 100,      # bars returned for outputsize=compact
+    'anchor': None,           # end time of the served series (None = DEMO_DATA_ANCHOR or now)
+    'note_every': 0,          # answer every Nth request with a "Note" payload (0 = never)
+    'http_429_every': 0,      # answer every Nth request with HTTP 429 (0 = never)
+    'http_500_every': 0,      # answer every Nth request with HTTP 500 (0 = never)
+    'invalid_symbols': {'INVALID'}  # symbols answered with an "Error Message" payload
+}
+
+NOTE_PAYLOAD = {
+    "Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute."
+}
+
+
+def build_intraday_payload(symbol: str, interval: str, outputsize: str = "full",
+                           full_days: int = 30, compact_bars: int = 100, anchor=None) -> Dict:
+    """
+    Build a TIME_SERIES_INTRADAY response from demo data.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        outputsize: 'full' or 'compact'
+        full_days: Trading days of history for a full response
+        compact_bars: Number of bars in a compact response
+        anchor: End time of the series (see demo_data.generate_demo_stock_data)
+
+    Returns:
+        Response dict shaped like the Alpha Vantage JSON, newest bar first
+    """
+    df = demo_data.generate_demo_stock_data(symbol, interval, days=full_days, anchor=anchor)
+    if outputsize == "compact":
+        df = df.iloc[-compact_bars:]
+    df = df.iloc[::-1]
+
+    timestamps = df.index.strftime('%Y-%m-%d %H:%M:%S')
+    time_series = {
+        timestamp: {
+            "1. open": f"{open_price:.4f}",
+            "2. high": f"{high:.4f}",
+            "3. low": f"{low:.4f}",
+            "4. close": f"{close:.4f}",
+            "5. volume": str(volume)
+        }
+        for timestamp, open_price, high, low, close, volume in zip(
+            timestamps, df['open'], df['high'], df['low'], df['close'], df['volume']
+        )
+    }
+
+    return {
+        "Meta Data": {
+            "1. Information": f"Intraday ({interval}) open, high, low, close prices and volume",
+            "2. Symbol": symbol,
+            "3. Last Refreshed": timestamps[0] if len(timestamps) else "",
+            "4. Interval": interval,
+            "5. Output Size": "Full size" if outputsize == "full" else "Compact",
+            "6. Time Zone": "US/Eastern"
+        },
+        f"Time Series ({interval})": time_series
+    }
+
+
+def build_intraday_csv(payload: Dict) -> bytes:
+    """
+    Render an intraday payload in the datatype=csv format.
+
+    Args:
+        payload: Response dict from build_intraday_payload
+
+    Returns:
+        CSV body with a header row, newest bar first
+    """
+    time_series = next(value for key, value in payload.items() if key.startswith("Time Series"))
+    lines = ["timestamp,open,high,low,close,volume"]
+    lines.extend(
+        f"{timestamp},{bar['1. open']},{bar['2. high']},{bar['3. low']},{bar['4. close']},{bar['5. volume']}"
+        for timestamp, bar in time_series.items()
+    )
+    return ("\r\n".join(lines) + "\r\n").encode()
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Serves /query requests from the server's settings and payload cache."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        request_number = server.record_request()
+        settings = server.settings
+
+        if settings['latency'] > 0:
+            time.sleep(settings['latency'])
+
+        params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+
+        if settings['http_500_every'] and request_number % settings['http_500_every'] == 0:
+            self._send_json(500, {"error": "Internal Server Error"})
+            return
+        if settings['http_429_every'] and request_number % settings['http_429_every'] == 0:
+            self._send_json(429, {"error": "Too Many Requests"})
+            return
+        if settings['note_every'] and request_number % settings['note_every'] == 0:
+            self._send_json(200, NOTE_PAYLOAD)
+            return
+
+        if params.get('function') != 'TIME_SERIES_INTRADAY':
+            self._send_json(200, {"Error Message": "This API function does not exist."})
+            return
+
+        symbol = params.get('symbol', '').upper()
+        if not symbol or symbol in settings['invalid_symbols']:
+            self._send_json(200, {
+                "Error Message": "Invalid API call. Please retry or visit the documentation for TIME_SERIES_INTRADAY."
+            })
+            return
+
+        datatype = params.get('datatype', 'json')
+        body = server.get_payload(symbol, params.get('interval', '5min'), params.get('outputsize', 'compact'), datatype)
+        self._send_body(200, body, "text/csv" if datatype == "csv" else "application/json")
+
+    def _send_json(self, status: int, payload: Dict):
+        self._send_body(status, json.dumps(payload).encode())
+
+    def _send_body(self, status: int, body: bytes, content_type: str = "application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep load tests quiet
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded stand-in server with request counters and cached payloads."""
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], settings: Optional[Dict] = None):
+        super().__init__(address, StubRequestHandler)
+        self.settings = {**DEFAULT_SETTINGS, **(settings or {})}
+        self._lock = threading.Lock()
+        self._payloads: Dict[Tuple[str, str, str, str], bytes] = {}
+        self.request_count = 0
+
+    def record_request(self) -> int:
+        """Count a request and return its 1-based number."""
+        with self._lock:
+            self.request_count += 1
+            return self.request_count
+
+    def get_payload(self, symbol: str, interval: str, outputsize: str, datatype: str = "json") -> bytes:
+        """Build (once) and return the encoded response body."""
+        key = (symbol, interval, outputsize, datatype)
+        with self._lock:
+            body = self._payloads.get(key)
+        if body is None:
+            if datatype == "csv":
+                # Render from the JSON payload so both formats carry the same bars
+                body = build_intraday_csv(json.loads(self.get_payload(symbol, interval, outputsize)))
+            else:
+                payload = build_intraday_payload(
+                    symbol, interval, outputsize,
+                    full_days=self.settings['full_days'],
+                    compact_bars=self.settings['compact_bars'],
+                    anchor=self.settings['anchor']
+                )
+                body = json.dumps(payload, indent=4).encode()
+            with self._lock:
+                self._payloads[key] = body
+        return body
+
+    @property
+    def base_url(self) -> str:
+        """URL to use as ALPHA_VANTAGE_BASE_URL."""
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}/query"
+
+
+def start_server(host: str = "127.0.0.1", port: int = 0, **settings) -> StubServer:
+    """
+    Start a stand-in server on a background thread.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        **settings: Overrides for DEFAULT_SETTINGS
+
+    Returns:
+        Running StubServer; call shutdown() and server_close() when done
+    """
+    server = StubServer((host, port), settings)
+    thread = threading.Thread(target=server.serve_forever, name="stub-server", daemon=True)
+    thread.start()
+    return server
+
+
+def main(argv=None):
+    """Run the stand-in server in the foreground."""
+    parser = argparse.ArgumentParser(description="Local Alpha Vantage stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=DEFAULT_SETTINGS['latency'],
+                        help="Seconds of latency added to every response")
+    parser.add_argument("--full-days", type=int, default=DEFAULT_SETTINGS['full_days'],
+                        help="Trading days of history in a full response")
+    parser.add_argument("--anchor", default=None,
+                        help="Fixed end time of served series, e.g. '2024-01-05 16:00'")
+    parser.add_argument("--note-every", type=int, default=0,
+                        help="Return a rate limit 'Note' payload every N requests")
+    parser.add_argument("--http-429-every", type=int, default=0,
+                        help="Return HTTP 429 every N requests")
+    parser.add_argument("--http-500-every", type=int, default=0,
+                        help="Return HTTP 500 every N requests")
+    args = parser.parse_args(argv)
+
+    server = StubServer((args.host, args.port), {
+        'latency': args.latency,
+        'full_days': args.full_days,
+        'anchor': args.anchor,
+        'note_every': args.note_every,
+        'http_429_every': args.http_429_every,
+        'http_500_every': args.http_500_every
+    })
+    print(f"Alpha Vantage stand-in listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+# Synthetic Market Generator
+# Builds large universes of demo-shaped OHLCV series with correlated sector moves
+#
+# Usage:
+#   python -m src.services.synthetic_market --symbols 2000 --days 252 --root data/synthetic
+
+import argparse
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from src.services import bar_store, demo_data
+
+
+SECTORS = [
+    "Technology", "Financials", "Healthcare", "Energy", "Industrials",
+    "Consumer", "Utilities", "Materials", "Real Estate", "Communications"
+]
+
+# Per-bar log return volatility split across the market, sector and symbol;
+# combined they match the 0.2% of a single demo series
+MARKET_VOLATILITY = 0.001
+SECTOR_VOLATILITY = 0.001
+IDIOSYNCRATIC_VOLATILITY = 0.0014
+
+
+class Universe:
+    """Symbols with their sector, starting price, market beta and drift."""
+
+    def __init__(self, symbols: List[str], sectors: np.ndarray, base_prices: np.ndarray,
+                 betas: np.ndarray, trends: np.ndarray):
+        self.symbols = symbols
+        self.sectors = sectors
+        self.base_prices = base_prices
+        self.betas = betas
+        self.trends = trends
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def sector_of(self, symbol: str) -> str:
+        """Name of the sector a symbol belongs to."""
+        return SECTORS[self.sectors[self.symbols.index(symbol)]]
+
+
+def make_universe(n_symbols: int, n_sectors: int = len(SECTORS), seed: int = 0) -> Universe:
+    """
+    Create a random universe of synthetic symbols.
+
+    Args:
+        n_symbols: Number of symbols
+        n_sectors: Number of sectors symbols are spread over (at most len(SECTORS))
+        seed: Seed for the universe parameters
+
+    Returns:
+        Universe with symbols named SYN00000, SYN00001, ...
+    """
+    rng = np.random.default_rng(seed)
+    n_sectors = min(n_sectors, len(SECTORS))
+    return Universe(
+        symbols=[f"SYN{number:05d}" for number in range(n_symbols)],
+        sectors=rng.integers(0, n_sectors, n_symbols),
+        base_prices=np.round(rng.lognormal(np.log(100.0), 0.6, n_symbols), 2),
+        betas=rng.uniform(0.6, 1.4, n_symbols),
+        trends=rng.uniform(-0.0001, 0.0001, n_symbols)
+    )
+
+
+def generate_chunks(universe: Universe, interval: str = "1min", days: int = 252,
+                    end: Optional[datetime] = None, chunk_days: int = 1,
+                    seed: int = 0) -> Iterator[Tuple[pd.DatetimeIndex, Dict[str, np.ndarray]]]:
+    """
+    Stream the universe's bars a few sessions at a time.
+    Each symbol's return is its drift plus beta times a market move, plus a move
+    shared by its sector and its own noise. The walk continues across chunks, so
+    concatenated chunks form one series per symbol.
+
+    Args:
+        universe: Symbols to generate
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        days: Trading days of history
+        end: Time the data ends at (defaults to DEMO_DATA_ANCHOR, then now)
+        chunk_days: Trading days per chunk; memory is about 40 bytes per bar per symbol
+        seed: Seed for the price paths
+
+    Yields:
+        Tuples of (timestamps, {field: 2-D array of shape (bars, symbols)})
+    """
+    minutes = demo_data.INTERVAL_MINUTES.get(interval, 5)
+    points_per_day = (6.5 * 60) // minutes
+    timestamps = demo_data.market_timestamps(minutes, int(points_per_day * days),
+                                             demo_data.resolve_anchor(end))
+    chunk_bars = max(1, int(points_per_day * chunk_days))
+
+    rng = np.random.default_rng(seed)
+    n_symbols = len(universe)
+    n_sectors = int(universe.sectors.max()) + 1 if n_symbols else 0
+    last_close = universe.base_prices.astype(np.float64)
+    previous_close = None
+
+    for start in range(0, len(timestamps), chunk_bars):
+        chunk_index = timestamps[start:start + chunk_bars]
+        bars = len(chunk_index)
+
+        market = rng.normal(0, MARKET_VOLATILITY, (bars, 1))
+        sector = rng.normal(0, SECTOR_VOLATILITY, (bars, n_sectors))
+        returns = (universe.trends + market * universe.betas + sector[:, universe.sectors]
+                   + rng.normal(0, IDIOSYNCRATIC_VOLATILITY, (bars, n_symbols)))
+
+        columns = demo_data.ohlcv_from_returns(returns, last_close, rng, previous_close)
+        # Continue from the unrounded close so the walk does not drift to cents
+        last_close = last_close * np.exp(returns.sum(axis=0))
+        previous_close = last_close
+        yield chunk_index, columns
+
+
+def iter_frames(universe: Universe, interval: str = "1min", days: int = 252,
+                end: Optional[datetime] = None, chunk_days: int = 1,
+                seed: int = 0) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    Stream per-symbol frames in the demo OHLCV shape, chunk by chunk.
+
+    Args:
+        universe: Symbols to generate
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        days: Trading days of history
+        end: Time the data ends at (defaults to DEMO_DATA_ANCHOR, then now)
+        chunk_days: Trading days per chunk
+        seed: Seed for the price paths
+
+    Yields:
+        Tuples of (symbol, DataFrame with open, high, low, close, volume)
+    """
+    for timestamps, columns in generate_chunks(universe, interval, days, end, chunk_days, seed):
+        for position, symbol in enumerate(universe.symbols):
+            yield symbol, pd.DataFrame(
+                {field: values[:, position] for field, values in columns.items()},
+                index=timestamps
+            )
+
+
+def write_to_store(universe: Universe, interval: str = "1min", days: int = 252,
+                   end: Optional[datetime] = None, chunk_days: int = 1, seed: int = 0,
+                   root: Optional[str] = None) -> Dict:
+    """
+    Generate the universe straight into the bar store without holding it in memory.
+
+    Args:
+        universe: Symbols to generate
+        interval: Time interval ('1min', '5min', '15min', '30min', '60min')
+        days: Trading days of history
+        end: Time the data ends at (defaults to DEMO_DATA_ANCHOR, then now)
+        chunk_days: Trading days per chunk
+        seed: Seed for the price paths
+        root: Store directory (defaults to BAR_STORE_DIR)
+
+    Returns:
+        Dictionary with the number of 'symbols', 'bars' written and 'seconds' taken
+    """
+    started = time.perf_counter()
+    bars = 0
+    for symbol, df in iter_frames(universe, interval, days, end, chunk_days, seed):
+        bars += bar_store.append(symbol, interval, df, root=root)
+    return {'symbols': len(universe), 'bars': bars, 'seconds': time.perf_counter() - started}
+
+
+def main(argv=None):
+    """Generate a synthetic universe into a bar store directory."""
+    parser = argparse.ArgumentParser(description="Generate a large synthetic market into the bar store")
+    parser.add_argument("--symbols", type=int, default=1000)
+    parser.add_argument("--sectors", type=int, default=len(SECTORS))
+    parser.add_argument("--interval", default="1min", choices=list(demo_data.INTERVAL_MINUTES))
+    parser.add_argument("--days", type=int, default=252, help="Trading days of history")
+    parser.add_argument("--chunk-days", type=int, default=1, help="Trading days generated at a time")
+    parser.add_argument("--end", default=None, help="End time, e.g. '2024-01-05 16:00' (default: now)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--root", default=None, help="Store directory (default: BAR_STORE_DIR)")
+    args = parser.parse_args(argv)
+
+    universe = make_universe(args.symbols, args.sectors, args.seed)
+    summary = write_to_store(universe, args.interval, args.days, args.end, args.chunk_days, args.seed, args.root)
+    rate = summary['bars'] / summary['seconds'] if summary['seconds'] else 0
+    print(f"Wrote {summary['bars']:,} bars for {summary['symbols']} symbols "
+          f"in {summary['seconds']:.1f}s ({rate:,.0f} bars/s)")
+
+
+if __name__ == "__main__":
+    main()
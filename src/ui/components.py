@@ -126,15 +126,32 @@ def render_interval_selector() -> str:
     Returns:
         Selected interval
     """
+    intervals = config.TIME_INTERVALS + (config.RESAMPLED_INTERVALS if config.LOCAL_RESAMPLING else [])
     selected = st.selectbox(
         "Select Time Interval",
-        config.TIME_INTERVALS,
+        intervals,
         index=1,  # Default to 5min
         help="Choose the time interval for intraday data"
     )
     return selected
 
 
+def render_window_selector() -> str:
+    """
+    Display dropdown for the visible chart window.
+    
+    Returns:
+        Selected window name (see time_window.parse_duration)
+    """
+    selected = st.selectbox(
+        "Visible Window",
+        list(config.CHART_WINDOWS.keys()),
+        index=0,  # Default to the whole frame
+        help="Charts and metrics cover this window; indicators also read earlier bars to warm up"
+    )
+    return config.CHART_WINDOWS[selected]
+
+
 def render_loading_skeleton():
     """
     Display animated loading skeleton while data is being fetched.
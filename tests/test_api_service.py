@@ -1,13 +1,18 @@
 import pytest
 from unittest.mock import patch, Mock
-from src.services import api_service
+from src.services import api_service, circuit_breaker, market_cache, rate_limiter
 import pandas as pd
 
 
 class TestApiService:
     """Test cases for API service module."""
     
-    @patch('src.services.api_service.requests.get')
+    def setup_method(self):
+        """Start each test with a full rate limit bucket and a closed circuit."""
+        rate_limiter.reset()
+        circuit_breaker.reset()
+    
+    @patch('src.services.api_service.http_client.get')
     def test_fetch_intraday_data_success(self, mock_get):
         """Test successful API data fetch."""
         # Mock successful response
@@ -36,7 +41,7 @@ class TestApiService:
         assert "Time Series (5min)" in result
         assert is_demo is False  # Should not be demo data when API succeeds
     
-    @patch('src.services.api_service.requests.get')
+    @patch('src.services.api_service.http_client.get')
     def test_fetch_intraday_data_fallback_to_demo(self, mock_get):
         """Test fallback to demo data when API fails."""
         # Mock failed response (connection error)
@@ -82,3 +87,195 @@ class TestApiService:
         # Demo data should have reasonable values
         assert df['close'].min() > 0
         assert df['volume'].min() > 0
+    
+    def test_merge_bars_appends_only_new_bars(self):
+        """Test that a compact update is de-duplicated against the last timestamp."""
+        existing = pd.DataFrame(
+            {'close': [1.0, 2.0, 3.0]},
+            index=pd.date_range('2023-01-02 09:30', periods=3, freq='5min')
+        )
+        update = pd.DataFrame(
+            {'close': [3.0, 4.0, 5.0]},
+            index=pd.date_range('2023-01-02 09:40', periods=3, freq='5min')
+        )
+        
+        merged = api_service.merge_bars(existing, update)
+        assert len(merged) == 5
+        assert merged.index.is_unique
+        assert merged['close'].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    
+    def test_merge_bars_replaces_revised_bars(self):
+        """Test that a bar still forming when first fetched is replaced by its final values."""
+        existing = pd.DataFrame(
+            {'close': [1.0, 2.0, 3.0]},
+            index=pd.date_range('2023-01-02 09:30', periods=3, freq='5min')
+        )
+        update = pd.DataFrame(
+            {'close': [3.5, 4.0]},
+            index=pd.date_range('2023-01-02 09:40', periods=2, freq='5min')
+        )
+        
+        merged = api_service.merge_bars(existing, update)
+        assert merged.index.is_unique and merged.index.is_monotonic_increasing
+        assert merged['close'].tolist() == [1.0, 2.0, 3.5, 4.0]
+        
+        revised_only = api_service.merge_bars(existing, update.iloc[:1])
+        assert revised_only['close'].tolist() == [1.0, 2.0, 3.5]
+    
+    def test_merge_bars_detects_gap(self):
+        """Test that a non-overlapping update requires a full reload."""
+        existing = pd.DataFrame(
+            {'close': [1.0, 2.0]},
+            index=pd.date_range('2023-01-02 09:30', periods=2, freq='5min')
+        )
+        update = pd.DataFrame(
+            {'close': [9.0]},
+            index=pd.date_range('2023-01-03 09:30', periods=1, freq='5min')
+        )
+        
+        assert api_service.merge_bars(existing, update) is None
+    
+    @patch('src.services.api_service.fetch_intraday_data')
+    def test_expired_frame_refreshed_with_compact_fetch(self, mock_fetch, tmp_path):
+        """Test that an expired real frame is topped up instead of reloaded."""
+        market_cache.clear()
+        existing = api_service.parse_time_series({
+            "Time Series (5min)": {
+                "2023-01-02 09:30:00": {"1. open": "1", "2. high": "1", "3. low": "1", "4. close": "1", "5. volume": "10"},
+                "2023-01-02 09:35:00": {"1. open": "2", "2. high": "2", "3. low": "2", "4. close": "2", "5. volume": "10"}
+            }
+        })
+        market_cache.put("IBM", "5min", existing, False)
+        compact = {
+            "Time Series (5min)": {
+                "2023-01-02 09:35:00": {"1. open": "2", "2. high": "2", "3. low": "2", "4. close": "2", "5. volume": "10"},
+                "2023-01-02 09:40:00": {"1. open": "3", "2. high": "3", "3. low": "3", "4. close": "3", "5. volume": "10"}
+            }
+        }
+        mock_fetch.return_value = (compact, False)
+        
+        with patch('src.services.market_cache.time.time', return_value=2e10), \
+                patch('src.services.api_service.config.BAR_STORE_DIR', str(tmp_path)):
+            df, is_demo = api_service.get_intraday_frame("IBM", "5min")
+        
+        assert mock_fetch.call_args.kwargs['outputsize'] == 'compact'
+        assert is_demo is False
+        assert df['close'].tolist() == [1.0, 2.0, 3.0]
+        market_cache.clear()
+    
+    @patch('src.services.api_service.get_intraday_frame')
+    def test_fetch_many_reports_per_symbol_results(self, mock_get_frame):
+        """Test that batch fetch isolates per-symbol errors and deferrals."""
+        frame = pd.DataFrame({'close': [1.0]})
+        
+        def get_frame(symbol, interval, api_key, priority):
+            if symbol == "MSFT":
+                raise rate_limiter.RequestDeferred("Deferred background fetch for MSFT")
+            if symbol == "TSLA":
+                raise RuntimeError("boom")
+            return frame, False
+        
+        mock_get_frame.side_effect = get_frame
+        
+        results = api_service.fetch_many(["IBM", "MSFT", "TSLA", "IBM"], "5min")
+        
+        assert list(results.keys()) == ["IBM", "MSFT", "TSLA"]
+        assert results["IBM"]['df'] is frame and results["IBM"]['error'] is None
+        assert results["MSFT"]['df'] is None and "Deferred" in results["MSFT"]['error']
+        assert results["TSLA"]['df'] is None and "boom" in results["TSLA"]['error']
+        assert mock_get_frame.call_count == 3
+    
+    def test_parse_time_series_types_and_order(self):
+        """Test that parsed columns are typed and sorted oldest first."""
+        bar = {"1. open": "1.5", "2. high": "2.5", "3. low": "0.5", "4. close": "2.0", "5. volume": "300"}
+        response = {
+            "Time Series (5min)": {
+                "2023-01-01 15:55:00": bar,
+                "2023-01-01 16:00:00": bar,
+                "2023-01-01 15:50:00": bar
+            }
+        }
+        
+        df = api_service.parse_time_series(response)
+        
+        assert df.index.is_monotonic_increasing
+        assert df.index.name == 'timestamp'
+        assert df.index[0] == pd.Timestamp("2023-01-01 15:50:00")
+        assert str(df['close'].dtype) == 'float64'
+        assert str(df['volume'].dtype) == 'int64'
+        assert df['open'].iloc[0] == 1.5
+    
+    @patch('src.services.api_service.http_client.get')
+    def test_fetch_intraday_frame_streams_body(self, mock_get):
+        """Test that the streaming path returns a parsed frame."""
+        body = (b'{"Meta Data": {"2. Symbol": "IBM"}, "Time Series (5min)": {'
+                b'"2023-01-01 16:00:00": {"1. open": "100.0", "2. high": "101.0", "3. low": "99.0", '
+                b'"4. close": "100.5", "5. volume": "1000"}}}')
+        mock_response = Mock()
+        mock_response.headers = {'Content-Length': str(len(body))}
+        mock_response.iter_content.return_value = [body[:40], body[40:]]
+        mock_get.return_value = mock_response
+        
+        df, is_demo = api_service.fetch_intraday_frame("IBM", "5min")
+        
+        assert is_demo is False
+        assert df['close'].tolist() == [100.5]
+        assert mock_get.call_args.kwargs['stream'] is True
+        mock_response.close.assert_called_once()
+
+    def test_parse_csv(self):
+        """Test that CSV bodies parse into the parse_time_series frame shape."""
+        content = (b"timestamp,open,high,low,close,volume\r\n"
+                   b"2023-01-01 16:05:00,101.0,102.0,100.0,101.5,2000\r\n"
+                   b"2023-01-01 16:00:00,100.0,101.0,99.0,100.5,1000\r\n")
+
+        df = api_service.parse_csv(content)
+
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert df.index.is_monotonic_increasing
+        assert df.index.name == 'timestamp'
+        assert df['close'].tolist() == [100.5, 101.5]
+        assert df['volume'].dtype == 'int64'
+        assert str(df.index.dtype) == 'datetime64[ns]'
+
+    @patch('src.services.api_service.http_client.get')
+    def test_csv_error_message_is_json(self, mock_get):
+        """Test that JSON error bodies in CSV mode are handled without a JSON retry."""
+        market_cache.clear()
+        mock_response = Mock()
+        mock_response.content = b'{"Error Message": "Invalid API call."}'
+        mock_response.json.return_value = {"Error Message": "Invalid API call."}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        df, is_demo = api_service.fetch_intraday_csv("BADCSV", "5min")
+
+        assert df is None and is_demo is True
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs['params']['datatype'] == 'csv'
+        market_cache.clear()
+
+    @patch('src.services.api_service.http_client.get')
+    def test_unparseable_csv_falls_back_to_json(self, mock_get):
+        """Test that a malformed CSV body triggers a JSON request."""
+        csv_response = Mock()
+        csv_response.content = b"not,a,time,series\r\n1,2,3,4\r\n"
+        csv_response.raise_for_status.return_value = None
+        json_response = Mock()
+        json_response.content = None
+        json_response.json.return_value = {
+            "Time Series (5min)": {
+                "2023-01-01 16:00:00": {
+                    "1. open": "100.0", "2. high": "101.0", "3. low": "99.0",
+                    "4. close": "100.5", "5. volume": "1000"
+                }
+            }
+        }
+        json_response.raise_for_status.return_value = None
+        mock_get.side_effect = [csv_response, json_response]
+
+        df, is_demo = api_service.fetch_intraday_csv("IBM", "5min")
+
+        assert is_demo is False
+        assert len(df) == 1
+        assert 'datatype' not in mock_get.call_args.kwargs['params']
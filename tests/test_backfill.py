@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import patch
+import pandas as pd
+from src.services import backfill, bar_store
+
+
+def month_response(month):
+    """Build a small response with two bars inside a month."""
+    bar = {"1. open": "1", "2. high": "2", "3. low": "0.5", "4. close": "1.5", "5. volume": "100"}
+    return {
+        "Time Series (5min)": {
+            f"{month}-15 09:35:00": bar,
+            f"{month}-15 09:30:00": bar
+        }
+    }
+
+
+class TestBackfill:
+    """Test cases for month-sliced historical backfill."""
+
+    def test_month_range(self):
+        """Test inclusive month ranges across a year boundary."""
+        assert backfill.month_range("2023-11", "2024-02") == ["2023-11", "2023-12", "2024-01", "2024-02"]
+        with pytest.raises(ValueError):
+            backfill.month_range("2024-02", "2023-11")
+
+    @patch('src.services.backfill.api_service.fetch_intraday_data')
+    def test_backfill_merges_months_in_order(self, mock_fetch, tmp_path):
+        """Test that parallel month slices land sorted in the bar store."""
+        mock_fetch.side_effect = lambda *args, **kwargs: (month_response(kwargs['month']), False)
+
+        summary = backfill.backfill("IBM", "5min", "2023-01", "2023-04", root=str(tmp_path))
+
+        assert sorted(summary['fetched']) == ["2023-01", "2023-02", "2023-03", "2023-04"]
+        assert summary['bars_written'] == 8
+        stored = bar_store.read("IBM", "5min", root=str(tmp_path))
+        assert len(stored) == 8
+        assert stored.index.is_monotonic_increasing
+        assert backfill.get_completed_months("IBM", "5min", root=str(tmp_path)) == {
+            "2023-01", "2023-02", "2023-03", "2023-04"
+        }
+
+    @patch('src.services.backfill.api_service.fetch_intraday_data')
+    def test_resume_skips_completed_and_retries_failed(self, mock_fetch, tmp_path):
+        """Test that a second run only fetches months that failed."""
+        def flaky(*args, **kwargs):
+            if kwargs['month'] == "2023-02":
+                return None, True
+            return month_response(kwargs['month']), False
+
+        mock_fetch.side_effect = flaky
+        first = backfill.backfill("IBM", "5min", "2023-01", "2023-03", root=str(tmp_path))
+        assert list(first['failed'].keys()) == ["2023-02"]
+
+        mock_fetch.reset_mock()
+        mock_fetch.side_effect = lambda *args, **kwargs: (month_response(kwargs['month']), False)
+        second = backfill.backfill("IBM", "5min", "2023-01", "2023-03", root=str(tmp_path))
+
+        assert second['skipped'] == ["2023-01", "2023-03"]
+        assert second['fetched'] == ["2023-02"]
+        assert mock_fetch.call_count == 1
+        assert len(bar_store.read("IBM", "5min", root=str(tmp_path))) == 6
+
+    @patch('src.services.backfill.api_service.fetch_intraday_data')
+    def test_current_month_is_not_marked_complete(self, mock_fetch, tmp_path):
+        """Test that the still-growing current month is fetched again next run."""
+        current = pd.Timestamp.now().strftime("%Y-%m")
+        mock_fetch.side_effect = lambda *args, **kwargs: (month_response(kwargs['month']), False)
+
+        backfill.backfill("IBM", "5min", current, root=str(tmp_path))
+
+        assert current not in backfill.get_completed_months("IBM", "5min", root=str(tmp_path))
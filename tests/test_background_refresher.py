@@ -0,0 +1,102 @@
+import pytest
+import threading
+from unittest.mock import patch
+import pandas as pd
+from src.services import api_service, background_refresher, market_cache
+
+
+class TestBackgroundRefresher:
+    """Test cases for stale-while-revalidate refreshing."""
+
+    def setup_method(self):
+        market_cache.clear()
+
+    def teardown_method(self):
+        background_refresher.wait_idle()
+        market_cache.clear()
+
+    def test_duplicate_keys_are_skipped(self):
+        """Test that a key is only queued once while pending."""
+        release = threading.Event()
+        calls = []
+
+        def refresh():
+            release.wait(timeout=5)
+            calls.append(1)
+
+        assert background_refresher.schedule("IBM", refresh) is True
+        assert background_refresher.schedule("IBM", refresh) is False
+        release.set()
+        background_refresher.wait_idle()
+
+        assert calls == [1]
+        assert not background_refresher.is_pending("IBM")
+
+    def test_failures_are_counted(self):
+        """Test that a failing refresh does not kill the worker."""
+        before = background_refresher.get_stats()['failed']
+
+        def fail():
+            raise RuntimeError("upstream down")
+
+        background_refresher.schedule("FAIL", fail)
+        background_refresher.wait_idle()
+
+        assert background_refresher.get_stats()['failed'] == before + 1
+
+    @patch('src.services.api_service.config.BAR_STORE_ENABLED', False)
+    @patch('src.services.api_service.fetch_intraday_data')
+    def test_stale_frame_served_while_refreshing(self, mock_fetch):
+        """Test that an expired frame is returned at once and replaced in the background."""
+        old_frame = pd.DataFrame(
+            {'open': [1.0], 'high': [1.0], 'low': [1.0], 'close': [1.0], 'volume': [10]},
+            index=pd.DatetimeIndex(['2023-01-02 09:30'], name='timestamp')
+        )
+        market_cache.put("IBM", "5min", old_frame, False)
+        release = threading.Event()
+
+        def slow_fetch(*args, **kwargs):
+            release.wait(timeout=5)
+            return ({"Time Series (5min)": {
+                "2023-01-02 09:30:00": {"1. open": "1", "2. high": "1", "3. low": "1", "4. close": "1", "5. volume": "10"},
+                "2023-01-02 09:35:00": {"1. open": "2", "2. high": "2", "3. low": "2", "4. close": "2", "5. volume": "20"}
+            }}, False)
+
+        mock_fetch.side_effect = slow_fetch
+
+        with patch('src.services.market_cache.time.time', return_value=2e10):
+            df, is_demo = api_service.get_intraday_frame("IBM", "5min", allow_stale=True)
+            assert len(df) == 1 and is_demo is False
+
+            release.set()
+            background_refresher.wait_idle()
+
+            refreshed, _ = api_service.get_intraday_frame("IBM", "5min")
+        assert refreshed['close'].tolist() == [1.0, 2.0]
+
+    @patch('src.services.api_service.config.LOCAL_RESAMPLING', False)
+    @patch('src.services.api_service._load_full')
+    def test_warm_many_does_not_wait_on_fetches(self, mock_load):
+        """Test that watchlist warm-up serves cached frames and loads the rest in the background."""
+        frame = pd.DataFrame(
+            {'open': [1.0], 'high': [1.0], 'low': [1.0], 'close': [1.0], 'volume': [10]},
+            index=pd.DatetimeIndex(['2023-01-02 09:30'], name='timestamp')
+        )
+        market_cache.put("IBM", "5min", frame, False)
+        release = threading.Event()
+
+        def slow_load(*args, **kwargs):
+            release.wait(timeout=5)
+            return frame, True
+
+        mock_load.side_effect = slow_load
+
+        results = api_service.warm_many(["IBM", "MSFT"], "5min")
+
+        assert results["IBM"]['df']['close'].tolist() == [1.0]
+        assert results["MSFT"]['df'] is None
+        assert background_refresher.is_pending(("MSFT", "5min"))
+
+        release.set()
+        background_refresher.wait_idle()
+        assert api_service.warm_many(["MSFT"], "5min")["MSFT"]['df'] is not None
@@ -0,0 +1,152 @@
+import pytest
+import json
+import os
+from unittest.mock import Mock, patch
+import pandas as pd
+from src.services import api_service, background_refresher, bar_store, market_cache, rate_limiter
+
+
+def make_frame(start, rows):
+    """Build an OHLCV frame with 5-minute bars."""
+    dates = pd.date_range(start, periods=rows, freq='5min', name='timestamp')
+    return pd.DataFrame({
+        'open': [100.0 + i for i in range(rows)],
+        'high': [101.0 + i for i in range(rows)],
+        'low': [99.0 + i for i in range(rows)],
+        'close': [100.5 + i for i in range(rows)],
+        'volume': [1000 + i for i in range(rows)]
+    }, index=dates)
+
+
+class TestBarStore:
+    """Test cases for the on-disk bar store."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that appended bars read back unchanged."""
+        df = make_frame('2023-01-02 09:30', 20)
+
+        assert bar_store.append("IBM", "5min", df, root=str(tmp_path)) == 20
+        stored = bar_store.read("IBM", "5min", root=str(tmp_path))
+
+        pd.testing.assert_frame_equal(stored, df, check_freq=False, check_index_type=False)
+
+    def test_append_skips_stored_bars(self, tmp_path):
+        """Test that only bars newer than the stored tail are written."""
+        bar_store.append("IBM", "5min", make_frame('2023-01-02 09:30', 10), root=str(tmp_path))
+
+        written = bar_store.append("IBM", "5min", make_frame('2023-01-02 10:00', 10), root=str(tmp_path))
+
+        assert written == 6
+        stored = bar_store.read("IBM", "5min", root=str(tmp_path))
+        assert len(stored) == 16
+        assert stored.index.is_monotonic_increasing and stored.index.is_unique
+
+    def test_append_revises_stored_tail(self, tmp_path):
+        """Test that a newer version of the last stored bar overwrites it."""
+        bar_store.append("IBM", "5min", make_frame('2023-01-02 09:30', 3), root=str(tmp_path))
+        update = make_frame('2023-01-02 09:40', 2)
+        update['close'] = [500.0, 501.0]
+
+        written = bar_store.append("IBM", "5min", update, root=str(tmp_path))
+
+        stored = bar_store.read("IBM", "5min", root=str(tmp_path))
+        assert written == 1
+        assert stored['close'].tolist() == [100.5, 101.5, 500.0, 501.0]
+
+    def test_read_from_start(self, tmp_path):
+        """Test that a start timestamp only returns the tail."""
+        bar_store.append("IBM", "5min", make_frame('2023-01-02 09:30', 10), root=str(tmp_path))
+
+        tail = bar_store.read("IBM", "5min", start=pd.Timestamp('2023-01-02 10:00'), root=str(tmp_path))
+
+        assert len(tail) == 4
+        assert tail.index[0] == pd.Timestamp('2023-01-02 10:00')
+
+    def test_torn_append_is_repaired(self, tmp_path):
+        """Test that a partially written row is dropped before the next append."""
+        bar_store.append("IBM", "5min", make_frame('2023-01-02 09:30', 5), root=str(tmp_path))
+        directory = bar_store._series_dir("IBM", "5min", str(tmp_path))
+        with open(os.path.join(directory, "open.bin"), 'ab') as f:
+            f.write(b'\x00' * 8)
+
+        bar_store.append("IBM", "5min", make_frame('2023-01-02 09:55', 2), root=str(tmp_path))
+        stored = bar_store.read("IBM", "5min", root=str(tmp_path))
+
+        assert len(stored) == 7
+        assert stored['open'].tolist() == [100.0, 101.0, 102.0, 103.0, 104.0, 100.0, 101.0]
+
+    def test_missing_series_is_empty(self, tmp_path):
+        """Test that reading an unknown symbol returns an empty frame."""
+        assert bar_store.read("NOPE", "5min", root=str(tmp_path)).empty
+        assert bar_store.get_last_timestamp("NOPE", "5min", root=str(tmp_path)) is None
+
+    @patch('src.services.api_service.fetch_intraday_data')
+    def test_warm_start_only_tops_up_tail(self, mock_fetch, tmp_path):
+        """Test that a cold cache is served from disk at once and topped up in the background."""
+        market_cache.clear()
+        rate_limiter.reset()
+        bar_store.append("IBM", "5min", make_frame('2023-01-02 09:30', 10), root=str(tmp_path))
+        mock_fetch.return_value = ({
+            "Time Series (5min)": {
+                "2023-01-02 10:15:00": {"1. open": "1", "2. high": "1", "3. low": "1", "4. close": "1", "5. volume": "10"},
+                "2023-01-02 10:20:00": {"1. open": "2", "2. high": "2", "3. low": "2", "4. close": "2", "5. volume": "10"}
+            }
+        }, False)
+
+        with patch('src.services.api_service.config.BAR_STORE_DIR', str(tmp_path)):
+            df, is_demo = api_service.get_intraday_frame("IBM", "5min")
+            background_refresher.wait_idle()
+            refreshed, _ = api_service.get_intraday_frame("IBM", "5min")
+            stored = bar_store.read("IBM", "5min")
+
+        assert is_demo is False
+        assert len(df) == 10
+        assert mock_fetch.call_args.kwargs['outputsize'] == 'compact'
+        assert len(refreshed) == 11
+        assert len(stored) == 11
+        market_cache.clear()
+
+    def test_delete_removes_directories(self, tmp_path):
+        """Test that deleting the last interval of a symbol removes its directory."""
+        bar_store.append("IBM", "5min", make_frame('2023-01-02 09:30', 5), root=str(tmp_path))
+        bar_store.append("IBM", "1min", make_frame('2023-01-02 09:30', 5), root=str(tmp_path))
+
+        bar_store.delete("IBM", "5min", root=str(tmp_path))
+        assert os.listdir(tmp_path / "IBM") == ["1min"]
+
+        bar_store.delete("IBM", "1min", root=str(tmp_path))
+        assert not (tmp_path / "IBM").exists()
+        assert bar_store.read("IBM", "1min", root=str(tmp_path)).empty
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_information_payload_is_not_persisted(self, tmp_path, streaming):
+        """Test that an "Information" answer is served as demo data and never stored."""
+        market_cache.clear()
+        rate_limiter.reset()
+        body = b'{"Information": "Thank you for using Alpha Vantage! This is a premium endpoint."}'
+        response = Mock(status_code=200, headers={}, content=body)
+        response.json.return_value = json.loads(body)
+        response.iter_content.return_value = [body]
+
+        with patch('src.services.api_service.config.BAR_STORE_DIR', str(tmp_path)), \
+                patch('src.services.api_service.config.BAR_STORE_ENABLED', True), \
+                patch('src.services.api_service.config.STREAMING_INGESTION', streaming), \
+                patch('src.services.api_service.http_client.get', return_value=response):
+            df, is_demo = api_service.get_intraday_frame("IBM", "5min")
+
+        assert is_demo is True
+        assert not df.empty
+        assert list(tmp_path.iterdir()) == []
+        market_cache.clear()
+
+    def test_merge_accepts_older_history(self, tmp_path):
+        """Test that merge inserts bars before the stored tail."""
+        bar_store.append("IBM", "5min", make_frame('2023-01-03 09:30', 5), root=str(tmp_path))
+
+        added = bar_store.merge("IBM", "5min", make_frame('2023-01-02 09:30', 5), root=str(tmp_path))
+        again = bar_store.merge("IBM", "5min", make_frame('2023-01-02 09:30', 5), root=str(tmp_path))
+
+        stored = bar_store.read("IBM", "5min", root=str(tmp_path))
+        assert added == 5 and again == 0
+        assert len(stored) == 10
+        assert stored.index.is_monotonic_increasing
@@ -0,0 +1,111 @@
+import pytest
+from unittest.mock import patch
+import requests
+from src.services import api_service, circuit_breaker, market_cache, rate_limiter, stub_server
+
+
+class TestCircuitBreaker:
+    """Test cases for the upstream circuit breaker and negative cache."""
+
+    def setup_method(self):
+        circuit_breaker.reset()
+        rate_limiter.reset()
+        market_cache.clear()
+
+    def teardown_method(self):
+        circuit_breaker.reset()
+        market_cache.clear()
+
+    def test_opens_after_threshold(self):
+        """Test that repeated failures open the circuit."""
+        for _ in range(circuit_breaker.config.CIRCUIT_FAILURE_THRESHOLD):
+            assert circuit_breaker.allow_request() is True
+            circuit_breaker.record_failure()
+
+        assert circuit_breaker.get_state() == circuit_breaker.STATE_OPEN
+        assert circuit_breaker.allow_request() is False
+
+    def test_half_open_probe(self):
+        """Test that one probe is allowed after the reset timeout."""
+        with patch('src.services.circuit_breaker.config.CIRCUIT_FAILURE_THRESHOLD', 1):
+            circuit_breaker.record_failure()
+
+        with patch('src.services.circuit_breaker.config.CIRCUIT_RESET_TIMEOUT', 0.0):
+            assert circuit_breaker.allow_request() is True
+            assert circuit_breaker.get_state() == circuit_breaker.STATE_HALF_OPEN
+
+        assert circuit_breaker.allow_request() is False
+        circuit_breaker.record_success()
+        assert circuit_breaker.get_state() == circuit_breaker.STATE_CLOSED
+
+    def test_failed_probe_reopens(self):
+        """Test that a failing probe opens the circuit again."""
+        with patch('src.services.circuit_breaker.config.CIRCUIT_FAILURE_THRESHOLD', 1):
+            circuit_breaker.record_failure()
+        with patch('src.services.circuit_breaker.config.CIRCUIT_RESET_TIMEOUT', 0.0):
+            circuit_breaker.allow_request()
+        circuit_breaker.record_failure()
+
+        assert circuit_breaker.get_state() == circuit_breaker.STATE_OPEN
+        assert circuit_breaker.get_stats()['trips'] == 2
+
+    @patch('src.services.http_client.time.sleep')
+    @patch('src.services.http_client.get_session')
+    def test_open_circuit_skips_network(self, mock_get_session, mock_sleep):
+        """Test that calls short-circuit to demo data while open."""
+        session_get = mock_get_session.return_value.get
+        session_get.side_effect = requests.exceptions.Timeout()
+        # One call's retries are enough to reach the threshold
+        api_service.fetch_intraday_data("IBM", "5min")
+        session_get.reset_mock()
+
+        result, is_demo = api_service.fetch_intraday_data("IBM", "5min")
+
+        assert result is None and is_demo is True
+        session_get.assert_not_called()
+        assert circuit_breaker.get_stats()['short_circuited'] == 1
+
+    @patch('src.services.http_client.time.sleep')
+    @patch('src.services.http_client.get_session')
+    def test_retries_stop_once_circuit_opens(self, mock_get_session, mock_sleep):
+        """Test that each attempt counts as a failure and retrying stops at the threshold."""
+        session_get = mock_get_session.return_value.get
+        session_get.side_effect = requests.exceptions.Timeout()
+
+        with patch('src.services.circuit_breaker.config.CIRCUIT_FAILURE_THRESHOLD', 2), \
+                patch('src.services.http_client.config.HTTP_MAX_RETRIES', 5):
+            result, is_demo = api_service.fetch_intraday_data("IBM", "5min")
+
+        assert result is None and is_demo is True
+        assert session_get.call_count == 2
+        assert circuit_breaker.get_state() == circuit_breaker.STATE_OPEN
+
+    def test_invalid_symbol_is_negatively_cached(self):
+        """Test that a rejected symbol is not requested again."""
+        server = stub_server.start_server(full_days=1)
+        try:
+            with patch('src.services.api_service.config.ALPHA_VANTAGE_BASE_URL', server.base_url):
+                api_service.fetch_intraday_data("INVALID", "5min")
+                result, is_demo = api_service.fetch_intraday_data("INVALID", "5min")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert result is None and is_demo is True
+        assert server.request_count == 1
+        assert market_cache.is_invalid_symbol("INVALID")
+        # An "Error Message" answer still proves the upstream is up
+        assert circuit_breaker.get_state() == circuit_breaker.STATE_CLOSED
+
+    @patch('src.services.api_service.http_client.get')
+    def test_other_api_errors_are_not_negatively_cached(self, mock_get):
+        """Test that month slice and CSV errors do not mark the symbol invalid."""
+        mock_get.return_value.json.return_value = {
+            "Error Message": "Invalid API call. Please retry or visit the documentation for TIME_SERIES_INTRADAY."
+        }
+        mock_get.return_value.content = b'{"Error Message": "Invalid API call."}'
+
+        api_service.fetch_intraday_data("IBM", "5min", month="1990-01")
+        api_service.fetch_intraday_csv("IBM", "5min")
+
+        assert not market_cache.is_invalid_symbol("IBM")
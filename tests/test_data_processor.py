@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+from src.core import data_processor
+
+
+def make_frame(closes):
+    """Build an OHLCV frame from a list of closes."""
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame({
+        'open': closes - 0.5,
+        'high': closes + 1.0,
+        'low': closes - 1.0,
+        'close': closes,
+        'volume': np.arange(1, len(closes) + 1) * 1000
+    }, index=pd.date_range('2024-01-02 09:30', periods=len(closes), freq='5min', name='timestamp'))
+
+
+class TestDataProcessor:
+    """Test cases for the data processor module."""
+
+    def test_calculate_trends_does_not_mutate_input(self):
+        """Test that trends leave the given frame untouched."""
+        df = make_frame(np.linspace(100, 130, 30))
+        columns = list(df.columns)
+
+        data_processor.calculate_trends(df)
+
+        assert list(df.columns) == columns
+
+    def test_trends_match_rolling_means(self):
+        """Test that last-window averages equal the full rolling series values."""
+        rng = np.random.default_rng(0)
+        df = make_frame(100 + rng.normal(0, 1, 50).cumsum())
+
+        trends = data_processor.calculate_trends(df)
+
+        assert trends['ma_5'] == round(df['close'].rolling(5).mean().iloc[-1], 2)
+        assert trends['ma_20'] == round(df['close'].rolling(20).mean().iloc[-1], 2)
+        assert trends['volatility'] == round(df['close'].std(), 2)
+
+    def test_short_history_uses_latest_price(self):
+        """Test that missing windows fall back to the latest price."""
+        df = make_frame([100, 101, 102])
+
+        trends = data_processor.calculate_trends(df)
+
+        assert trends['ma_5'] == 102 and trends['ma_20'] == 102
+        assert trends['trend'] == "Neutral"
+
+    def test_summary_matches_pandas_formulas(self):
+        """Test that the summary equals metrics computed directly with pandas on a fixed frame."""
+        rng = np.random.default_rng(7)
+        df = make_frame(100 + rng.normal(0, 1, 60).cumsum())
+        close = df['close']
+
+        metrics, trends = data_processor.calculate_summary(df)
+
+        change = close.iloc[-1] - df['open'].iloc[0]
+        assert metrics == {
+            'current_price': round(close.iloc[-1], 2),
+            'price_change': round(change, 2),
+            'price_change_percent': round(change / df['open'].iloc[0] * 100, 2),
+            'high': round(df['high'].max(), 2),
+            'low': round(df['low'].min(), 2),
+            'total_volume': int(df['volume'].sum()),
+            'average_volume': int(df['volume'].mean()),
+            'last_updated': df.index[-1]
+        }
+        assert trends['ma_5'] == round(close.rolling(5).mean().iloc[-1], 2)
+        assert trends['ma_20'] == round(close.rolling(20).mean().iloc[-1], 2)
+        assert trends['volatility'] == round(close.std(), 2)
+        assert data_processor.calculate_trends(df) == trends
+
+    def test_summary_trend_label(self):
+        """Test that a falling series below both averages is a strong downward trend."""
+        df = make_frame(np.linspace(130, 100, 40))
+
+        _, trends = data_processor.calculate_summary(df)
+
+        assert trends['trend'] == "Strong Downward"
+
+    def test_empty_frame(self):
+        """Test that an empty frame yields empty results."""
+        assert data_processor.calculate_summary(pd.DataFrame()) == ({}, {})
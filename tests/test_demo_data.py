@@ -0,0 +1,68 @@
+import numpy as np
+from datetime import datetime
+from src.services import demo_data
+
+
+class TestDemoData:
+    """Test cases for the demo data generator."""
+
+    def test_market_timestamps_stay_in_market_hours(self):
+        """Test that timestamps skip weekends and stay within 9:30-16:00."""
+        # Monday 2024-01-08, just after the open
+        timestamps = demo_data.market_timestamps(5, 200, datetime(2024, 1, 8, 9, 47, 13))
+
+        minute_of_day = timestamps.hour * 60 + timestamps.minute
+        assert len(timestamps) == 200
+        assert timestamps.is_monotonic_increasing and timestamps.is_unique
+        assert (timestamps.dayofweek < 5).all()
+        assert minute_of_day.min() >= 9 * 60 + 30 and minute_of_day.max() <= 16 * 60
+        assert timestamps[-1] == datetime(2024, 1, 8, 9, 45)
+        assert timestamps[-4] == datetime(2024, 1, 8, 9, 30)
+        assert timestamps[-5] == datetime(2024, 1, 5, 16, 0)
+
+    def test_generate_shape_and_ohlc_consistency(self):
+        """Test the frame shape and that highs and lows bound opens and closes."""
+        df = demo_data.generate_demo_stock_data("IBM", "5min", days=3)
+
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert len(df) == 78 * 3
+        assert df.index.name == 'timestamp'
+        assert (df['high'] >= df[['open', 'close']].max(axis=1)).all()
+        assert (df['low'] <= df[['open', 'close']].min(axis=1)).all()
+        assert np.array_equal(df['open'].to_numpy()[1:], df['close'].to_numpy()[:-1])
+        assert (df['volume'] >= 1_000_000).all()
+
+    def test_generate_is_consistent_per_symbol(self):
+        """Test that the same symbol yields the same prices."""
+        first = demo_data.generate_demo_stock_data("AAPL", "15min", days=2)
+        second = demo_data.generate_demo_stock_data("AAPL", "15min", days=2)
+
+        assert np.array_equal(first['close'].to_numpy(), second['close'].to_numpy())
+
+    def test_pinned_anchor_is_deterministic(self):
+        """Test that a pinned anchor fixes timestamps and prices."""
+        anchor = datetime(2024, 1, 5, 16, 0)
+        demo_data.clear_cache()
+
+        first = demo_data.generate_demo_stock_data("IBM", "5min", days=2, anchor=anchor)
+        demo_data.clear_cache()
+        second = demo_data.generate_demo_stock_data("IBM", "5min", days=2, anchor=anchor)
+
+        assert first.index[-1] == anchor
+        assert first.equals(second)
+        assert demo_data.symbol_seed("IBM") == demo_data.symbol_seed("ibm") == 1244168183
+
+    def test_memoized_and_global_rng_untouched(self):
+        """Test that repeated calls reuse the memoized frame without reseeding NumPy."""
+        anchor = datetime(2024, 1, 5, 16, 0)
+        np.random.seed(123)
+        expected = np.random.random()
+        np.random.seed(123)
+
+        first = demo_data.generate_demo_stock_data("MSFT", "1min", days=1, anchor=anchor)
+        first['extra'] = 1.0
+        second = demo_data.generate_demo_stock_data("MSFT", "1min", days=1, anchor=anchor)
+
+        assert np.random.random() == expected
+        assert 'extra' not in second.columns
+        assert np.shares_memory(first['close'].to_numpy(), second['close'].to_numpy())
@@ -0,0 +1,114 @@
+import numpy as np
+from unittest.mock import patch
+from src.core import data_processor, frame_dtypes, resampler, session_index
+from src.services import api_service, demo_data, market_cache
+
+
+def make_frame(bars=390):
+    """Build a day of 1-min demo bars."""
+    return demo_data.generate_demo_stock_data('IBM', '1min', days=1, anchor='2024-01-05 16:00').iloc[-bars:]
+
+
+class TestFrameDtypes:
+    """Test cases for compact frame dtypes."""
+
+    def setup_method(self):
+        """Start each test with an empty cache."""
+        market_cache.clear()
+
+    def test_compact_converts_columns_and_keeps_index(self):
+        """Test that compact frames hold float32 prices and uint32 volume on the same index."""
+        df = make_frame()
+        session_index.attach(df)
+
+        compact = frame_dtypes.compact(df)
+
+        assert compact.dtypes.to_dict() == frame_dtypes.COMPACT_DTYPES
+        assert compact.index.equals(df.index)
+        assert compact.attrs[session_index.ATTRS_KEY] is df.attrs[session_index.ATTRS_KEY]
+        assert frame_dtypes.compact(compact) is compact
+        np.testing.assert_allclose(compact['close'], df['close'], rtol=1e-7)
+
+    def test_oversized_volume_stays_int64(self):
+        """Test that volumes beyond uint32 are kept instead of wrapping."""
+        df = make_frame(3).copy()
+        df['volume'] = [1, 2, 2 ** 33]
+
+        compact = frame_dtypes.compact(df)
+
+        assert compact['close'].dtype == np.float32
+        assert compact['volume'].dtype == np.int64
+        assert compact['volume'].iloc[-1] == 2 ** 33
+
+    def test_standard_round_trip(self):
+        """Test that standard restores float64 prices and int64 volume."""
+        df = make_frame()
+
+        restored = frame_dtypes.standard(frame_dtypes.compact(df))
+
+        assert restored.dtypes.to_dict() == frame_dtypes.STANDARD_DTYPES
+        np.testing.assert_array_equal(restored['volume'], df['volume'])
+
+    def test_memory_usage_reports_saving(self):
+        """Test that compact columns take half the bytes of standard ones."""
+        df = make_frame()
+
+        standard = frame_dtypes.memory_usage(df)
+        compact = frame_dtypes.memory_usage(frame_dtypes.compact(df))
+
+        assert compact['rows'] == standard['rows'] == len(df)
+        assert compact['column_bytes'] * 2 == standard['column_bytes']
+        assert compact['index_bytes'] == standard['index_bytes']
+        assert compact['compact'] and not standard['compact']
+        assert compact['bytes_per_bar'] < standard['bytes_per_bar']
+
+    def test_compact_mode_applies_to_cache_only(self, tmp_path):
+        """Test that COMPACT_FRAMES compacts cached frames while the bar store keeps float64 prices."""
+        df = make_frame()
+        df['close'] = df['close'] + 0.0001234
+
+        with patch('src.services.api_service.config.COMPACT_FRAMES', True), \
+                patch('src.services.api_service.config.BAR_STORE_ENABLED', True), \
+                patch('src.services.bar_store.config.BAR_STORE_DIR', str(tmp_path)), \
+                patch('src.services.api_service._fetch_frame', return_value=(df, False)):
+            cached, is_demo = api_service.get_intraday_frame('IBM', '1min')
+            stored = api_service._read_stored('IBM', '1min')
+
+        assert is_demo is False
+        assert frame_dtypes.is_compact(cached)
+        assert stored['close'].dtype == np.float64
+        np.testing.assert_array_equal(stored['close'], df['close'])
+
+    def test_summary_upcasts_compact_prices(self):
+        """Test that metrics from a compact frame match the float64 ones."""
+        df = make_frame()
+
+        metrics, trends = data_processor.calculate_summary(frame_dtypes.compact(df))
+        expected_metrics, expected_trends = data_processor.calculate_summary(df)
+
+        assert metrics['total_volume'] == expected_metrics['total_volume']
+        for key in ['current_price', 'high', 'low', 'price_change']:
+            assert abs(metrics[key] - expected_metrics[key]) <= 0.01
+        assert abs(trends['volatility'] - expected_trends['volatility']) <= 0.01
+
+    def test_resampling_compact_volume_does_not_overflow(self):
+        """Test that daily sums of uint32 volumes are taken in int64."""
+        df = frame_dtypes.compact(make_frame())
+        df['volume'] = np.full(len(df), 2 ** 31, dtype=np.uint32)
+
+        daily = resampler.resample_bars(df, 'daily')
+
+        assert daily['volume'].iloc[0] == len(df) * 2 ** 31
+        assert daily['close'].dtype == np.float32
+
+    def test_market_cache_memory_report(self):
+        """Test that the cache reports the bytes held by each frame."""
+        df = make_frame()
+        market_cache.put('IBM', '1min', df)
+        market_cache.put('MSFT', '1min', frame_dtypes.compact(df))
+
+        report = market_cache.memory_report()
+
+        assert [row['symbol'] for row in report] == ['IBM', 'MSFT']
+        assert report[1]['compact'] and not report[0]['compact']
+        assert sum(row['cached_bytes'] for row in report) == market_cache.get_stats()['total_bytes']
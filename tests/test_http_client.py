@@ -0,0 +1,111 @@
+import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch, Mock
+import requests
+from src.services import http_client
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 handler that keeps connections open."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpClient:
+    """Test cases for the pooled HTTP client."""
+
+    def setup_method(self):
+        """Start each test with a fresh session and counters."""
+        http_client.reset()
+
+    def teardown_method(self):
+        http_client.reset()
+
+    @patch('src.services.http_client.time.sleep')
+    @patch('src.services.http_client.get_session')
+    def test_retries_server_errors(self, mock_get_session, mock_sleep):
+        """Test that 5xx responses are retried until success."""
+        error_response = Mock(status_code=503)
+        ok_response = Mock(status_code=200)
+        mock_get_session.return_value.get.side_effect = [error_response, ok_response]
+
+        response = http_client.get("http://example.invalid/query")
+
+        assert response is ok_response
+        assert mock_sleep.call_count == 1
+        stats = http_client.get_stats()
+        assert stats['retries'] == 1
+        assert stats['attempts'] == 2
+
+    @patch('src.services.http_client.time.sleep')
+    @patch('src.services.http_client.get_session')
+    def test_raises_after_exhausting_timeouts(self, mock_get_session, mock_sleep):
+        """Test that transport errors propagate after the last retry."""
+        mock_get_session.return_value.get.side_effect = requests.exceptions.Timeout()
+
+        with patch('src.services.http_client.config.HTTP_MAX_RETRIES', 2):
+            with pytest.raises(requests.exceptions.Timeout):
+                http_client.get("http://example.invalid/query")
+
+        assert mock_get_session.return_value.get.call_count == 3
+        assert http_client.get_stats()['failures'] == 1
+
+    @patch('src.services.http_client.time.sleep')
+    @patch('src.services.http_client.get_session')
+    def test_on_failure_can_stop_retries(self, mock_get_session, mock_sleep):
+        """Test that retrying stops when the failure callback returns False."""
+        mock_get_session.return_value.get.return_value = Mock(status_code=503)
+        failures = []
+
+        def on_failure():
+            failures.append(1)
+            return len(failures) < 2
+
+        response = http_client.get("http://example.invalid/query", on_failure=on_failure)
+
+        assert response.status_code == 503
+        assert mock_get_session.return_value.get.call_count == 2
+        assert mock_sleep.call_count == 1
+
+    @patch('src.services.http_client.get_session')
+    def test_client_errors_are_not_retried(self, mock_get_session):
+        """Test that 4xx responses are returned without retrying."""
+        mock_get_session.return_value.get.return_value = Mock(status_code=429)
+
+        response = http_client.get("http://example.invalid/query")
+
+        assert response.status_code == 429
+        assert mock_get_session.return_value.get.call_count == 1
+
+    def test_backoff_delay_is_capped(self):
+        """Test that jittered backoff never exceeds the configured cap."""
+        for attempt in range(10):
+            assert 0 <= http_client.get_backoff_delay(attempt) <= http_client.config.HTTP_BACKOFF_MAX
+
+    def test_connections_are_reused(self):
+        """Test that sequential requests share one keep-alive connection."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/query"
+            for _ in range(5):
+                assert http_client.get(url).json() == {"ok": True}
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        stats = http_client.get_stats()
+        assert stats['connections_opened'] == 1
+        assert stats['connections_reused'] == 4
@@ -0,0 +1,91 @@
+import numpy as np
+from datetime import datetime
+from unittest.mock import patch
+from src.services import api_service, live_simulator, market_cache, providers
+
+
+ANCHOR = datetime(2024, 1, 5, 15, 50)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLiveSimulator:
+    """Test cases for the live bar simulator."""
+
+    def test_bars_arrive_as_time_passes(self):
+        """Test that each bar length of simulated time appends one bar."""
+        clock = FakeClock()
+        simulator = live_simulator.LiveSimulator(speed=60, history_days=1, anchor=ANCHOR, clock=clock)
+        start = simulator.get_frame("IBM", "5min")
+
+        clock.now = 5 * 5  # 25 real seconds at 60x = 25 simulated minutes
+        grown = simulator.get_frame("IBM", "5min")
+
+        assert len(grown) == len(start) + 5
+        assert grown.index[len(start) - 1] == ANCHOR
+        # The series continues across the close into Monday's session
+        assert list(grown.index[-5:].strftime('%a %H:%M')) == [
+            'Fri 15:55', 'Fri 16:00', 'Mon 09:30', 'Mon 09:35', 'Mon 09:40'
+        ]
+        assert np.array_equal(grown['open'].to_numpy()[1:], grown['close'].to_numpy()[:-1])
+
+    def test_series_are_deterministic(self):
+        """Test that two simulators with the same anchor emit the same bars."""
+        frames = []
+        for _ in range(2):
+            clock = FakeClock()
+            simulator = live_simulator.LiveSimulator(speed=60, history_days=1, anchor=ANCHOR, clock=clock)
+            simulator.get_frame("AAPL", "1min")
+            clock.now = 10
+            frames.append(simulator.get_frame("AAPL", "1min"))
+
+        assert frames[0].equals(frames[1])
+
+    @patch('src.services.api_service.config.BAR_STORE_ENABLED', False)
+    def test_expired_cache_sees_new_bars(self):
+        """Test that the service layer picks up simulated bars after a cache expiry."""
+        clock = FakeClock()
+        simulator = live_simulator.LiveSimulator(speed=60, history_days=1, anchor=ANCHOR, clock=clock)
+        providers.set_provider(providers.SimulatedProvider(simulator))
+        market_cache.clear()
+        try:
+            first, is_demo = api_service.get_intraday_frame("MSFT", "1min")
+            clock.now = 3
+            with patch('src.services.market_cache.time.time', return_value=2e10):
+                second, _ = api_service.get_intraday_frame("MSFT", "1min")
+        finally:
+            providers.set_provider(None)
+            market_cache.clear()
+
+        assert is_demo is False
+        assert len(second) == len(first) + 3
+
+    def test_expired_cache_is_merged_not_persisted(self, tmp_path):
+        """Test that simulated frames are topped up with merge_bars and kept out of the bar store."""
+        clock = FakeClock()
+        simulator = live_simulator.LiveSimulator(speed=60, history_days=1, anchor=ANCHOR, clock=clock)
+        providers.set_provider(providers.SimulatedProvider(simulator))
+        market_cache.clear()
+        try:
+            with patch('src.services.api_service.config.BAR_STORE_ENABLED', True), \
+                    patch('src.services.bar_store.config.BAR_STORE_DIR', str(tmp_path)), \
+                    patch('src.services.api_service.merge_bars', wraps=api_service.merge_bars) as merge:
+                first, _ = api_service.get_intraday_frame("MSFT", "1min")
+                clock.now = 3
+                with patch('src.services.market_cache.time.time', return_value=2e10):
+                    second, _ = api_service.get_intraday_frame("MSFT", "1min")
+        finally:
+            providers.set_provider(None)
+            market_cache.clear()
+
+        assert merge.call_count == 1
+        assert len(second) == len(first) + 3
+        assert not any(tmp_path.iterdir())
@@ -0,0 +1,114 @@
+import pytest
+import threading
+import time
+from unittest.mock import patch
+import pandas as pd
+from src.services import market_cache, api_service, single_flight
+
+
+def make_frame(rows=10):
+    """Build a small OHLCV frame."""
+    dates = pd.date_range('2023-01-02 09:30', periods=rows, freq='5min')
+    return pd.DataFrame({
+        'open': [100.0] * rows,
+        'high': [101.0] * rows,
+        'low': [99.0] * rows,
+        'close': [100.5] * rows,
+        'volume': [1000] * rows
+    }, index=dates)
+
+
+class TestMarketCache:
+    """Test cases for the shared market data cache."""
+
+    def setup_method(self):
+        """Start each test with an empty cache."""
+        market_cache.clear()
+
+    def test_miss_then_hit(self):
+        """Test hit/miss counters around a put."""
+        assert market_cache.get("IBM", "5min") is None
+        market_cache.put("IBM", "5min", make_frame(), False)
+
+        df, is_demo = market_cache.get("IBM", "5min")
+        assert len(df) == 10
+        assert is_demo is False
+
+        stats = market_cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['entries'] == 1
+
+    def test_expired_entry_is_a_miss(self):
+        """Test that entries expire after one bar interval."""
+        market_cache.put("IBM", "1min", make_frame(), False)
+
+        with patch('src.services.market_cache.time.time', return_value=2e10):
+            assert market_cache.get("IBM", "1min") is None
+        assert market_cache.get_stats()['expirations'] == 1
+
+    def test_lru_eviction_respects_memory_bound(self):
+        """Test that the least recently used frame is evicted first."""
+        frame_size = market_cache._frame_size(make_frame())
+
+        with patch('src.services.market_cache.config.MARKET_CACHE_MAX_BYTES', frame_size * 2):
+            market_cache.put("IBM", "5min", make_frame(), False)
+            market_cache.put("AAPL", "5min", make_frame(), False)
+            market_cache.get("IBM", "5min")
+            market_cache.put("MSFT", "5min", make_frame(), False)
+
+        assert market_cache.get("AAPL", "5min") is None
+        assert market_cache.get("IBM", "5min") is not None
+        assert market_cache.get_stats()['evictions'] == 1
+
+    def test_sessions_share_arrays_without_mutating_cache(self):
+        """Test that views share data but added columns stay local."""
+        market_cache.put("IBM", "5min", make_frame(), False)
+        first, _ = market_cache.get("IBM", "5min")
+        second, _ = market_cache.get("IBM", "5min")
+
+        first['ma_5'] = first['close'].rolling(window=5).mean()
+
+        assert 'ma_5' not in second.columns
+        assert list(market_cache._entries[("IBM", "5min")]['frame'].columns) == [
+            'open', 'high', 'low', 'close', 'volume'
+        ]
+
+    @patch('src.services.api_service.fetch_intraday_data')
+    def test_get_intraday_frame_fetches_once(self, mock_fetch):
+        """Test that repeated lookups reuse the cached frame."""
+        mock_fetch.return_value = (None, True)
+
+        df1, is_demo = api_service.get_intraday_frame("IBM", "5min")
+        df2, _ = api_service.get_intraday_frame("IBM", "5min")
+
+        assert mock_fetch.call_count == 1
+        assert is_demo is True
+        assert len(df1) == len(df2)
+
+    @patch('src.services.api_service.fetch_intraday_data')
+    def test_concurrent_misses_share_one_fetch(self, mock_fetch):
+        """Test that parallel callers for one key trigger a single fetch."""
+        release = threading.Event()
+
+        def slow_fetch(symbol, interval, api_key, priority, **kwargs):
+            release.wait(timeout=5)
+            return None, True
+
+        mock_fetch.side_effect = slow_fetch
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(api_service.get_intraday_frame("IBM", "5min")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        while single_flight.in_flight_count() == 0:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert mock_fetch.call_count == 1
+        assert len(results) == 8
+        assert all(not df.empty and is_demo for df, is_demo in results)
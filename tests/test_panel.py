@@ -0,0 +1,213 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.core import data_processor, technical_indicators
+from src.core.panel import Panel, ewm_mean, rolling_mean, rolling_std
+
+
+def make_frame(bars, seed, start='2024-01-02 09:30'):
+    """Build a random-walk OHLCV frame of 1-min bars."""
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 0.5, bars).cumsum()
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.1, bars),
+        'high': close + 0.5,
+        'low': close - 0.5,
+        'close': close,
+        'volume': rng.integers(1000, 5000, bars)
+    }, index=pd.date_range(start, periods=bars, freq='1min', name='timestamp'))
+
+
+@pytest.fixture
+def frames():
+    """Three symbols; MSFT starts later and GOOG ends earlier than IBM."""
+    return {
+        'IBM': make_frame(300, 1),
+        'MSFT': make_frame(240, 2, start='2024-01-02 10:30'),
+        'GOOG': make_frame(250, 3),
+    }
+
+
+@pytest.fixture
+def gapped_frames(frames):
+    """The same symbols with bars missing that the others have."""
+    return {
+        'IBM': frames['IBM'].drop(frames['IBM'].index[[150, 297]]),
+        'MSFT': frames['MSFT'],
+        'GOOG': frames['GOOG'].drop(frames['GOOG'].index[240:245]),
+    }
+
+
+class TestPanel:
+    """Test cases for the panel structure."""
+
+    def test_from_frames_aligns_on_shared_axis(self, frames):
+        """Test that symbols share one sorted axis with NaN where they have no bar."""
+        panel = Panel.from_frames({**frames, 'NONE': None})
+
+        assert panel.symbols == ['IBM', 'MSFT', 'GOOG']
+        assert len(panel.index) == 300
+        assert panel.field('close').shape == (300, 3)
+        assert np.isnan(panel.field('close')[:60, 1]).all()
+        assert list(panel.bar_counts()) == [300, 240, 250]
+        assert list(panel.first_rows()) == [0, 60, 0]
+        assert list(panel.last_rows()) == [299, 299, 249]
+
+    def test_to_frame_round_trips(self, frames):
+        """Test that a symbol's frame can be rebuilt from the panel."""
+        panel = Panel.from_frames(frames)
+
+        rebuilt = panel.to_frame('MSFT')
+
+        pd.testing.assert_frame_equal(rebuilt, frames['MSFT'].astype(float), check_freq=False)
+
+    def test_add_extends_axis_and_capacity(self, frames):
+        """Test that adding a symbol with new timestamps grows the axis and columns."""
+        panel = Panel(capacity=1)
+        panel.add('IBM', frames['IBM'])
+        later = make_frame(30, 4, start='2024-01-02 15:00')
+
+        panel.add('AAPL', later)
+
+        assert panel.capacity == 2
+        assert len(panel.index) == 330
+        pd.testing.assert_frame_equal(panel.to_frame('IBM'), frames['IBM'].astype(float), check_freq=False)
+        pd.testing.assert_frame_equal(panel.to_frame('AAPL'), later.astype(float), check_freq=False)
+
+    def test_add_existing_symbol_replaces_bars(self, frames):
+        """Test that re-adding a symbol overwrites its column in place."""
+        panel = Panel.from_frames(frames)
+
+        panel.add('IBM', frames['IBM'].iloc[:10])
+
+        assert panel.symbols == ['IBM', 'MSFT', 'GOOG']
+        assert panel.bar_counts()[0] == 10
+
+    def test_remove_moves_last_symbol(self, frames):
+        """Test that removing a symbol keeps the other symbols' bars."""
+        panel = Panel.from_frames(frames)
+
+        panel.remove('IBM')
+
+        assert panel.symbols == ['GOOG', 'MSFT']
+        assert 'IBM' not in panel
+        assert panel.position('GOOG') == 0
+        pd.testing.assert_frame_equal(panel.to_frame('GOOG'), frames['GOOG'].astype(float), check_freq=False)
+        assert np.isnan(panel._data['close'][:, 2]).all()
+
+    def test_remove_unknown_symbol_raises(self, frames):
+        """Test that removing a missing symbol raises KeyError."""
+        panel = Panel.from_frames(frames)
+
+        with pytest.raises(KeyError):
+            panel.remove('AAPL')
+
+
+class TestPanelKernels:
+    """Test cases for the 2-D rolling and EWM helpers."""
+
+    def setup_method(self):
+        """Set up columns with leading and interior gaps."""
+        rng = np.random.default_rng(0)
+        self.values = 100 + rng.normal(0, 1, (500, 3)).cumsum(axis=0)
+        self.values[:40, 1] = np.nan
+        self.values[200:205, 2] = np.nan
+
+    def test_rolling_matches_pandas(self):
+        """Test that rolling mean and std equal pandas rolling on each column."""
+        expected = pd.DataFrame(self.values).rolling(20)
+
+        np.testing.assert_allclose(rolling_mean(self.values, 20), expected.mean().to_numpy(), rtol=1e-9)
+        np.testing.assert_allclose(rolling_std(self.values, 20), expected.std().to_numpy(), rtol=1e-9)
+
+    def test_ewm_matches_pandas(self):
+        """Test that the blocked EWM equals pandas ewm with gaps skipped."""
+        expected = pd.DataFrame(self.values).ewm(span=26, adjust=False, ignore_na=True).mean().to_numpy()
+
+        np.testing.assert_allclose(ewm_mean(self.values, 26), expected, rtol=1e-9)
+
+
+class TestPanelIndicators:
+    """Test cases for the panel variants of the indicator and summary functions."""
+
+    def test_indicators_match_single_symbol(self, frames):
+        """Test that one panel call gives each symbol's calculate_all_indicators values."""
+        panel = Panel.from_frames(frames)
+
+        table = technical_indicators.calculate_all_indicators_panel(panel)
+
+        for symbol, df in frames.items():
+            expected = technical_indicators.calculate_all_indicators(df, round(df['close'].iloc[-1], 2))
+            row = table.loc[symbol]
+            for key in ['rsi', 'macd', 'macd_signal', 'macd_histogram', 'bb_upper', 'bb_middle',
+                        'bb_lower', 'ma_5', 'ma_20', 'ma_50', 'ma_200']:
+                assert row[key] == pytest.approx(expected[key], abs=1e-9), (symbol, key)
+            assert row['rsi_signal'] == expected['rsi_signal']
+            assert row['overall_signal'] == expected['overall_signal']
+            assert row['signal_confidence'] == expected['signal_confidence']
+
+    def test_rsi_series_match_single_symbol(self, frames):
+        """Test that each symbol's RSI column equals calculate_rsi on its own rows."""
+        panel = Panel.from_frames(frames)
+
+        rsi = technical_indicators.calculate_rsi_panel(panel)
+
+        expected = technical_indicators.calculate_rsi(frames['MSFT']).to_numpy()
+        np.testing.assert_allclose(rsi[60:, 1], expected)
+        assert np.isnan(rsi[:60, 1]).all()
+
+    def test_summary_matches_single_symbol(self, frames):
+        """Test that calculate_summary_panel gives each symbol's calculate_summary values."""
+        panel = Panel.from_frames(frames)
+
+        table = data_processor.calculate_summary_panel(panel)
+
+        for symbol, df in frames.items():
+            metrics, trends = data_processor.calculate_summary(df)
+            row = table.loc[symbol]
+            for key, value in {**metrics, **trends}.items():
+                if isinstance(value, str) or key == 'last_updated':
+                    assert row[key] == value, (symbol, key)
+                else:
+                    assert row[key] == pytest.approx(value, abs=1e-9), (symbol, key)
+
+    def test_misaligned_symbols_match_single_symbol(self, gapped_frames):
+        """Test that rows added by other symbols do not break a symbol's windows."""
+        panel = Panel.from_frames(gapped_frames)
+
+        summary = data_processor.calculate_summary_panel(panel)
+        indicators = technical_indicators.calculate_all_indicators_panel(panel)
+
+        for symbol, df in gapped_frames.items():
+            metrics, trends = data_processor.calculate_summary(df)
+            for key, value in {**metrics, **trends}.items():
+                if isinstance(value, str) or key == 'last_updated':
+                    assert summary.loc[symbol, key] == value, (symbol, key)
+                else:
+                    assert summary.loc[symbol, key] == pytest.approx(value, abs=1e-9), (symbol, key)
+
+            expected = technical_indicators.calculate_all_indicators(df, round(df['close'].iloc[-1], 2))
+            for key in ['rsi', 'macd', 'macd_signal', 'bb_upper', 'bb_lower', 'ma_5', 'ma_20', 'ma_50',
+                        'ma_200', 'overall_signal', 'signal_confidence']:
+                assert indicators.loc[symbol, key] == pytest.approx(expected[key], abs=1e-9), (symbol, key)
+
+    def test_misaligned_series_match_single_symbol(self, gapped_frames):
+        """Test that panel series equal the single-symbol series on the symbol's own rows."""
+        panel = Panel.from_frames(gapped_frames)
+        df = gapped_frames['IBM']
+        rows = panel.index.get_indexer(df.index)
+
+        rsi = technical_indicators.calculate_rsi_panel(panel)
+        bb = technical_indicators.calculate_bollinger_bands_panel(panel)
+
+        np.testing.assert_allclose(rsi[rows, 0], technical_indicators.calculate_rsi(df).to_numpy())
+        np.testing.assert_allclose(bb['upper_series'][rows, 0],
+                                   technical_indicators.calculate_bollinger_bands(df)['upper_series'].to_numpy())
+        assert np.isnan(rsi[297, 0])
+
+    def test_empty_panel(self):
+        """Test that an empty panel gives empty tables."""
+        panel = Panel()
+
+        assert data_processor.calculate_summary_panel(panel).empty
+        assert technical_indicators.calculate_all_indicators_panel(panel).empty
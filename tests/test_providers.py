@@ -0,0 +1,115 @@
+import gzip
+import json
+import pytest
+from unittest.mock import patch
+from src.services import api_service, market_cache, providers
+
+
+SAMPLE_RESPONSE = {
+    "Meta Data": {"2. Symbol": "IBM"},
+    "Time Series (5min)": {
+        "2023-01-03 09:35:00": {"1. open": "1", "2. high": "2", "3. low": "0.5", "4. close": "1.5", "5. volume": "100"},
+        "2023-01-03 09:30:00": {"1. open": "1", "2. high": "2", "3. low": "0.5", "4. close": "1.5", "5. volume": "100"}
+    }
+}
+
+
+class StaticProvider(providers.MarketDataProvider):
+    """Provider returning a fixed response."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def fetch_intraday(self, symbol, interval, api_key=None, priority=0, outputsize="full", month=None):
+        self.calls += 1
+        return SAMPLE_RESPONSE, False
+
+
+@pytest.fixture(autouse=True)
+def isolated_provider():
+    """Restore the configured provider and an empty cache after each test."""
+    market_cache.clear()
+    yield
+    providers.set_provider(None)
+    market_cache.clear()
+
+
+class TestProviders:
+    """Test cases for market data providers."""
+
+    def test_base_provider_is_abstract(self):
+        """Test that a provider must implement fetch_intraday."""
+        with pytest.raises(TypeError):
+            providers.MarketDataProvider()
+
+    def test_create_provider_by_name(self):
+        """Test that configuration names map to provider classes."""
+        assert isinstance(providers.create_provider("alpha_vantage"), providers.AlphaVantageProvider)
+        assert isinstance(providers.create_provider("demo"), providers.DemoProvider)
+        assert providers.create_provider("record").record is True
+        assert providers.create_provider("replay").record is False
+        with pytest.raises(ValueError):
+            providers.create_provider("bloomberg")
+
+    def test_record_then_replay(self, tmp_path):
+        """Test that recorded responses are compressed and served back offline."""
+        upstream = StaticProvider()
+        recorder = providers.RecordReplayProvider(str(tmp_path), record=True, upstream=upstream)
+
+        response, is_demo = recorder.fetch_intraday("IBM", "5min")
+
+        path = recorder.recording_path("IBM", "5min")
+        assert response == SAMPLE_RESPONSE and is_demo is False
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            assert json.load(f) == SAMPLE_RESPONSE
+
+        replayer = providers.RecordReplayProvider(str(tmp_path))
+        replayed, is_demo = replayer.fetch_intraday("IBM", "5min")
+        assert replayed == SAMPLE_RESPONSE and is_demo is False
+        assert upstream.calls == 1
+
+    def test_replayed_frames_are_not_persisted(self, tmp_path):
+        """Test that replayed responses never reach the live bar store."""
+        recordings, store = tmp_path / "recordings", tmp_path / "bars"
+        recorder = providers.RecordReplayProvider(str(recordings), record=True, upstream=StaticProvider())
+        recorder.fetch_intraday("IBM", "5min")
+        providers.set_provider(providers.RecordReplayProvider(str(recordings)))
+
+        with patch('src.services.api_service.config.BAR_STORE_ENABLED', True), \
+                patch('src.services.bar_store.config.BAR_STORE_DIR', str(store)):
+            df, is_demo = api_service.get_intraday_frame("IBM", "5min")
+
+        assert is_demo is False and len(df) == 2
+        assert not store.exists()
+
+    def test_replay_without_recording_falls_back_to_demo(self, tmp_path):
+        """Test that a missing recording is reported as demo data."""
+        replayer = providers.RecordReplayProvider(str(tmp_path))
+
+        response, is_demo = replayer.fetch_intraday("IBM", "5min", outputsize="compact")
+
+        assert response is None and is_demo is True
+
+    @patch('src.services.api_service.config.BAR_STORE_ENABLED', False)
+    def test_get_intraday_frame_uses_active_provider(self):
+        """Test that the service layer loads frames through the active provider."""
+        provider = StaticProvider()
+        providers.set_provider(provider)
+
+        df, is_demo = api_service.get_intraday_frame("IBM", "5min")
+
+        assert is_demo is False
+        assert len(df) == 2
+        assert provider.calls == 1
+
+    @patch('src.services.api_service.config.BAR_STORE_ENABLED', False)
+    def test_demo_provider_never_calls_the_api(self):
+        """Test that the demo provider serves simulated frames offline."""
+        providers.set_provider(providers.DemoProvider())
+
+        with patch('src.services.api_service.http_client.get') as mock_get:
+            df, is_demo = api_service.get_intraday_frame("IBM", "5min")
+
+        assert is_demo is True
+        assert not df.empty
+        mock_get.assert_not_called()
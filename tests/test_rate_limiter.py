@@ -0,0 +1,82 @@
+import pytest
+import threading
+import time
+from unittest.mock import patch, Mock
+from src.services import api_service, circuit_breaker, rate_limiter
+
+
+class TestRateLimiter:
+    """Test cases for the token bucket rate limiter."""
+
+    def setup_method(self):
+        rate_limiter.reset()
+        circuit_breaker.reset()
+
+    def teardown_method(self):
+        rate_limiter.reset()
+
+    def test_burst_then_timeout(self):
+        """Test that the bucket grants its burst and then times out."""
+        with patch('src.services.rate_limiter.config.ALPHA_VANTAGE_REQUESTS_PER_MINUTE', 0.001):
+            granted = [rate_limiter.acquire(timeout=0) for _ in range(rate_limiter.config.RATE_LIMIT_BURST)]
+            assert all(granted)
+            assert rate_limiter.acquire(timeout=0) is False
+        assert rate_limiter.get_stats()['timed_out'] == 1
+
+    def test_background_leaves_reserve_for_interactive(self):
+        """Test that background callers never take the reserved tokens."""
+        with patch('src.services.rate_limiter.config.ALPHA_VANTAGE_REQUESTS_PER_MINUTE', 0.001):
+            background = 0
+            while rate_limiter.acquire(rate_limiter.PRIORITY_BACKGROUND):
+                background += 1
+            assert background == rate_limiter.config.RATE_LIMIT_BURST - rate_limiter.config.RATE_LIMIT_BACKGROUND_RESERVE
+            assert rate_limiter.acquire(rate_limiter.PRIORITY_INTERACTIVE, timeout=0) is True
+
+    def test_interactive_served_before_queued_background(self):
+        """Test that an interactive waiter jumps ahead of background waiters."""
+        order = []
+        with patch('src.services.rate_limiter.config.RATE_LIMIT_BACKGROUND_RESERVE', 0):
+            rate_limiter.drain()
+
+            def take(priority, name):
+                if rate_limiter.acquire(priority, timeout=5):
+                    order.append(name)
+
+            background = threading.Thread(target=take, args=(rate_limiter.PRIORITY_BACKGROUND, 'background'))
+            background.start()
+            while rate_limiter.get_stats()['waiting'] < 1:
+                time.sleep(0.001)
+            interactive = threading.Thread(target=take, args=(rate_limiter.PRIORITY_INTERACTIVE, 'interactive'))
+            interactive.start()
+            while rate_limiter.get_stats()['waiting'] < 2:
+                time.sleep(0.001)
+
+            # Refill quickly so both complete
+            with patch('src.services.rate_limiter.config.ALPHA_VANTAGE_REQUESTS_PER_MINUTE', 600):
+                with rate_limiter._cond:
+                    rate_limiter._cond.notify_all()
+                background.join()
+                interactive.join()
+
+        assert order == ['interactive', 'background']
+
+    @patch('src.services.api_service.http_client.get')
+    def test_background_fetch_is_deferred(self, mock_get):
+        """Test that a background fetch without a token raises instead of calling the API."""
+        rate_limiter.drain()
+
+        with pytest.raises(rate_limiter.RequestDeferred):
+            api_service.fetch_intraday_data("IBM", "5min", priority=rate_limiter.PRIORITY_BACKGROUND)
+        mock_get.assert_not_called()
+
+    @patch('src.services.api_service.http_client.get')
+    def test_quota_note_drains_bucket(self, mock_get):
+        """Test that a 'Note' response empties the bucket."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"Note": "Thank you for using Alpha Vantage!"}
+        mock_get.return_value = mock_response
+
+        result, is_demo = api_service.fetch_intraday_data("IBM", "5min")
+
+        assert result is None and is_demo is True
+        assert rate_limiter.get_stats()['tokens'] < 1
@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from unittest.mock import patch
+from src.core import resampler
+from src.services import api_service, demo_data, market_cache, providers
+
+
+ANCHOR = datetime(2024, 1, 5, 16, 0)
+
+
+def pandas_resample(df, rule):
+    """Reference aggregation with pandas."""
+    return df.resample(rule, closed='right', label='right').agg({
+        'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
+    }).dropna()
+
+
+class TestResampler:
+    """Test cases for the resampling engine."""
+
+    def setup_method(self):
+        """Use one day-spanning 1-min series for every test."""
+        self.one_minute = demo_data.generate_demo_stock_data("IBM", "1min", days=3, anchor=ANCHOR)
+
+    def test_parse_interval(self):
+        """Test interval names in minutes."""
+        assert resampler.parse_interval("15min") == 15
+        assert resampler.parse_interval("2h") == 120
+        assert resampler.parse_interval("daily") == resampler.parse_interval("1d") == 1440
+        for bad in ("7min", "3d", "fortnight", "0min"):
+            with pytest.raises(ValueError):
+                resampler.parse_interval(bad)
+
+    @pytest.mark.parametrize("interval, rule", [("5min", "5min"), ("60min", "60min"), ("2h", "2h")])
+    def test_matches_pandas_resample(self, interval, rule):
+        """Test intraday buckets against pandas' right-closed resample."""
+        result = resampler.resample_bars(self.one_minute, interval)
+        expected = pandas_resample(self.one_minute, rule).astype({'volume': np.int64})
+
+        pd.testing.assert_frame_equal(result, expected, check_freq=False, check_index_type=False)
+
+    def test_daily_bars_are_labelled_by_date(self):
+        """Test that daily bars cover one session each."""
+        daily = resampler.resample_bars(self.one_minute, "daily")
+
+        assert len(daily) == 3
+        assert daily.index[-1] == pd.Timestamp("2024-01-05")
+        assert daily['volume'].iloc[-1] == self.one_minute.loc["2024-01-05", 'volume'].sum()
+
+    def test_incremental_updates_match_full_resample(self):
+        """Test that feeding bars in pieces equals one full aggregation."""
+        series = resampler.Resampler("15min")
+        for end in [*range(50, len(self.one_minute), 133), len(self.one_minute)]:
+            # Each update repeats earlier bars, as a refreshed cached frame would
+            series.update(self.one_minute.iloc[:end])
+
+        pd.testing.assert_frame_equal(series.frame, resampler.resample_bars(self.one_minute, "15min"))
+
+    def test_revised_source_bar_is_folded_again(self):
+        """Test that a revision of an already folded 1-min bar updates its coarse bar."""
+        series = resampler.Resampler("5min")
+        series.update(self.one_minute.iloc[:-20])
+
+        revised = self.one_minute.copy()
+        revised.iloc[-21, revised.columns.get_loc('close')] += 40.0
+        revised.iloc[-21, revised.columns.get_loc('volume')] += 8000
+        series.update(revised.iloc[:-10])
+        series.update(revised)
+
+        pd.testing.assert_frame_equal(series.frame, resampler.resample_bars(revised, "5min"))
+
+    @patch('src.services.api_service.config.BAR_STORE_ENABLED', False)
+    @patch('src.services.api_service.config.LOCAL_RESAMPLING', True)
+    def test_service_derives_intervals_from_one_minute(self):
+        """Test that coarser intervals reuse the 1-min fetch."""
+        calls = []
+
+        class RecordingProvider(providers.DemoProvider):
+            def fetch_intraday_frame(self, symbol, interval, *args, **kwargs):
+                calls.append(interval)
+                return demo_data.generate_demo_stock_data(symbol, interval, anchor=ANCHOR), False
+
+        providers.set_provider(RecordingProvider())
+        market_cache.clear()
+        try:
+            five, _ = api_service.get_intraday_frame("IBM", "5min")
+            hourly, _ = api_service.get_intraday_frame("IBM", "60min")
+        finally:
+            providers.set_provider(None)
+            market_cache.clear()
+
+        assert calls == ["1min"]
+        assert five.index[-1] == hourly.index[-1] == pd.Timestamp(ANCHOR)
+        assert five['volume'].sum() == hourly['volume'].sum()
+
+    @patch('src.services.api_service.config.BAR_STORE_ENABLED', False)
+    @patch('src.services.api_service.config.LOCAL_RESAMPLING', True)
+    def test_resamplers_follow_the_market_cache(self):
+        """Test that resamplers are dropped with the 1-min frame they fold."""
+        providers.set_provider(providers.DemoProvider())
+        market_cache.clear()
+        try:
+            api_service.get_intraday_frame("IBM", "5min")
+            assert ("IBM", "5min") in [key[:2] for key in api_service._resamplers]
+
+            market_cache.invalidate("IBM", "1min")
+            assert not api_service._resamplers
+
+            api_service.get_intraday_frame("IBM", "15min")
+            market_cache.clear()
+            assert not api_service._resamplers
+        finally:
+            providers.set_provider(None)
+            market_cache.clear()
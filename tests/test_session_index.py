@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+from src.core import data_processor, session_index
+from src.services import market_cache
+
+
+def make_frame():
+    """Build 1-min bars covering pre-market, regular hours and after hours of one day."""
+    index = pd.date_range('2024-01-02 08:00', '2024-01-02 17:00', freq='1min', name='timestamp')
+    return pd.DataFrame({
+        'open': 100.0, 'high': 101.0, 'low': 99.0, 'close': 100.5,
+        'volume': np.arange(len(index), dtype=np.int64) + 1
+    }, index=index)
+
+
+class TestSessionIndex:
+    """Test cases for the precomputed session index."""
+
+    def test_session_labels(self):
+        """Test the session boundaries at the open, noon and close."""
+        df = make_frame()
+        labels = session_index.get_session_index(df)
+
+        def session_at(time):
+            return labels.session[df.index.get_loc(pd.Timestamp(f'2024-01-02 {time}'))]
+
+        assert session_at('09:29') == session_index.PRE_MARKET
+        assert session_at('09:30') == session_index.MORNING
+        assert session_at('11:59') == session_index.MORNING
+        assert session_at('12:00') == session_index.AFTERNOON
+        assert session_at('16:00') == session_index.AFTERNOON
+        assert session_at('16:01') == session_index.AFTER_HOURS
+
+    def test_grouped_sums_match_masks(self):
+        """Test session and hourly sums against boolean-mask sums."""
+        df = make_frame()
+        minutes = df.index.hour * 60 + df.index.minute
+
+        totals = session_index.session_totals(df)
+        hourly = session_index.hourly_totals(df)
+
+        assert totals[session_index.MORNING] == df['volume'][(minutes >= 570) & (minutes < 720)].sum()
+        assert totals.sum() == df['volume'].sum()
+        assert hourly[9] == df['volume'][df.index.hour == 9].sum()
+        assert totals.dtype == np.int64
+
+    def test_labels_follow_shared_views_and_slices(self):
+        """Test that cached frames carry their labels and slices reuse them by position."""
+        market_cache.clear()
+        stored = market_cache.put("IBM", "1min", make_frame(), False)
+        view, _ = market_cache.get("IBM", "1min")
+
+        labels = stored.attrs[session_index.ATTRS_KEY]
+        assert session_index.get_session_index(view) is labels
+        window = view.iloc[60:150]
+        sliced = session_index.get_session_index(window)
+        assert np.shares_memory(sliced.session, labels.session)
+        np.testing.assert_array_equal(sliced.session, session_index.SessionIndex(window.index).session)
+        assert window.attrs[session_index.ATTRS_KEY] is labels
+        market_cache.clear()
+
+    def test_filtered_frames_rebuild_labels(self):
+        """Test that a frame that is not a contiguous slice gets its own labels."""
+        df = make_frame()
+        labels = session_index.attach(df)
+
+        every_other = df.iloc[::2]
+
+        rebuilt = session_index.get_session_index(every_other)
+        assert not np.shares_memory(rebuilt.session, labels.session)
+        assert len(rebuilt.session) == len(every_other)
+
+    def test_pie_chart_data(self):
+        """Test the pie chart split uses each bar exactly once."""
+        df = make_frame()
+
+        pie = data_processor.prepare_chart_data(df, 'pie')
+
+        morning, afternoon, extended = pie['values']
+        assert morning + afternoon + extended == df['volume'].sum()
+        assert afternoon == df.between_time('12:00', '16:00')['volume'].sum()
@@ -0,0 +1,64 @@
+import pytest
+import threading
+import time
+from src.services import single_flight
+
+
+class TestSingleFlight:
+    """Test cases for single-flight request coalescing."""
+
+    def setup_method(self):
+        single_flight.reset_stats()
+
+    def test_sequential_calls_each_run(self):
+        """Test that calls after completion are not coalesced."""
+        assert single_flight.do("key", lambda: 1) == (1, False)
+        assert single_flight.do("key", lambda: 2) == (2, False)
+        assert single_flight.get_stats()['calls'] == 2
+
+    def test_concurrent_callers_share_result(self):
+        """Test that waiters receive the leader's result."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "frame"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(single_flight.do("IBM", work)))
+        leader.start()
+        started.wait(timeout=5)
+
+        followers = [
+            threading.Thread(target=lambda: results.append(single_flight.do("IBM", work)))
+            for _ in range(4)
+        ]
+        for thread in followers:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while single_flight.get_stats()['coalesced'] < 4:
+            if time.monotonic() > deadline:
+                release.set()
+                pytest.fail("Followers did not join the in-flight call")
+            time.sleep(0.001)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+        assert all(result == "frame" for result, _ in results)
+        assert single_flight.in_flight_count() == 0
+
+    def test_errors_propagate_and_clear_key(self):
+        """Test that a failing call raises and frees the key."""
+        def fail():
+            raise ValueError("upstream down")
+
+        with pytest.raises(ValueError):
+            single_flight.do("IBM", fail)
+        assert single_flight.in_flight_count() == 0
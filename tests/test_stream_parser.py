@@ -0,0 +1,95 @@
+import pytest
+import json
+import pandas as pd
+from unittest.mock import MagicMock, patch
+from src.services import api_service, stream_parser
+
+
+def make_response(rows=50):
+    """Build an Alpha Vantage style response, newest bar first."""
+    dates = pd.date_range('2023-01-02 09:30', periods=rows, freq='5min')[::-1]
+    return {
+        "Meta Data": {"1. Information": "Intraday (5min) data", "2. Symbol": "IBM"},
+        "Time Series (5min)": {
+            date.strftime('%Y-%m-%d %H:%M:%S'): {
+                "1. open": f"{100 + i * 0.25:.4f}",
+                "2. high": f"{101 + i * 0.25:.4f}",
+                "3. low": f"{99 + i * 0.25:.4f}",
+                "4. close": f"{100.5 + i * 0.25:.4f}",
+                "5. volume": str(1000 + i)
+            }
+            for i, date in enumerate(dates)
+        }
+    }
+
+
+def chunked(body: bytes, size: int):
+    """Split a body into fixed-size chunks."""
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestStreamParser:
+    """Test cases for streaming time series ingestion."""
+
+    @pytest.mark.parametrize("indent,chunk_size", [(4, 7), (None, 64), (2, 4096)])
+    def test_matches_parse_time_series(self, indent, chunk_size):
+        """Test that streamed frames equal the dict-based parse for any chunking."""
+        response = make_response()
+        body = json.dumps(response, indent=indent).encode()
+
+        df, header = stream_parser.parse_stream(chunked(body, chunk_size), size_hint=len(body))
+
+        pd.testing.assert_frame_equal(df, api_service.parse_time_series(response), check_index_type=False)
+        assert header["Meta Data"]["2. Symbol"] == "IBM"
+
+    def test_buffers_grow_past_size_hint(self):
+        """Test that an underestimated size hint still parses every bar."""
+        response = make_response(rows=3000)
+        body = json.dumps(response).encode()
+
+        df, _ = stream_parser.parse_stream(chunked(body, 1000), size_hint=10)
+
+        assert len(df) == 3000
+        assert df.index.is_monotonic_increasing
+
+    def test_error_payload_returns_header(self):
+        """Test that bodies without a time series surface their top-level keys."""
+        body = json.dumps({"Note": "Thank you for using Alpha Vantage!"}).encode()
+
+        df, header = stream_parser.parse_stream(chunked(body, 5))
+
+        assert df.empty
+        assert "Note" in header
+
+    def test_truncated_body_raises(self):
+        """Test that a body cut off inside the time series is rejected."""
+        body = json.dumps(make_response()).encode()
+
+        with pytest.raises(ValueError):
+            stream_parser.parse_stream(chunked(body[:len(body) // 2], 64))
+
+    def test_unexpected_bar_fields_raise(self):
+        """Test that a bar with extra fields is rejected rather than dropped."""
+        response = make_response(rows=3)
+        first = next(iter(response["Time Series (5min)"].values()))
+        first["6. x"] = "1"
+        body = json.dumps(response, indent=4).encode()
+
+        with pytest.raises(ValueError):
+            stream_parser.parse_stream(chunked(body, 16))
+
+    def test_fetch_falls_back_to_json_request(self):
+        """Test that an unparseable stream is retried as a regular JSON request."""
+        response = make_response()
+        body = json.dumps(response).encode()
+        streamed = MagicMock(headers={}, status_code=200)
+        streamed.iter_content.return_value = chunked(body[:len(body) // 2], 64)
+        full = MagicMock(status_code=200)
+        full.json.return_value = response
+
+        with patch('src.services.api_service.http_client.get', side_effect=[streamed, full]) as get:
+            df, is_demo = api_service.fetch_intraday_frame('IBM', '5min', api_key='key')
+
+        assert is_demo is False
+        assert get.call_count == 2
+        pd.testing.assert_frame_equal(df, api_service.parse_time_series(response))
@@ -0,0 +1,76 @@
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from src.services import api_service, circuit_breaker, http_client, market_cache, rate_limiter, stub_server
+
+
+@pytest.fixture
+def server():
+    """Run a stand-in server for the duration of a test."""
+    server = stub_server.start_server(full_days=2)
+    http_client.reset()
+    rate_limiter.reset()
+    circuit_breaker.reset()
+    market_cache.clear()
+    with patch('src.services.api_service.config.ALPHA_VANTAGE_BASE_URL', server.base_url):
+        yield server
+    server.shutdown()
+    server.server_close()
+    http_client.reset()
+
+
+class TestStubServer:
+    """Test cases for the local Alpha Vantage stand-in."""
+
+    def test_full_and_compact_payloads(self, server):
+        """Test that full and compact responses parse like real ones."""
+        full, is_demo = api_service.fetch_intraday_data("IBM", "5min")
+        compact, _ = api_service.fetch_intraday_data("IBM", "5min", outputsize="compact")
+
+        assert is_demo is False
+        full_df = api_service.parse_time_series(full)
+        compact_df = api_service.parse_time_series(compact)
+        assert len(full_df) > len(compact_df) == 100
+        assert server.request_count == 2
+
+    def test_invalid_symbol_returns_error_message(self, server):
+        """Test that invalid symbols fall back to demo data."""
+        result, is_demo = api_service.fetch_intraday_data("INVALID", "5min")
+        assert result is None and is_demo is True
+
+    def test_note_payload(self, server):
+        """Test that the rate limit note is recognized."""
+        server.settings['note_every'] = 1
+
+        result, is_demo = api_service.fetch_intraday_data("IBM", "5min")
+
+        assert result is None and is_demo is True
+        assert rate_limiter.get_stats()['drained'] == 1
+
+    def test_http_429(self, server):
+        """Test that HTTP 429 is handled as a rate limit."""
+        server.settings['http_429_every'] = 1
+
+        result, is_demo = api_service.fetch_intraday_data("IBM", "5min")
+
+        assert result is None and is_demo is True
+        assert rate_limiter.get_stats()['drained'] == 1
+
+    @patch('src.services.http_client.time.sleep')
+    def test_http_500_is_retried(self, mock_sleep, server):
+        """Test that a transient 500 is retried on the pooled connection."""
+        server.settings['http_500_every'] = 2
+
+        api_service.fetch_intraday_data("IBM", "5min", outputsize="compact")
+        result, is_demo = api_service.fetch_intraday_data("IBM", "5min", outputsize="compact")
+
+        assert is_demo is False and result is not None
+        assert http_client.get_stats()['retries'] == 1
+
+    def test_csv_matches_json(self, server):
+        """Test that the CSV wire format parses into the same frame as JSON."""
+        response, _ = api_service.fetch_intraday_data("IBM", "5min")
+        csv_df, is_demo = api_service.fetch_intraday_csv("IBM", "5min")
+
+        assert is_demo is False
+        pd.testing.assert_frame_equal(csv_df, api_service.parse_time_series(response))
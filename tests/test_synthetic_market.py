@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from src.services import bar_store, synthetic_market
+
+
+END = datetime(2024, 1, 5, 16, 0)
+
+
+class TestSyntheticMarket:
+    """Test cases for the large-universe synthetic generator."""
+
+    def test_chunks_continue_the_walk(self):
+        """Test that chunked output concatenates into continuous series."""
+        universe = synthetic_market.make_universe(20, seed=1)
+
+        chunks = list(synthetic_market.generate_chunks(universe, "5min", days=3, end=END, chunk_days=1))
+
+        assert len(chunks) == 3
+        for (_, first), (_, second) in zip(chunks, chunks[1:]):
+            assert np.allclose(second['open'][0], first['close'][-1], atol=0.01)
+        timestamps = pd.DatetimeIndex(np.concatenate([index.values for index, _ in chunks]))
+        assert timestamps.is_monotonic_increasing and timestamps[-1] == END
+        assert chunks[0][1]['close'].shape == (78, 20)
+
+    def test_sector_moves_are_correlated(self):
+        """Test that symbols in a sector move together more than across sectors."""
+        universe = synthetic_market.make_universe(40, n_sectors=2, seed=2)
+        closes = np.concatenate([
+            columns['close'] for _, columns in
+            synthetic_market.generate_chunks(universe, "5min", days=20, end=END, chunk_days=5)
+        ])
+        correlation = np.corrcoef(np.diff(np.log(closes), axis=0).T)
+        same = universe.sectors[:, None] == universe.sectors[None, :]
+        off_diagonal = ~np.eye(len(universe), dtype=bool)
+
+        assert correlation[same & off_diagonal].mean() > correlation[~same].mean() + 0.1
+
+    def test_write_to_store_matches_demo_shape(self, tmp_path):
+        """Test that frames written to disk read back in the demo OHLCV shape."""
+        universe = synthetic_market.make_universe(3, seed=3)
+
+        summary = synthetic_market.write_to_store(universe, "15min", days=2, end=END, root=str(tmp_path))
+
+        assert summary['bars'] == 3 * 26 * 2
+        df = bar_store.read(universe.symbols[0], "15min", root=str(tmp_path))
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert len(df) == 52
+        assert (df['high'] >= df[['open', 'close']].max(axis=1)).all()
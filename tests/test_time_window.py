@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from src.core import technical_indicators, time_window
+from src.services import api_service, demo_data
+
+
+def make_frame():
+    """Build five sessions of 5-min demo bars."""
+    return demo_data.generate_demo_stock_data('IBM', '5min', days=5, anchor='2024-01-05 16:00')
+
+
+class TestTimeWindow:
+    """Test cases for time window queries."""
+
+    def test_parse_duration(self):
+        """Test window names in minutes, hours and days."""
+        assert time_window.parse_duration('30min') == pd.Timedelta(minutes=30)
+        assert time_window.parse_duration('4h') == pd.Timedelta(hours=4)
+        assert time_window.parse_duration('5d') == pd.Timedelta(days=5)
+        assert time_window.parse_duration('all') is None
+        assert time_window.parse_duration(None) is None
+        with pytest.raises(ValueError):
+            time_window.parse_duration('0h')
+        with pytest.raises(ValueError):
+            time_window.parse_duration('weekly')
+
+    def test_window_is_inclusive_view(self):
+        """Test that a date range selects its bars without copying them."""
+        df = make_frame()
+
+        view = time_window.window(df, '2024-01-04 09:30', '2024-01-04 16:00')
+
+        expected = df[(df.index >= '2024-01-04 09:30') & (df.index <= '2024-01-04 16:00')]
+        pd.testing.assert_frame_equal(view, expected)
+        assert view.index[0] == pd.Timestamp('2024-01-04 09:30')
+        assert view.index[-1] == pd.Timestamp('2024-01-04 16:00')
+        assert np.shares_memory(view['close'].to_numpy(), df['close'].to_numpy())
+
+    def test_window_open_ends_and_empty_range(self):
+        """Test that missing bounds extend to the frame edges."""
+        df = make_frame()
+
+        assert len(time_window.window(df)) == len(df)
+        assert time_window.window(df, end='2024-01-04 09:30').index[-1] == pd.Timestamp('2024-01-04 09:30')
+        assert time_window.window(df, '2024-01-06').empty
+        assert time_window.window(df, '2024-01-05', '2024-01-04').empty
+
+    def test_last_counts_back_from_latest_bar(self):
+        """Test that the last hour of 5-min bars is twelve bars."""
+        df = make_frame()
+
+        view = time_window.last(df, '1h')
+
+        assert len(view) == 12
+        assert view.index[-1] == df.index[-1]
+        assert time_window.last(df, 'all') is df
+
+    def test_with_warmup_prepends_bars(self):
+        """Test that warm-up bars are added before the window, up to the frame start."""
+        df = make_frame()
+
+        history, offset = time_window.with_warmup(df, '1h', warmup_bars=50)
+
+        assert offset == 50
+        assert len(history) == 62
+        assert history.index[offset] == df.index[-12]
+
+        history, offset = time_window.with_warmup(df, '5d', warmup_bars=50)
+        assert offset == 0 and len(history) == len(df)
+
+    def test_warmup_settles_indicators(self):
+        """Test that indicators on the warm-up view match the full-history values in the window."""
+        df = make_frame()
+        history, offset = time_window.with_warmup(df, '4h')
+
+        bb = time_window.trim(technical_indicators.calculate_bollinger_bands(history), offset)
+        full = technical_indicators.calculate_bollinger_bands(df)
+
+        assert len(bb['middle_series']) == 48
+        pd.testing.assert_series_equal(bb['middle_series'], full['middle_series'].iloc[-48:])
+        assert time_window.trim(full, 0) is full
+
+    def test_get_intraday_window(self):
+        """Test that the API layer returns views of the cached frame."""
+        df = make_frame()
+
+        with patch('src.services.api_service.get_intraday_frame', return_value=(df, True)):
+            last_hour, is_demo = api_service.get_intraday_window('IBM', '5min', last='1h')
+            day, _ = api_service.get_intraday_window('IBM', '5min', start='2024-01-04', end='2024-01-04 23:59')
+
+        assert is_demo is True
+        assert len(last_hour) == 12
+        assert day.index.normalize().unique().tolist() == [pd.Timestamp('2024-01-04')]